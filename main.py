@@ -220,6 +220,11 @@ def main():
         if icon_path.exists():
             app.setWindowIcon(QIcon(str(icon_path)))
 
+        # Cargar el tema compartido (se analiza una sola vez para toda la aplicación)
+        theme_path = Path(__file__).parent / "resources" / "theme.qss"
+        if theme_path.exists():
+            app.setStyleSheet(theme_path.read_text(encoding="utf-8"))
+
         # Configurar atributos de la aplicación
         app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
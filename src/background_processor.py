@@ -100,15 +100,7 @@ class BackgroundProcessor:
             Número de documentos sin procesar
         """
         try:
-            query = {
-                "$or": [
-                    {"objetos": {"$exists": False}},
-                    {"objetos": {"$size": 0}},
-                    {"objeto_procesado": False}
-                ]
-            }
-
-            return self.db_manager.collection.count_documents(query)
+            return self.db_manager.contar_pendientes_objetos()
 
         except Exception as e:
             self.logger.error(f"Error al obtener documentos pendientes: {e}")
@@ -0,0 +1,291 @@
+"""
+Módulo para leer y escribir archivos de backup en formato NDJSON.
+
+La primera línea del archivo contiene un objeto {"metadata": {...}} y cada
+línea siguiente un registro (un vector de Qdrant o un documento de MongoDB),
+de modo que los backups se escriben y se leen sin cargar la colección
+completa en memoria. La última línea, {"resumen": {...}}, guarda el número
+real de registros escritos y se añade solo si el backup terminó bien. Los
+backups antiguos, guardados como un único objeto JSON, se siguen pudiendo
+leer.
+
+Si la ruta termina en ".zst" el archivo se comprime con zstandard; al leer,
+la compresión se detecta por la firma del archivo.
+"""
+import io
+import json
+import hashlib
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+# orjson es opcional: serializa bastante más rápido que json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# zstandard es opcional: necesario solo para backups comprimidos (.zst)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Firma de los archivos comprimidos con zstandard
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+logger = logging.getLogger(__name__)
+
+
+def _valor_serializable(valor: Any) -> Any:
+    """Convertir los tipos que JSON no admite igual con orjson y con json.
+
+    Las fechas se escriben siempre en ISO 8601 y los arrays de numpy como
+    listas, de modo que el mismo registro produce los mismos bytes tenga o
+    no orjson instalado.
+    """
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    if hasattr(valor, "tolist"):
+        return valor.tolist()
+    return str(valor)
+
+
+def serializar_registro(registro: Dict[str, Any]) -> bytes:
+    """Serializar un registro como una línea NDJSON."""
+    if ORJSON_AVAILABLE:
+        # PASSTHROUGH_DATETIME hace que las fechas pasen por _valor_serializable
+        opciones = orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(registro, default=_valor_serializable, option=opciones) + b"\n"
+    return json.dumps(
+        registro, ensure_ascii=False, separators=(",", ":"), default=_valor_serializable
+    ).encode("utf-8") + b"\n"
+
+
+def deserializar_registro(linea: bytes) -> Any:
+    """Deserializar una línea NDJSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(linea)
+    return json.loads(linea)
+
+
+def _requerir_zstd():
+    """Comprobar que zstandard está instalado."""
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("Se requiere el paquete 'zstandard' para backups comprimidos (.zst)")
+
+
+def abrir_lectura(ruta_backup: str):
+    """Abrir un backup en modo binario, descomprimiéndolo si es necesario."""
+    with open(ruta_backup, "rb") as f:
+        firma = f.read(len(_ZSTD_MAGIC))
+
+    if firma != _ZSTD_MAGIC:
+        return open(ruta_backup, "rb")
+
+    _requerir_zstd()
+    lector = zstandard.ZstdDecompressor().stream_reader(open(ruta_backup, "rb"))
+    return io.BufferedReader(lector)
+
+
+class _ArchivoConHash:
+    """Archivo binario que acumula el hash SHA256 de lo que se escribe en disco."""
+
+    def __init__(self, ruta: str):
+        self._archivo = open(ruta, "wb")
+        self.sha256 = hashlib.sha256()
+
+    def write(self, datos) -> int:
+        self.sha256.update(datos)
+        return self._archivo.write(datos)
+
+    def flush(self):
+        self._archivo.flush()
+
+    def close(self):
+        self._archivo.close()
+
+
+class BackupWriter:
+    """Escritor de backups NDJSON que calcula el hash SHA256 mientras escribe."""
+
+    def __init__(self, ruta_backup: str, metadata: Dict[str, Any]):
+        """
+        Abrir el archivo de backup y escribir la línea de metadata.
+
+        Args:
+            ruta_backup: Ruta donde guardar el archivo de backup
+            metadata: Metadata del backup
+        """
+        self.ruta_backup = ruta_backup
+        self.total_registros = 0
+        self._cerrado = False
+        comprimido = ruta_backup.endswith(".zst")
+        if comprimido:
+            _requerir_zstd()
+
+        self._destino = _ArchivoConHash(ruta_backup)
+        if comprimido:
+            compresor = zstandard.ZstdCompressor(level=3, threads=-1)
+            self._archivo = compresor.stream_writer(self._destino)
+        else:
+            self._archivo = self._destino
+        self._escribir_linea(serializar_registro({"metadata": metadata}))
+
+    def _escribir_linea(self, linea: bytes):
+        """Escribir una línea en el archivo."""
+        self._archivo.write(linea)
+
+    def escribir(self, registro: Dict[str, Any]):
+        """Añadir un registro al backup."""
+        self._escribir_linea(serializar_registro(registro))
+        self.total_registros += 1
+
+    def hash_sha256(self) -> str:
+        """Hash SHA256 del archivo escrito (completo una vez cerrado)."""
+        return self._destino.sha256.hexdigest()
+
+    def cerrar(self, resumen: Optional[Dict[str, Any]] = None):
+        """
+        Cerrar el archivo de backup.
+
+        Args:
+            resumen: Datos adicionales para la línea de resumen final. Si es
+                     None el archivo se cierra sin resumen (backup incompleto).
+        """
+        if self._cerrado:
+            return
+        self._cerrado = True
+        try:
+            if resumen is not None:
+                datos = {"total_registros": self.total_registros}
+                datos.update(resumen)
+                self._escribir_linea(serializar_registro({"resumen": datos}))
+        finally:
+            self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Solo un backup terminado sin errores lleva la línea de resumen
+        self.cerrar(None if exc_type else {})
+
+
+class RegistrosBackup:
+    """
+    Iterador sobre los registros de un backup.
+
+    Tras recorrerlo por completo, `resumen` contiene la línea de resumen del
+    backup, o None si el archivo no la tiene (formato antiguo o backup
+    interrumpido). `formato_antiguo` indica si el backup es un único objeto
+    JSON.
+    """
+
+    def __init__(self, registros: Iterable[Dict[str, Any]], formato_antiguo: bool = False):
+        self._registros = registros
+        self.formato_antiguo = formato_antiguo
+        self.resumen: Optional[Dict[str, Any]] = None
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for registro in self._registros:
+            if isinstance(registro, dict) and set(registro) == {"resumen"}:
+                self.resumen = registro["resumen"]
+                continue
+            yield registro
+
+
+def leer_backup(ruta_backup: str, clave_registros: str) -> Tuple[Dict[str, Any], RegistrosBackup]:
+    """
+    Leer un archivo de backup.
+
+    Args:
+        ruta_backup: Ruta del archivo de backup
+        clave_registros: Clave de la lista de registros en el formato antiguo
+                         ("vectors" o "documents")
+
+    Returns:
+        Tupla (metadata, registros). Los registros mantienen el archivo
+        abierto hasta consumirse por completo; después exponen el resumen
+        final en `registros.resumen`.
+
+    Raises:
+        ValueError: Si el archivo no tiene un formato de backup válido
+    """
+    with abrir_lectura(ruta_backup) as f:
+        primera_linea = f.readline()
+
+    try:
+        cabecera = deserializar_registro(primera_linea)
+    except ValueError:
+        cabecera = None
+
+    if isinstance(cabecera, dict) and set(cabecera) == {"metadata"}:
+        return cabecera["metadata"], RegistrosBackup(_iterar_registros(ruta_backup))
+
+    # Formato antiguo: un único objeto JSON con metadata y lista de registros
+    logger.info(f"Leyendo backup en formato JSON antiguo: {ruta_backup}")
+    with abrir_lectura(ruta_backup) as f:
+        backup_data = json.load(io.TextIOWrapper(f, encoding="utf-8"))
+
+    if not isinstance(backup_data, dict) or "metadata" not in backup_data or clave_registros not in backup_data:
+        raise ValueError("Formato de backup inválido")
+
+    return backup_data["metadata"], RegistrosBackup(backup_data[clave_registros], formato_antiguo=True)
+
+
+def verificar_total_registros(metadata: Dict[str, Any], registros: RegistrosBackup,
+                              total_leidos: int, clave_total: str) -> Optional[str]:
+    """
+    Comprobar que el número de registros leídos es el que se escribió.
+
+    En los backups NDJSON la referencia es la línea de resumen final, porque
+    el total de la metadata se toma antes de recorrer la colección y es solo
+    orientativo. Los backups en formato JSON antiguo no tienen resumen y su
+    metadata sí guarda el total exacto.
+
+    Args:
+        metadata: Metadata del backup
+        registros: Registros ya recorridos por completo
+        total_leidos: Número de registros leídos
+        clave_total: Clave del total en la metadata de los backups antiguos
+
+    Returns:
+        Mensaje de error, o None si el total es correcto
+    """
+    if registros.resumen is not None:
+        esperado = registros.resumen.get("total_registros")
+        if total_leidos != esperado:
+            return f"Inconsistencia: el resumen indica {esperado} registros pero archivo contiene {total_leidos}"
+        return None
+
+    if registros.formato_antiguo:
+        if total_leidos != metadata.get(clave_total):
+            return f"Inconsistencia: metadata indica {metadata.get(clave_total)} registros pero archivo contiene {total_leidos}"
+        return None
+
+    return "Backup incompleto: falta la línea de resumen final"
+
+
+def _iterar_registros(ruta_backup: str) -> Iterator[Dict[str, Any]]:
+    """Recorrer los registros de un backup NDJSON, saltando la metadata."""
+    with abrir_lectura(ruta_backup) as f:
+        f.readline()
+        for numero, linea in enumerate(f, start=2):
+            if not linea.strip():
+                continue
+            try:
+                yield deserializar_registro(linea)
+            except ValueError as e:
+                raise ValueError(f"Línea {numero} inválida: {e}") from e
+
+
+def calcular_hash_archivo(ruta_backup: str) -> str:
+    """Calcular el hash SHA256 de un archivo."""
+    sha256_hash = hashlib.sha256()
+    with open(ruta_backup, "rb") as f:
+        for byte_block in iter(lambda: f.read(1024 * 1024), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
@@ -66,7 +66,7 @@ class BatchProcessor:
             logger.info("Iniciando procesamiento completo de la colección...")
 
             # Obtener documentos sin procesar (que no están en Qdrant)
-            documentos_sin_procesar = self._obtener_documentos_sin_embedding(max_documentos)
+            documentos_sin_procesar = self.obtener_documentos_sin_embedding(max_documentos)
 
             total_documentos = len(documentos_sin_procesar)
             logger.info(f"Encontrados {total_documentos} documentos sin embedding")
@@ -114,28 +114,9 @@ class BatchProcessor:
                             "mensaje": f"Procesamiento cancelado: {documentos_exitosos} exitosos, {documentos_errores} errores"
                         }
 
-                    try:
-                        logger.debug(f"Procesando documento: {documento.nombre}")
-
-                        # Procesar documento
-                        logger.debug(f"Iniciando procesamiento de: {documento.nombre}")
-                        documento_procesado = self.buscador.procesar_documento(documento, cancel_callback)
+                    if self.procesar_documento(documento, cancel_callback):
                         documentos_exitosos += 1
-                        logger.debug(f"✓ Procesado: {documento.nombre}")
-
-                        # Marcar como insertado en Qdrant
-                        if documento_procesado:
-                            try:
-                                self.db_manager.collection.update_one(
-                                    {"_id": documento.id},
-                                    {"$set": {"qdrant": True}}
-                                )
-                                logger.debug(f"✓ Marcado como insertado en Qdrant: {documento.nombre}")
-                            except Exception as e:
-                                logger.warning(f"Error al marcar qdrant para documento {documento.id}: {e}")
-
-                    except Exception as e:
-                        logger.error(f"✗ Error procesando {documento.nombre}: {str(e)}")
+                    else:
                         documentos_errores += 1
 
                 documentos_procesados += len(batch)
@@ -157,7 +138,39 @@ class BatchProcessor:
             logger.error(f"Error en procesamiento por lotes: {e}")
             raise
 
-    def _obtener_documentos_sin_embedding(self, limite: Optional[int] = None) -> List[ImagenDocumento]:
+    def procesar_documento(self, documento: ImagenDocumento, cancel_callback=None) -> bool:
+        """
+        Procesar un documento y marcarlo como insertado en Qdrant.
+
+        Args:
+            documento: Documento a procesar
+            cancel_callback: Callback para verificar si se debe cancelar
+
+        Returns:
+            True si el documento se procesó sin errores
+        """
+        try:
+            logger.debug(f"Procesando documento: {documento.nombre}")
+            documento_procesado = self.buscador.procesar_documento(documento, cancel_callback)
+            logger.debug(f"✓ Procesado: {documento.nombre}")
+        except Exception as e:
+            logger.error(f"✗ Error procesando {documento.nombre}: {str(e)}")
+            return False
+
+        # Marcar como insertado en Qdrant
+        if documento_procesado:
+            try:
+                self.db_manager.collection.update_one(
+                    {"_id": documento.id},
+                    {"$set": {"qdrant": True}}
+                )
+                logger.debug(f"✓ Marcado como insertado en Qdrant: {documento.nombre}")
+            except Exception as e:
+                logger.warning(f"Error al marcar qdrant para documento {documento.id}: {e}")
+
+        return True
+
+    def obtener_documentos_sin_embedding(self, limite: Optional[int] = None) -> List[ImagenDocumento]:
         """
         Obtener documentos que no tienen embedding.
 
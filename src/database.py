@@ -4,19 +4,19 @@ Módulo para manejar la conexión y operaciones con MongoDB.
 import os
 import sys
 import logging
-import json
-import hashlib
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pymongo import MongoClient
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import OperationFailure
 from dotenv import load_dotenv
 
 # Añadir el directorio raíz al path para permitir importaciones absolutas
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.models import ImagenDocumento, ConsultaBusqueda, ResultadoBusqueda
+from src.backup_io import BackupWriter, leer_backup, calcular_hash_archivo, verificar_total_registros
 
 # Cargar variables de entorno
 load_dotenv()
@@ -25,6 +25,18 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Documentos a los que todavía no se ha aplicado la detección de objetos
+FILTRO_PENDIENTES_OBJETOS = {
+    "$or": [
+        {"objetos": {"$exists": False}},
+        {"objetos": {"$size": 0}},
+        {"objeto_procesado": False}
+    ]
+}
+
+# Identificador del contador persistente de documentos pendientes de detección
+_CONTADOR_PENDIENTES_OBJETOS = "pendientes_objetos"
+
 
 class DatabaseManager:
     """Gestor de conexión y operaciones con MongoDB."""
@@ -55,6 +67,8 @@ class DatabaseManager:
 
             # Inicializar índices de texto
             self._ensure_text_indexes()
+            self._ensure_qdrant_index()
+            self._ensure_duplicados_indexes()
 
         except Exception as e:
             logger.error(f"Error al conectar a MongoDB: {e}")
@@ -92,6 +106,36 @@ class DatabaseManager:
             logger.warning(f"No se pudo crear el índice de texto: {e}")
             logger.info("Las búsquedas usarán expresiones regulares como alternativa")
 
+    def _ensure_qdrant_index(self):
+        """Asegurar el índice parcial sobre los documentos ya subidos a Qdrant."""
+        try:
+            self.collection.create_index(
+                [('qdrant', 1)],
+                name='qdrant_1',
+                partialFilterExpression={'qdrant': True}
+            )
+        except Exception as e:
+            logger.warning(f"No se pudo crear el índice de Qdrant: {e}")
+
+    def _ensure_duplicados_indexes(self):
+        """Asegurar los índices usados para detectar imágenes ya procesadas (hash y ruta)."""
+        try:
+            self.collection.create_index([('hash_sha512', 1)], name='hash_sha512_1', unique=True)
+        except OperationFailure as e:
+            # La colección ya contiene hashes repetidos: usar un índice no único
+            logger.warning(f"No se pudo crear el índice único de hash_sha512, se crea sin unicidad: {e}")
+            try:
+                self.collection.create_index([('hash_sha512', 1)], name='hash_sha512_1')
+            except Exception as e:
+                logger.warning(f"No se pudo crear el índice de hash_sha512: {e}")
+        except Exception as e:
+            logger.warning(f"No se pudo crear el índice de hash_sha512: {e}")
+
+        try:
+            self.collection.create_index([('ruta', 1)], name='ruta_1')
+        except Exception as e:
+            logger.warning(f"No se pudo crear el índice de ruta: {e}")
+
     def verificar_ruta_existente(self, ruta_imagen: str) -> bool:
         """
         Verificar si una ruta de imagen ya existe en la colección.
@@ -134,6 +178,8 @@ class DatabaseManager:
             data = documento.to_dict()
             result = self.collection.insert_one(data)
             logger.info(f"Documento insertado con ID: {result.inserted_id}")
+            if self.es_pendiente_objetos(data):
+                self.ajustar_pendientes_objetos(1)
             return str(result.inserted_id)
         except Exception as e:
             logger.error(f"Error al insertar documento: {e}")
@@ -421,12 +467,91 @@ class DatabaseManager:
             logger.error(f"Error al obtener estadísticas: {e}")
             raise
 
-    def crear_backup_coleccion(self, ruta_backup: str) -> Dict[str, Any]:
+    @staticmethod
+    def es_pendiente_objetos(documento: Dict[str, Any]) -> bool:
+        """Indicar si un documento cumple FILTRO_PENDIENTES_OBJETOS."""
+        return not documento.get("objetos") or documento.get("objeto_procesado") is False
+
+    def contar_pendientes_objetos(self) -> int:
+        """
+        Obtener el número de documentos pendientes de detección de objetos.
+
+        Se lee del contador persistente de la colección "contadores"; si aún
+        no existe se calcula con una consulta completa y se guarda.
+
+        Returns:
+            Número de documentos pendientes
+        """
+        contador = self.database["contadores"].find_one({"_id": _CONTADOR_PENDIENTES_OBJETOS})
+        if contador is None:
+            return self.recalcular_pendientes_objetos()
+        return max(0, contador["n"])
+
+    def recalcular_pendientes_objetos(self) -> int:
+        """
+        Recalcular el contador de pendientes recorriendo la colección.
+
+        Returns:
+            Número de documentos pendientes
+        """
+        total = self.collection.count_documents(FILTRO_PENDIENTES_OBJETOS)
+        self.database["contadores"].update_one(
+            {"_id": _CONTADOR_PENDIENTES_OBJETOS},
+            {"$set": {"n": total}},
+            upsert=True
+        )
+        return total
+
+    def ajustar_pendientes_objetos(self, delta: int):
+        """
+        Sumar `delta` al contador de pendientes.
+
+        Si el contador no existe no se crea: se calculará en la próxima lectura.
+
+        Args:
+            delta: Variación del número de documentos pendientes
+        """
+        if not delta:
+            return
+        try:
+            self.database["contadores"].update_one(
+                {"_id": _CONTADOR_PENDIENTES_OBJETOS},
+                {"$inc": {"n": delta}}
+            )
+        except Exception as e:
+            logger.warning(f"No se pudo actualizar el contador de pendientes: {e}")
+
+    def invalidar_pendientes_objetos(self):
+        """Descartar el contador de pendientes para recalcularlo en la próxima lectura."""
+        try:
+            self.database["contadores"].delete_one({"_id": _CONTADOR_PENDIENTES_OBJETOS})
+        except Exception as e:
+            logger.warning(f"No se pudo invalidar el contador de pendientes: {e}")
+
+    def contar_documentos_en_qdrant(self) -> int:
+        """
+        Contar los documentos marcados como subidos a Qdrant.
+
+        Returns:
+            Número de documentos con qdrant=True
+        """
+        filtro = {"qdrant": True}
+        try:
+            # El índice parcial qdrant_1 permite contar sin recorrer la colección
+            return self.collection.count_documents(filtro, hint='qdrant_1')
+        except OperationFailure:
+            return self.collection.count_documents(filtro)
+
+    def crear_backup_coleccion(self, ruta_backup: str, progress_callback=None) -> Dict[str, Any]:
         """
         Crear una copia de seguridad de toda la colección MongoDB.
 
+        El backup se escribe en formato NDJSON: una línea de metadata seguida
+        de un documento por línea, sin acumular la colección en memoria.
+
         Args:
             ruta_backup: Ruta donde guardar el archivo de backup
+            progress_callback: Función opcional llamada con (procesados, total) tras cada lote
 
         Returns:
             Diccionario con información del backup creado
@@ -437,60 +562,50 @@ class DatabaseManager:
             # Obtener información de la colección
             total_documentos = self.collection.count_documents({})
 
-            # Crear estructura del backup
-            backup_data = {
-                "metadata": {
-                    "collection_name": self.collection.name,
+            metadata = {
+                "collection_name": self.collection.name,
+                "database_name": self.database.name,
+                "backup_date": datetime.now().isoformat(),
+                "total_documents": total_documentos,
+                "mongodb_version": "2.0",  # Versión del formato de backup (NDJSON)
+                "connection_info": {
+                    "mongodb_uri": os.getenv('MONGODB_URI', 'mongodb://localhost:27017/'),
                     "database_name": self.database.name,
-                    "backup_date": datetime.now().isoformat(),
-                    "total_documents": total_documentos,
-                    "mongodb_version": "1.0",  # Versión del formato de backup
-                    "connection_info": {
-                        "mongodb_uri": os.getenv('MONGODB_URI', 'mongodb://localhost:27017/'),
-                        "database_name": self.database.name,
-                        "collection_name": self.collection.name
-                    }
-                },
-                "documents": []
+                    "collection_name": self.collection.name
+                }
             }
 
             # Obtener todos los documentos de la colección
             logger.info(f"Obteniendo {total_documentos} documentos de la colección...")
 
-            # Procesar documentos en lotes para manejar grandes cantidades de datos
+            # Escribir los documentos según llegan del cursor
             batch_size = 1000
-            processed_count = 0
 
-            for documento in self.collection.find({}):
-                # Convertir ObjectId a string para serialización JSON
-                if '_id' in documento:
-                    documento['_id'] = str(documento['_id'])
+            with BackupWriter(ruta_backup, metadata) as writer:
+                for documento in self.collection.find({}).batch_size(batch_size):
+                    # Convertir ObjectId a string para serialización JSON
+                    if '_id' in documento:
+                        documento['_id'] = str(documento['_id'])
 
-                backup_data["documents"].append(documento)
-                processed_count += 1
+                    writer.escribir(documento)
 
-                # Log de progreso cada 1000 documentos
-                if processed_count % batch_size == 0:
-                    logger.info(f"Procesados {processed_count}/{total_documentos} documentos")
+                    # Log de progreso cada 1000 documentos
+                    if writer.total_registros % batch_size == 0:
+                        logger.info(f"Procesados {writer.total_registros}/{total_documentos} documentos")
+                        if progress_callback:
+                            progress_callback(writer.total_registros, total_documentos)
 
-            logger.info(f"Total de documentos obtenidos: {len(backup_data['documents'])}")
+            if progress_callback:
+                progress_callback(writer.total_registros, total_documentos)
 
-            # Guardar backup en archivo JSON
-            with open(ruta_backup, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False, default=str)
-
-            # Calcular hash del archivo para verificación
-            sha256_hash = hashlib.sha256()
-            with open(ruta_backup, 'rb') as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
+            logger.info(f"Total de documentos obtenidos: {writer.total_registros}")
 
             backup_info = {
                 "ruta_archivo": ruta_backup,
-                "total_documentos": len(backup_data["documents"]),
+                "total_documentos": writer.total_registros,
                 "tamano_archivo": os.path.getsize(ruta_backup),
-                "hash_sha256": sha256_hash.hexdigest(),
-                "fecha_backup": backup_data["metadata"]["backup_date"],
+                "hash_sha256": writer.hash_sha256(),
+                "fecha_backup": metadata["backup_date"],
                 "database_name": self.database.name,
                 "collection_name": self.collection.name
             }
@@ -502,13 +617,15 @@ class DatabaseManager:
             logger.error(f"Error al crear backup: {e}")
             raise
 
-    def restaurar_coleccion(self, ruta_backup: str, eliminar_existente: bool = True) -> Dict[str, Any]:
+    def restaurar_coleccion(self, ruta_backup: str, eliminar_existente: bool = True,
+                            progress_callback=None) -> Dict[str, Any]:
         """
         Restaurar la colección desde un archivo de backup.
 
         Args:
             ruta_backup: Ruta del archivo de backup
             eliminar_existente: Si es True, elimina la colección existente antes de restaurar
+            progress_callback: Función opcional llamada con (procesados, total) tras cada lote
 
         Returns:
             Diccionario con información de la restauración
@@ -520,19 +637,19 @@ class DatabaseManager:
             if not os.path.exists(ruta_backup):
                 raise FileNotFoundError(f"Archivo de backup no encontrado: {ruta_backup}")
 
-            # Leer archivo de backup
-            with open(ruta_backup, 'r', encoding='utf-8') as f:
-                backup_data = json.load(f)
-
-            # Validar estructura del backup
-            if "metadata" not in backup_data or "documents" not in backup_data:
-                raise ValueError("Formato de backup inválido")
+            # Leer el archivo completo una vez antes de tocar la colección: un backup
+            # truncado o sin resumen no debe borrar los datos existentes
+            metadata, documents_data = leer_backup(ruta_backup, "documents")
+            total_leidos = sum(1 for _ in documents_data)
+            error_total = verificar_total_registros(metadata, documents_data, total_leidos, "total_documents")
+            if error_total:
+                raise ValueError(f"Backup no válido, no se restaura: {error_total}")
 
-            metadata = backup_data["metadata"]
-            documents_data = backup_data["documents"]
+            # Segunda pasada en streaming para insertar
+            metadata, documents_data = leer_backup(ruta_backup, "documents")
 
             logger.info(f"Backup metadata: {metadata}")
-            logger.info(f"Total de documentos a restaurar: {len(documents_data)}")
+            logger.info(f"Total de documentos a restaurar: {total_leidos}")
 
             # Si se solicita eliminar la colección existente
             if eliminar_existente:
@@ -543,37 +660,49 @@ class DatabaseManager:
                 self.collection = self.database[collection_name]
                 logger.info("Colección eliminada y recreada")
 
-            # Preparar documentos para inserción
-            documents_to_insert = []
+            from bson import ObjectId
+
+            # Insertar documentos en lotes para mejor rendimiento
+            batch_size = 100
+            total_insertados = 0
+            total_esperado = total_leidos
+            batch = []
+
             for doc_data in documents_data:
                 # Convertir string _id de vuelta a ObjectId si es necesario
                 if '_id' in doc_data and isinstance(doc_data['_id'], str):
                     try:
-                        from bson import ObjectId
                         doc_data['_id'] = ObjectId(doc_data['_id'])
                     except:
                         # Si no se puede convertir, dejar como string
                         pass
 
-                documents_to_insert.append(doc_data)
-
-            # Insertar documentos en lotes para mejor rendimiento
-            batch_size = 100
-            total_insertados = 0
+                batch.append(doc_data)
 
-            for i in range(0, len(documents_to_insert), batch_size):
-                batch = documents_to_insert[i:i + batch_size]
+                if len(batch) >= batch_size:
+                    self.collection.insert_many(batch)
+                    total_insertados += len(batch)
+                    batch = []
+                    logger.info(f"Insertados {total_insertados} documentos")
+                    if progress_callback:
+                        progress_callback(total_insertados, total_esperado)
 
+            if batch:
                 self.collection.insert_many(batch)
                 total_insertados += len(batch)
-                logger.info(f"Insertados {total_insertados}/{len(documents_to_insert)} documentos")
+                logger.info(f"Insertados {total_insertados} documentos")
+                if progress_callback:
+                    progress_callback(total_insertados, total_esperado)
+
+            # Los documentos restaurados cambian el número de pendientes de detección
+            self.invalidar_pendientes_objetos()
 
             # Verificar restauración
             total_actual = self.collection.count_documents({})
 
             restauracion_info = {
                 "ruta_backup": ruta_backup,
-                "total_documentos_restaurados": len(documents_to_insert),
+                "total_documentos_restaurados": total_insertados,
                 "total_documentos_en_coleccion": total_actual,
                 "fecha_restauracion": datetime.now().isoformat(),
                 "metadata_backup": metadata
@@ -607,28 +736,35 @@ class DatabaseManager:
                     "ruta": ruta_backup
                 }
 
-            # Leer y validar estructura JSON
+            # Leer la metadata y validar los documentos línea a línea
             try:
-                with open(ruta_backup, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
-            except json.JSONDecodeError as e:
+                metadata, documents_data = leer_backup(ruta_backup, "documents")
+
+                total_documentos = 0
+                for i, doc in enumerate(documents_data):
+                    if not isinstance(doc, dict):
+                        return {
+                            "valido": False,
+                            "error": f"Documento {i} no es un diccionario válido",
+                            "ruta": ruta_backup
+                        }
+
+                    # Verificar que tenga _id
+                    if '_id' not in doc:
+                        return {
+                            "valido": False,
+                            "error": f"Documento {i} no tiene campo _id",
+                            "ruta": ruta_backup
+                        }
+
+                    total_documentos += 1
+            except ValueError as e:
                 return {
                     "valido": False,
                     "error": f"Error de formato JSON: {str(e)}",
                     "ruta": ruta_backup
                 }
 
-            # Validar estructura requerida
-            if "metadata" not in backup_data or "documents" not in backup_data:
-                return {
-                    "valido": False,
-                    "error": "Estructura de backup inválida",
-                    "ruta": ruta_backup
-                }
-
-            metadata = backup_data["metadata"]
-            documents_data = backup_data["documents"]
-
             # Validar campos requeridos en metadata
             campos_requeridos = ["collection_name", "database_name", "backup_date", "total_documents"]
             for campo in campos_requeridos:
@@ -639,44 +775,22 @@ class DatabaseManager:
                         "ruta": ruta_backup
                     }
 
-            # Validar que el número de documentos coincida
-            if len(documents_data) != metadata["total_documents"]:
+            # Validar que el número de documentos coincida con el realmente escrito
+            error_total = verificar_total_registros(metadata, documents_data, total_documentos, "total_documents")
+            if error_total:
                 return {
                     "valido": False,
-                    "error": f"Inconsistencia: metadata indica {metadata['total_documents']} documentos pero archivo contiene {len(documents_data)}",
+                    "error": error_total,
                     "ruta": ruta_backup
                 }
 
-            # Validar estructura de documentos
-            for i, doc in enumerate(documents_data):
-                if not isinstance(doc, dict):
-                    return {
-                        "valido": False,
-                        "error": f"Documento {i} no es un diccionario válido",
-                        "ruta": ruta_backup
-                    }
-
-                # Verificar que tenga _id
-                if '_id' not in doc:
-                    return {
-                        "valido": False,
-                        "error": f"Documento {i} no tiene campo _id",
-                        "ruta": ruta_backup
-                    }
-
-            # Calcular hash del archivo para verificación
-            sha256_hash = hashlib.sha256()
-            with open(ruta_backup, 'rb') as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-
             validacion_info = {
                 "valido": True,
                 "ruta": ruta_backup,
                 "tamano_archivo": os.path.getsize(ruta_backup),
-                "hash_sha256": sha256_hash.hexdigest(),
+                "hash_sha256": calcular_hash_archivo(ruta_backup),
                 "metadata": metadata,
-                "total_documentos": len(documents_data),
+                "total_documentos": total_documentos,
                 "fecha_backup": metadata.get("backup_date", "Desconocida"),
                 "database_name": metadata.get("database_name", "Desconocida"),
                 "collection_name": metadata.get("collection_name", "Desconocida")
@@ -6,6 +6,7 @@ import sys
 import logging
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+from itertools import islice
 import hashlib
 
 # Importar dependencias para detección de objetos
@@ -18,6 +19,8 @@ except ImportError as e:
     logging.error(f"Error al importar dependencias para detección de objetos: {e}")
     raise
 
+from src.database import FILTRO_PENDIENTES_OBJETOS
+
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -197,13 +200,7 @@ class BackgroundObjectProcessor:
             self.logger.info("Iniciando procesamiento de imágenes sin objetos en segundo plano")
 
             # Buscar documentos sin objetos o con objetos vacíos
-            query = {
-                "$or": [
-                    {"objetos": {"$exists": False}},
-                    {"objetos": {"$size": 0}},
-                    {"objeto_procesado": False}
-                ]
-            }
+            query = FILTRO_PENDIENTES_OBJETOS
 
             # Si batch_size es muy grande (>1000), procesar toda la colección
             if batch_size > 1000:
@@ -234,45 +231,8 @@ class BackgroundObjectProcessor:
             self.logger.info(f"Procesando {total_documentos} imágenes...")
 
             for i, documento_data in enumerate(documentos_sin_procesar):
-                try:
-                    # Convertir a objeto ImagenDocumento
-                    from src.models import ImagenDocumento
-                    documento = ImagenDocumento(**documento_data)
-
-                    # Verificar que la imagen existe
-                    if not os.path.exists(documento.ruta):
-                        self.logger.warning(f"Archivo no encontrado: {documento.ruta}")
-                        estadisticas["sin_archivo"] += 1
-                        continue
-
-                    # Detectar objetos en la imagen
-                    objetos_detectados = self.detector.detectar_objetos(documento.ruta)
-
-                    if objetos_detectados:
-                        # Actualizar documento con objetos detectados
-                        self.db_manager.collection.update_one(
-                            {"_id": documento.id},
-                            {
-                                "$set": {
-                                    "objetos": objetos_detectados,
-                                    "objeto_procesado": True
-                                }
-                            }
-                        )
-                        self.logger.info(f"✓ [{i+1}/{total_documentos}] Actualizada imagen {documento.nombre} con {len(objetos_detectados)} objetos")
-                        estadisticas["procesadas"] += 1
-                    else:
-                        # Marcar como procesado aunque no se detectaron objetos
-                        self.db_manager.collection.update_one(
-                            {"_id": documento.id},
-                            {"$set": {"objeto_procesado": True}}
-                        )
-                        self.logger.info(f"✓ [{i+1}/{total_documentos}] Procesada imagen {documento.nombre} (sin objetos detectados)")
-                        estadisticas["procesadas"] += 1
-
-                except Exception as e:
-                    self.logger.error(f"✗ [{i+1}/{total_documentos}] Error al procesar documento {documento_data.get('_id', 'unknown')}: {e}")
-                    estadisticas["errores"] += 1
+                clave = self._procesar_documento(documento_data, f"{i+1}/{total_documentos}")
+                estadisticas[clave] += 1
 
             self.logger.info(f"Procesamiento completado: {estadisticas}")
             return estadisticas
@@ -288,6 +248,120 @@ class BackgroundObjectProcessor:
         finally:
             self.procesando = False
 
+    def procesar_imagenes_sin_objetos_por_lotes(self, tamano_lote: int = 64, cancel_callback=None,
+                                                 progress_callback=None) -> Dict[str, Any]:
+        """
+        Procesar todas las imágenes sin objetos recorriendo la colección por lotes.
+
+        Los documentos se leen de un único cursor en lotes de `tamano_lote`, de
+        modo que solo un lote está en memoria y cada documento se visita una vez.
+
+        Args:
+            tamano_lote: Número de documentos leídos y procesados en cada lote
+            cancel_callback: Función opcional que devuelve True para detener el procesamiento
+            progress_callback: Función opcional llamada con las estadísticas tras cada lote
+
+        Returns:
+            Diccionario con estadísticas del procesamiento
+        """
+        estadisticas = {
+            "procesadas": 0,
+            "errores": 0,
+            "sin_archivo": 0,
+            "cancelado": False
+        }
+
+        try:
+            self.procesando = True
+            self.logger.info(f"Iniciando procesamiento por lotes de {tamano_lote} imágenes sin objetos")
+
+            query = FILTRO_PENDIENTES_OBJETOS
+
+            cursor = self.db_manager.collection.find(query).batch_size(tamano_lote)
+            vistos = 0
+            try:
+                while True:
+                    if cancel_callback and cancel_callback():
+                        estadisticas["cancelado"] = True
+                        self.logger.info("Procesamiento por lotes cancelado")
+                        break
+
+                    lote = list(islice(cursor, tamano_lote))
+                    if not lote:
+                        break
+
+                    for documento_data in lote:
+                        vistos += 1
+                        clave = self._procesar_documento(documento_data, str(vistos))
+                        estadisticas[clave] += 1
+
+                    if progress_callback:
+                        progress_callback(estadisticas)
+            finally:
+                cursor.close()
+
+            self.logger.info(f"Procesamiento completado: {estadisticas}")
+            return estadisticas
+
+        except Exception as e:
+            self.logger.error(f"Error en procesamiento por lotes: {e}")
+            estadisticas["errores"] += 1
+            estadisticas["mensaje"] = f"Error: {str(e)}"
+            return estadisticas
+        finally:
+            self.procesando = False
+
+    def _procesar_documento(self, documento_data: Dict[str, Any], etiqueta: str) -> str:
+        """
+        Detectar objetos en un documento y guardar el resultado.
+
+        Args:
+            documento_data: Documento de MongoDB
+            etiqueta: Posición del documento para los mensajes de log
+
+        Returns:
+            Clave de estadística a incrementar: "procesadas", "sin_archivo" o "errores"
+        """
+        try:
+            # Convertir a objeto ImagenDocumento
+            from src.models import ImagenDocumento
+            documento = ImagenDocumento(**documento_data)
+
+            # Verificar que la imagen existe
+            if not os.path.exists(documento.ruta):
+                self.logger.warning(f"Archivo no encontrado: {documento.ruta}")
+                return "sin_archivo"
+
+            # Detectar objetos en la imagen
+            objetos_detectados = self.detector.detectar_objetos(documento.ruta)
+
+            if objetos_detectados:
+                # Actualizar documento con objetos detectados
+                self.db_manager.collection.update_one(
+                    {"_id": documento.id},
+                    {
+                        "$set": {
+                            "objetos": objetos_detectados,
+                            "objeto_procesado": True
+                        }
+                    }
+                )
+                # El documento deja de estar pendiente: ya tiene objetos y está procesado
+                self.db_manager.ajustar_pendientes_objetos(-1)
+                self.logger.info(f"✓ [{etiqueta}] Actualizada imagen {documento.nombre} con {len(objetos_detectados)} objetos")
+            else:
+                # Marcar como procesado aunque no se detectaron objetos
+                self.db_manager.collection.update_one(
+                    {"_id": documento.id},
+                    {"$set": {"objeto_procesado": True}}
+                )
+                self.logger.info(f"✓ [{etiqueta}] Procesada imagen {documento.nombre} (sin objetos detectados)")
+            return "procesadas"
+
+        except Exception as e:
+            self.logger.error(f"✗ [{etiqueta}] Error al procesar documento {documento_data.get('_id', 'unknown')}: {e}")
+            return "errores"
+
     def esta_procesando(self) -> bool:
         """Verificar si el procesador está activo."""
         return self.procesando
@@ -4,9 +4,8 @@ Módulo para manejar la conexión y operaciones con Qdrant.
 import os
 import sys
 import logging
-import json
-import hashlib
 from datetime import datetime
+import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct, Filter, FieldCondition, MatchValue
@@ -16,6 +15,7 @@ from qdrant_client.http.exceptions import UnexpectedResponse
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.models import ImagenDocumento, ConsultaBusqueda, ResultadoBusqueda
+from src.backup_io import BackupWriter, leer_backup, calcular_hash_archivo, verificar_total_registros
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
@@ -386,12 +386,18 @@ class QdrantManager:
             logger.error(f"Error al limpiar colección: {e}")
             raise
 
-    def crear_backup_coleccion(self, ruta_backup: str) -> Dict[str, Any]:
+    def crear_backup_coleccion(self, ruta_backup: str, progress_callback=None) -> Dict[str, Any]:
         """
         Crear una copia de seguridad de toda la colección.
 
+        El backup se escribe en formato NDJSON: una línea de metadata seguida
+        de un punto por línea, sin acumular la colección en memoria. Los
+        vectores se guardan aparte como una matriz float32 en un archivo .npy
+        junto al backup; cada línea indica la fila de su vector.
+
         Args:
             ruta_backup: Ruta donde guardar el archivo de backup
+            progress_callback: Función opcional llamada con (procesados, total) tras cada lote
 
         Returns:
             Diccionario con información del backup creado
@@ -402,70 +408,91 @@ class QdrantManager:
             # Obtener información de la colección
             collection_info = self.client.get_collection(self.collection_name)
 
-            # Obtener todos los puntos de la colección
-            # Usar scroll para manejar grandes cantidades de datos
-            all_points = []
-            offset = None
-            limit = 1000  # Procesar en lotes
-
-            while True:
-                response, offset = self.client.scroll(
-                    collection_name=self.collection_name,
-                    limit=limit,
-                    offset=offset,
-                    with_payload=True,
-                    with_vectors=True
-                )
-
-                if not response:
-                    break
-
-                all_points.extend(response)
+            # Recuento aproximado (puede ser None); el total real se guarda en el resumen final
+            total_esperado = collection_info.points_count or 0
+            vector_size = collection_info.config.params.vectors.size
 
-                # Si no hay más puntos, salir del bucle
-                if offset is None:
-                    break
-
-            logger.info(f"Total de vectores obtenidos: {len(all_points)}")
-
-            # Crear estructura del backup
-            backup_data = {
-                "metadata": {
-                    "collection_name": self.collection_name,
-                    "backup_date": datetime.now().isoformat(),
-                    "total_vectors": len(all_points),
-                    "vector_size": collection_info.config.params.vectors.size,
-                    "distance": collection_info.config.params.vectors.distance,
-                    "qdrant_version": "1.0"  # Versión del formato de backup
-                },
-                "vectors": []
+            metadata = {
+                "collection_name": self.collection_name,
+                "backup_date": datetime.now().isoformat(),
+                "total_vectors": total_esperado,
+                "vector_size": vector_size,
+                "distance": collection_info.config.params.vectors.distance,
+                "qdrant_version": "3.0"  # Versión del formato de backup (NDJSON + .npy)
             }
 
-            # Procesar cada punto
-            for point in all_points:
-                vector_data = {
-                    "id": point.id,
-                    "vector": point.vector,
-                    "payload": point.payload
-                }
-                backup_data["vectors"].append(vector_data)
-
-            # Guardar backup en archivo JSON
-            with open(ruta_backup, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False)
+            # Matriz de vectores preasignada en disco con el tamaño actual de la colección
+            ruta_vectores = None
+            vectores = None
+            if total_esperado:
+                ruta_vectores = self._ruta_vectores_backup(ruta_backup)
+                vectores = np.lib.format.open_memmap(
+                    ruta_vectores, mode="w+", dtype=np.float32, shape=(total_esperado, vector_size)
+                )
+                metadata["vectors_file"] = os.path.basename(ruta_vectores)
 
-            # Calcular hash del archivo para verificación
-            sha256_hash = hashlib.sha256()
-            with open(ruta_backup, 'rb') as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
+            # Recorrer la colección con scroll y escribir cada lote según llega
+            offset = None
+            limit = 1000  # Procesar en lotes
+            fila = 0
+
+            with BackupWriter(ruta_backup, metadata) as writer:
+                while True:
+                    response, offset = self.client.scroll(
+                        collection_name=self.collection_name,
+                        limit=limit,
+                        offset=offset,
+                        with_payload=True,
+                        with_vectors=True
+                    )
+
+                    if not response:
+                        break
+
+                    for point in response:
+                        registro = {"id": point.id, "payload": point.payload}
+                        if vectores is not None and fila < total_esperado:
+                            vectores[fila] = point.vector
+                            registro["fila"] = fila
+                            fila += 1
+                        else:
+                            # Puntos añadidos durante el backup: vector en línea
+                            registro["vector"] = point.vector
+                        writer.escribir(registro)
+
+                    if progress_callback:
+                        progress_callback(writer.total_registros, metadata["total_vectors"])
+
+                    # Si no hay más puntos, salir del bucle
+                    if offset is None:
+                        break
+
+                resumen = {}
+                if vectores is not None:
+                    vectores.flush()
+                    del vectores
+                    if fila < total_esperado:
+                        # Se borraron puntos durante el backup: dejar solo las filas usadas
+                        self._recortar_vectores_backup(ruta_vectores, fila)
+                    resumen["vector_rows"] = fila
+                    resumen["vectors_sha256"] = calcular_hash_archivo(ruta_vectores)
+
+                writer.cerrar(resumen)
+
+            logger.info(f"Total de vectores obtenidos: {writer.total_registros}")
+
+            tamano_archivo = os.path.getsize(ruta_backup)
+            if ruta_vectores:
+                tamano_archivo += os.path.getsize(ruta_vectores)
 
             backup_info = {
                 "ruta_archivo": ruta_backup,
-                "total_vectores": len(all_points),
-                "tamano_archivo": os.path.getsize(ruta_backup),
-                "hash_sha256": sha256_hash.hexdigest(),
-                "fecha_backup": backup_data["metadata"]["backup_date"]
+                "ruta_vectores": ruta_vectores,
+                "total_vectores": writer.total_registros,
+                "tamano_archivo": tamano_archivo,
+                "hash_sha256": writer.hash_sha256(),
+                "hash_sha256_vectores": resumen.get("vectors_sha256"),
+                "fecha_backup": metadata["backup_date"]
             }
 
             logger.info(f"Backup creado exitosamente: {backup_info}")
@@ -475,13 +502,15 @@ class QdrantManager:
             logger.error(f"Error al crear backup: {e}")
             raise
 
-    def restaurar_coleccion(self, ruta_backup: str, recrear_coleccion: bool = True) -> Dict[str, Any]:
+    def restaurar_coleccion(self, ruta_backup: str, recrear_coleccion: bool = True,
+                            progress_callback=None) -> Dict[str, Any]:
         """
         Restaurar la colección desde un archivo de backup.
 
         Args:
             ruta_backup: Ruta del archivo de backup
             recrear_coleccion: Si es True, elimina y recrea la colección antes de restaurar
+            progress_callback: Función opcional llamada con (procesados, total) tras cada lote
 
         Returns:
             Diccionario con información de la restauración
@@ -493,19 +522,20 @@ class QdrantManager:
             if not os.path.exists(ruta_backup):
                 raise FileNotFoundError(f"Archivo de backup no encontrado: {ruta_backup}")
 
-            # Leer archivo de backup
-            with open(ruta_backup, 'r', encoding='utf-8') as f:
-                backup_data = json.load(f)
+            # Validar el backup completo (resumen, forma y hash del .npy) antes de
+            # borrar la colección: un backup dañado no debe dejarla vacía
+            validacion = self.validar_backup(ruta_backup)
+            if not validacion["valido"]:
+                raise ValueError(f"Backup no válido, no se restaura: {validacion['error']}")
 
-            # Validar estructura del backup
-            if "metadata" not in backup_data or "vectors" not in backup_data:
-                raise ValueError("Formato de backup inválido")
-
-            metadata = backup_data["metadata"]
-            vectors_data = backup_data["vectors"]
+            # Leer metadata; los vectores se leen en streaming
+            metadata, vectors_data = leer_backup(ruta_backup, "vectors")
 
             logger.info(f"Backup metadata: {metadata}")
-            logger.info(f"Total de vectores a restaurar: {len(vectors_data)}")
+            logger.info(f"Total de vectores a restaurar: {validacion['total_vectores']}")
+
+            # Matriz de vectores del backup, mapeada sin cargarla en memoria
+            vectores = self._cargar_vectores_backup(ruta_backup, metadata)
 
             # Si se solicita recrear la colección
             if recrear_coleccion:
@@ -513,37 +543,47 @@ class QdrantManager:
                 self.client.delete_collection(self.collection_name)
                 self._ensure_collection()
 
-            # Preparar puntos para inserción
-            points = []
-            for vector_data in vectors_data:
-                point = PointStruct(
-                    id=vector_data["id"],
-                    vector=vector_data["vector"],
-                    payload=vector_data["payload"]
-                )
-                points.append(point)
-
             # Insertar puntos en lotes para mejor rendimiento
             batch_size = 100
             total_insertados = 0
+            total_esperado = validacion["total_vectores"]
+            batch = []
 
-            for i in range(0, len(points), batch_size):
-                batch = points[i:i + batch_size]
-
-                self.client.upsert(
-                    collection_name=self.collection_name,
-                    points=batch
-                )
-
+            for vector_data in vectors_data:
+                if "fila" in vector_data:
+                    if vectores is None:
+                        raise ValueError(f"El vector {vector_data.get('id')} referencia una fila pero el backup no tiene archivo de vectores")
+                    vector = vectores[vector_data["fila"]].tolist()
+                else:
+                    vector = vector_data["vector"]
+
+                batch.append(PointStruct(
+                    id=vector_data["id"],
+                    vector=vector,
+                    payload=vector_data["payload"]
+                ))
+
+                if len(batch) >= batch_size:
+                    self.client.upsert(collection_name=self.collection_name, points=batch)
+                    total_insertados += len(batch)
+                    batch = []
+                    logger.info(f"Insertados {total_insertados} vectores")
+                    if progress_callback:
+                        progress_callback(total_insertados, total_esperado)
+
+            if batch:
+                self.client.upsert(collection_name=self.collection_name, points=batch)
                 total_insertados += len(batch)
-                logger.info(f"Insertados {total_insertados}/{len(points)} vectores")
+                logger.info(f"Insertados {total_insertados} vectores")
+                if progress_callback:
+                    progress_callback(total_insertados, total_esperado)
 
             # Verificar restauración
             collection_info = self.client.get_collection(self.collection_name)
 
             restauracion_info = {
                 "ruta_backup": ruta_backup,
-                "total_vectores_restaurados": len(points),
+                "total_vectores_restaurados": total_insertados,
                 "total_vectores_en_coleccion": collection_info.points_count,
                 "fecha_restauracion": datetime.now().isoformat(),
                 "metadata_backup": metadata
@@ -577,28 +617,36 @@ class QdrantManager:
                     "ruta": ruta_backup
                 }
 
-            # Leer y validar estructura JSON
+            # Leer y validar el archivo línea a línea
             try:
-                with open(ruta_backup, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
-            except json.JSONDecodeError as e:
+                metadata, vectors_data = leer_backup(ruta_backup, "vectors")
+                vectores = self._cargar_vectores_backup(ruta_backup, metadata)
+                total_vectores = 0
+                total_filas = 0
+                for vector_data in vectors_data:
+                    fila = vector_data.get("fila")
+                    if fila is not None:
+                        if vectores is None or fila >= len(vectores):
+                            return {
+                                "valido": False,
+                                "error": f"Vector {total_vectores} referencia una fila inexistente: {fila}",
+                                "ruta": ruta_backup
+                            }
+                        total_filas += 1
+                    total_vectores += 1
+            except FileNotFoundError as e:
                 return {
                     "valido": False,
-                    "error": f"Error de formato JSON: {str(e)}",
+                    "error": str(e),
                     "ruta": ruta_backup
                 }
-
-            # Validar estructura requerida
-            if "metadata" not in backup_data or "vectors" not in backup_data:
+            except ValueError as e:
                 return {
                     "valido": False,
-                    "error": "Estructura de backup inválida",
+                    "error": f"Error de formato JSON: {str(e)}",
                     "ruta": ruta_backup
                 }
 
-            metadata = backup_data["metadata"]
-            vectors_data = backup_data["vectors"]
-
             # Validar campos requeridos en metadata
             campos_requeridos = ["collection_name", "backup_date", "total_vectors", "vector_size"]
             for campo in campos_requeridos:
@@ -609,27 +657,57 @@ class QdrantManager:
                         "ruta": ruta_backup
                     }
 
-            # Validar que el número de vectores coincida
-            if len(vectors_data) != metadata["total_vectors"]:
+            # Validar que el número de vectores coincida con el realmente escrito
+            error_total = verificar_total_registros(metadata, vectors_data, total_vectores, "total_vectors")
+            if error_total:
                 return {
                     "valido": False,
-                    "error": f"Inconsistencia: metadata indica {metadata['total_vectors']} vectores pero archivo contiene {len(vectors_data)}",
+                    "error": error_total,
                     "ruta": ruta_backup
                 }
 
-            # Calcular hash del archivo para verificación
-            sha256_hash = hashlib.sha256()
-            with open(ruta_backup, 'rb') as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
+            # Validar el archivo .npy: dimensiones y hash registrado al crear el backup
+            tamano_archivo = os.path.getsize(ruta_backup)
+            if vectores is not None:
+                ruta_vectores = self._ruta_archivo_vectores(ruta_backup, metadata)
+                forma_esperada = (total_filas, metadata["vector_size"])
+                if vectores.shape != forma_esperada:
+                    return {
+                        "valido": False,
+                        "error": f"Inconsistencia: el archivo de vectores tiene forma {vectores.shape} pero se esperaba {forma_esperada}",
+                        "ruta": ruta_backup
+                    }
+
+                filas_resumen = (vectors_data.resumen or {}).get("vector_rows")
+                if filas_resumen is not None and filas_resumen != vectores.shape[0]:
+                    return {
+                        "valido": False,
+                        "error": f"Inconsistencia: el resumen indica {filas_resumen} filas de vectores pero el archivo tiene {vectores.shape[0]}",
+                        "ruta": ruta_backup
+                    }
+
+                hash_esperado = (vectors_data.resumen or {}).get("vectors_sha256")
+                if not hash_esperado:
+                    return {
+                        "valido": False,
+                        "error": "Falta el hash del archivo de vectores en el resumen del backup",
+                        "ruta": ruta_backup
+                    }
+                if calcular_hash_archivo(ruta_vectores) != hash_esperado:
+                    return {
+                        "valido": False,
+                        "error": f"El hash del archivo de vectores no coincide: {ruta_vectores}",
+                        "ruta": ruta_backup
+                    }
+                tamano_archivo += os.path.getsize(ruta_vectores)
 
             validacion_info = {
                 "valido": True,
                 "ruta": ruta_backup,
-                "tamano_archivo": os.path.getsize(ruta_backup),
-                "hash_sha256": sha256_hash.hexdigest(),
+                "tamano_archivo": tamano_archivo,
+                "hash_sha256": calcular_hash_archivo(ruta_backup),
                 "metadata": metadata,
-                "total_vectores": len(vectors_data),
+                "total_vectores": total_vectores,
                 "fecha_backup": metadata.get("backup_date", "Desconocida")
             }
 
@@ -644,6 +722,51 @@ class QdrantManager:
                 "ruta": ruta_backup
             }
 
+    @staticmethod
+    def _ruta_vectores_backup(ruta_backup: str) -> str:
+        """Ruta del archivo .npy con los vectores de un backup."""
+        base = ruta_backup
+        for extension in (".zst", ".json"):
+            if base.endswith(extension):
+                base = base[:-len(extension)]
+        return f"{base}_vectors.npy"
+
+    @staticmethod
+    def _ruta_archivo_vectores(ruta_backup: str, metadata: Dict[str, Any]) -> Optional[str]:
+        """Ruta del archivo .npy indicado en la metadata, o None si no tiene."""
+        nombre = metadata.get("vectors_file")
+        if not nombre:
+            return None
+        return os.path.join(os.path.dirname(os.path.abspath(ruta_backup)), nombre)
+
+    @staticmethod
+    def _recortar_vectores_backup(ruta_vectores: str, filas: int):
+        """Reescribir el archivo .npy con solo sus primeras `filas` filas."""
+        ruta_temporal = f"{ruta_vectores}.tmp"
+        vectores = np.load(ruta_vectores, mmap_mode="r")
+        try:
+            with open(ruta_temporal, "wb") as f:
+                np.save(f, vectores[:filas])
+        finally:
+            del vectores
+        os.replace(ruta_temporal, ruta_vectores)
+
+    @classmethod
+    def _cargar_vectores_backup(cls, ruta_backup: str, metadata: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Abrir la matriz de vectores de un backup en modo solo lectura.
+
+        Returns:
+            Matriz mapeada en memoria, o None si el backup guarda los vectores en línea
+        """
+        ruta_vectores = cls._ruta_archivo_vectores(ruta_backup, metadata)
+        if ruta_vectores is None:
+            return None
+
+        if not os.path.exists(ruta_vectores):
+            raise FileNotFoundError(f"Archivo de vectores no encontrado: {ruta_vectores}")
+        return np.load(ruta_vectores, mmap_mode="r")
+
     def cerrar_conexion(self):
         """Cerrar la conexión a Qdrant."""
         if self.client:
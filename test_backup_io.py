@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Pruebas del formato de archivos de backup (src/backup_io.py).
+
+No necesitan MongoDB ni Qdrant: trabajan solo con archivos temporales.
+"""
+import os
+import sys
+import json
+from datetime import datetime
+
+import pytest
+
+# Añadir el directorio raíz al path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src import backup_io
+from src.backup_io import (
+    BackupWriter, leer_backup, calcular_hash_archivo, serializar_registro, verificar_total_registros
+)
+
+METADATA = {"collection_name": "prueba", "total_vectors": 2}
+REGISTROS = [
+    {"id": 1, "payload": {"nombre": "año.jpg", "fecha": "2024-01-02"}},
+    {"id": 2, "payload": {"nombre": "b.png", "objetos": ["perro", "gato"]}},
+]
+
+
+def _escribir_backup(ruta):
+    with BackupWriter(str(ruta), METADATA) as writer:
+        for registro in REGISTROS:
+            writer.escribir(registro)
+    return writer
+
+
+def test_roundtrip_ndjson(tmp_path):
+    """Los registros escritos se leen igual, con metadata y resumen."""
+    ruta = tmp_path / "backup.json"
+    _escribir_backup(ruta)
+
+    metadata, registros = leer_backup(str(ruta), "vectors")
+    assert metadata == METADATA
+    assert list(registros) == REGISTROS
+    assert registros.resumen == {"total_registros": len(REGISTROS)}
+    assert verificar_total_registros(metadata, registros, len(REGISTROS), "total_vectors") is None
+
+
+def test_backup_interrumpido_sin_resumen(tmp_path):
+    """Un backup que termina con una excepción no lleva línea de resumen."""
+    ruta = tmp_path / "backup.json"
+    with pytest.raises(RuntimeError):
+        with BackupWriter(str(ruta), METADATA) as writer:
+            writer.escribir(REGISTROS[0])
+            raise RuntimeError("fallo a mitad del backup")
+
+    metadata, registros = leer_backup(str(ruta), "vectors")
+    assert list(registros) == [REGISTROS[0]]
+    assert registros.resumen is None
+    assert verificar_total_registros(metadata, registros, 1, "total_vectors") is not None
+
+
+def test_lectura_formato_json_antiguo(tmp_path):
+    """Los backups antiguos (un único objeto JSON) se siguen leyendo."""
+    ruta = tmp_path / "antiguo.json"
+    ruta.write_text(json.dumps({"metadata": METADATA, "vectors": REGISTROS}), encoding="utf-8")
+
+    metadata, registros = leer_backup(str(ruta), "vectors")
+    assert metadata == METADATA
+    assert list(registros) == REGISTROS
+    assert registros.formato_antiguo
+    assert verificar_total_registros(metadata, registros, 2, "total_vectors") is None
+    assert verificar_total_registros(metadata, registros, 1, "total_vectors") is not None
+
+
+def test_formato_json_antiguo_invalido(tmp_path):
+    ruta = tmp_path / "antiguo.json"
+    ruta.write_text(json.dumps({"vectors": REGISTROS}), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Formato de backup inválido"):
+        leer_backup(str(ruta), "vectors")
+
+
+@pytest.mark.skipif(not backup_io.ZSTD_AVAILABLE, reason="zstandard no instalado")
+def test_roundtrip_zstd(tmp_path):
+    """Las rutas .zst se comprimen y se detectan al leer."""
+    ruta = tmp_path / "backup.json.zst"
+    _escribir_backup(ruta)
+
+    with open(ruta, "rb") as f:
+        assert f.read(4) == b"\x28\xb5\x2f\xfd"
+
+    metadata, registros = leer_backup(str(ruta), "vectors")
+    assert metadata == METADATA
+    assert list(registros) == REGISTROS
+    assert registros.resumen == {"total_registros": len(REGISTROS)}
+
+
+@pytest.mark.parametrize("nombre", ["backup.json", "backup.json.zst"])
+def test_hash_sha256_coincide_con_archivo(tmp_path, nombre):
+    """El hash calculado al escribir es el del archivo en disco."""
+    if nombre.endswith(".zst") and not backup_io.ZSTD_AVAILABLE:
+        pytest.skip("zstandard no instalado")
+    ruta = tmp_path / nombre
+    writer = _escribir_backup(ruta)
+
+    assert writer.hash_sha256() == calcular_hash_archivo(str(ruta))
+
+
+def test_linea_invalida(tmp_path):
+    """Una línea corrupta se indica con su número de línea."""
+    ruta = tmp_path / "backup.json"
+    _escribir_backup(ruta)
+    lineas = ruta.read_bytes().splitlines(keepends=True)
+    lineas[2] = b'{"id": 2, "payload": \n'
+    ruta.write_bytes(b"".join(lineas))
+
+    _, registros = leer_backup(str(ruta), "vectors")
+    with pytest.raises(ValueError, match="Línea 3 inválida"):
+        list(registros)
+
+
+@pytest.mark.parametrize("usar_orjson", [True, False])
+def test_fechas_en_iso_8601(monkeypatch, usar_orjson):
+    """Las fechas se serializan igual con y sin orjson."""
+    if usar_orjson and not backup_io.ORJSON_AVAILABLE:
+        pytest.skip("orjson no instalado")
+    monkeypatch.setattr(backup_io, "ORJSON_AVAILABLE", usar_orjson)
+
+    linea = serializar_registro({"fecha": datetime(2024, 1, 2, 3, 4, 5), "nombre": "ñ"})
+    assert linea == '{"fecha":"2024-01-02T03:04:05","nombre":"ñ"}\n'.encode("utf-8")
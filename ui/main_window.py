@@ -3,24 +3,147 @@ Ventana principal de la aplicación de búsqueda semántica.
 """
 import sys
 import os
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from urllib.request import urlopen
 from typing import List, Optional
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QLineEdit, QPushButton, QTextEdit, QTableWidget,
-    QTableWidgetItem, QProgressBar, QLabel, QComboBox, QSpinBox,
+    QTabWidget, QLineEdit, QPushButton, QPlainTextEdit, QTableView,
+    QProgressBar, QLabel, QComboBox, QSpinBox,
     QDoubleSpinBox, QGroupBox, QFormLayout, QMessageBox, QSplitter,
     QFrame, QHeaderView, QAbstractItemView, QFileDialog, QCheckBox,
-    QScrollArea, QSizePolicy
+    QSizePolicy
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QPixmap, QImage, QIcon, QFont
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QTimer, QObject, QRunnable, QThreadPool,
+    QAbstractTableModel, QModelIndex, QSize
+)
+from PySide6.QtGui import QPixmap, QImage, QImageReader, QIcon, QFont
+from pymongo.errors import BulkWriteError, PyMongoError
 
 from src.database import DatabaseManager
 from src.busqueda_semantica import BuscadorSemantico
 from src.qdrant_manager import QdrantManager
 from src.batch_processor import BatchProcessor
 from src.models import ConsultaBusqueda, ResultadoBusqueda, ImagenDocumento
+from src.backup_io import ZSTD_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+# Columnas de la tabla de resultados de búsqueda
+_RESULT_COLUMNS = ("Nombre", "Ubicación", "Objetos", "Similitud", "Tipo")
+_RESULT_NCOLS = len(_RESULT_COLUMNS)
+
+# Textos de estado repetidos en las etiquetas de las pestañas
+_TEXTO_CERO = "0"
+_TEXTO_NUNCA = "Nunca"
+_TEXTO_NO_DISPONIBLE = "No disponible"
+
+# Plantilla HTML del panel de información de la imagen seleccionada
+_INFO_TPL = """
+            <div style='text-align: center;'>
+            <h4>📋 Información de la Imagen</h4>
+            <hr>
+            <p><b>🏷️ Nombre:</b> {nombre}</p>
+            <p><b>📍 Ubicación:</b> {ubicacion}</p>
+            <p><b>📐 Dimensiones:</b> {ancho}x{alto}px</p>
+            <p><b>💾 Peso:</b> {peso_kb:.1f} KB</p>
+            <p><b>🔍 Objetos detectados:</b></p>
+            <p style='margin-left: 20px; color: #333; text-align: center;'>
+            {objetos}
+            </p>
+            <p><b>✅ Procesado:</b> {procesado}</p>
+            </div>
+            """
+
+# Resumen detallado que se escribe en el log al terminar la búsqueda de imágenes
+_RESUMEN_BUSQUEDA_TPL = (
+    "📊 Resumen detallado:\n"
+    "   • Total encontradas: {total}\n"
+    "   • Ya procesadas: {procesadas}\n"
+    "     └─ Por ruta exacta: {por_ruta}\n"
+    "     └─ Por hash coincidente: {por_hash}\n"
+    "   • Errores: {errores}\n"
+    "   • Imágenes nuevas para procesar: {nuevas}"
+)
+
+# Políticas de tamaño compartidas, creadas bajo demanda (requieren QApplication)
+_sp_cache = {}
+
+
+def _size_policy(horizontal, vertical) -> QSizePolicy:
+    """Obtener una QSizePolicy compartida para la combinación indicada."""
+    clave = (horizontal, vertical)
+    policy = _sp_cache.get(clave)
+    if policy is None:
+        policy = _sp_cache[clave] = QSizePolicy(horizontal, vertical)
+    return policy
+
+
+@lru_cache(maxsize=None)
+def _clases_deteccion():
+    """Importar una sola vez ObjectDetector y BackgroundObjectProcessor.
+
+    La importación se retrasa hasta el primer uso porque src.object_detector
+    carga torch y transformers, que ralentizarían el arranque de la ventana.
+    """
+    from src.object_detector import ObjectDetector, BackgroundObjectProcessor
+    return ObjectDetector, BackgroundObjectProcessor
+
+
+class ResultadosTableModel(QAbstractTableModel):
+    """Modelo de solo lectura con las filas de resultados de búsqueda."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def establecer_resultados(self, resultados: List[ResultadoBusqueda]):
+        """Sustituir los resultados precalculando el texto de cada celda."""
+        self.beginResetModel()
+        self._rows = [self._fila(resultado) for resultado in resultados]
+        self.endResetModel()
+
+    @staticmethod
+    def _fila(resultado: ResultadoBusqueda) -> tuple:
+        """Textos de las columnas de un resultado."""
+        documento = resultado.documento
+        ubicacion = ", ".join([documento.ciudad, documento.barrio, documento.calle]).strip(", ")
+        objetos = ", ".join(documento.objetos) if documento.objetos else "Ninguno"
+        return (
+            documento.nombre,
+            ubicacion or "No especificada",
+            objetos,
+            f"{resultado.similitud:.3f}",
+            resultado.tipo_busqueda,
+        )
+
+    def nombre(self, fila: int) -> str:
+        """Nombre del documento de una fila."""
+        return self._rows[fila][0]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else _RESULT_NCOLS
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return _RESULT_COLUMNS[section]
+        return super().headerData(section, orientation, role)
 
 
 class WorkerThread(QThread):
@@ -31,6 +154,7 @@ class WorkerThread(QThread):
     procesamiento_completado = Signal(object)
     error_ocurrido = Signal(str)
     progreso_actualizado = Signal(int, str)
+    total_conocido = Signal(int)
 
     def __init__(self, funcion, *args, cancel_callback=None):
         super().__init__()
@@ -38,6 +162,15 @@ class WorkerThread(QThread):
         self.args = args
         self.cancel_callback = cancel_callback
 
+    def _emitir_progreso_backup(self, procesados: int, total: int):
+        """Emitir el progreso del backup como número de elementos guardados."""
+        self.progreso_actualizado.emit(procesados, f"Guardados {procesados}/{total}")
+
+    def _emitir_progreso_restore(self, procesados: int, total: int):
+        """Emitir el progreso de la restauración como porcentaje."""
+        porcentaje = min(100, procesados * 100 // total) if total else 0
+        self.progreso_actualizado.emit(porcentaje, f"Restaurados {procesados}/{total}")
+
     def run(self):
         """Ejecutar la función en un hilo separado."""
         try:
@@ -58,7 +191,7 @@ class WorkerThread(QThread):
 
                 # Verificar cancelación antes de empezar
                 if self.cancel_callback and self.cancel_callback():
-                    print("🚫 CANCELACIÓN DETECTADA ANTES DE EMPEZAR - WorkerThread")
+                    logger.debug("Cancelación detectada antes de empezar: %s", self.funcion)
                     self.progreso_actualizado.emit(0, "Procesamiento cancelado")
                     return
 
@@ -74,26 +207,22 @@ class WorkerThread(QThread):
                 qdrant_manager = self.args[0]
                 ruta_backup = self.args[1]
 
-                # Simular progreso inicial
-                self.progreso_actualizado.emit(10, "Obteniendo información de la colección...")
+                self.progreso_actualizado.emit(0, "Obteniendo información de la colección...")
 
-                # Ejecutar backup
-                resultado = qdrant_manager.crear_backup_coleccion(ruta_backup)
+                # Ejecutar backup informando del número de elementos guardados
+                resultado = qdrant_manager.crear_backup_coleccion(ruta_backup, self._emitir_progreso_backup)
 
-                self.progreso_actualizado.emit(100, "Backup completado")
                 self.procesamiento_completado.emit(resultado)
 
             elif self.funcion == "backup_mongodb":
                 db_manager = self.args[0]
                 ruta_backup = self.args[1]
 
-                # Simular progreso inicial
-                self.progreso_actualizado.emit(10, "Obteniendo información de la colección...")
+                self.progreso_actualizado.emit(0, "Obteniendo información de la colección...")
 
-                # Ejecutar backup
-                resultado = db_manager.crear_backup_coleccion(ruta_backup)
+                # Ejecutar backup informando del número de elementos guardados
+                resultado = db_manager.crear_backup_coleccion(ruta_backup, self._emitir_progreso_backup)
 
-                self.progreso_actualizado.emit(100, "Backup completado")
                 self.procesamiento_completado.emit(resultado)
 
             elif self.funcion == "restore":
@@ -105,7 +234,7 @@ class WorkerThread(QThread):
                 self.progreso_actualizado.emit(10, "Validando archivo de backup...")
 
                 # Ejecutar restauración
-                resultado = qdrant_manager.restaurar_coleccion(ruta_backup, recrear_coleccion)
+                resultado = qdrant_manager.restaurar_coleccion(ruta_backup, recrear_coleccion, self._emitir_progreso_restore)
 
                 self.progreso_actualizado.emit(100, "Restauración completada")
                 self.procesamiento_completado.emit(resultado)
@@ -119,7 +248,7 @@ class WorkerThread(QThread):
                 self.progreso_actualizado.emit(10, "Validando archivo de backup...")
 
                 # Ejecutar restauración
-                resultado = db_manager.restaurar_coleccion(ruta_backup, eliminar_existente)
+                resultado = db_manager.restaurar_coleccion(ruta_backup, eliminar_existente, self._emitir_progreso_restore)
 
                 self.progreso_actualizado.emit(100, "Restauración completada")
                 self.procesamiento_completado.emit(resultado)
@@ -129,14 +258,14 @@ class WorkerThread(QThread):
                 busqueda_recursiva = self.args[1]
                 solo_nuevas = self.args[2]
                 db_manager = self.args[3]
-                cancel_callback = self.args[4] if len(self.args) > 4 else None
+                cancel_callback = self.cancel_callback
 
                 # Simular progreso inicial
                 self.progreso_actualizado.emit(10, "Analizando directorio...")
 
                 # Verificar cancelación antes de empezar
                 if cancel_callback and cancel_callback():
-                    print("🚫 CANCELACIÓN DETECTADA ANTES DE EMPEZAR - Buscar Imágenes")
+                    logger.debug("Cancelación detectada antes de empezar: %s", self.funcion)
                     self.progreso_actualizado.emit(0, "Búsqueda cancelada")
                     return
 
@@ -146,6 +275,30 @@ class WorkerThread(QThread):
                 self.progreso_actualizado.emit(100, "Búsqueda completada")
                 self.procesamiento_completado.emit(resultado)
 
+            elif self.funcion == "procesar_pendientes":
+                db_manager = self.args[0]
+                buscador = self.args[1]
+
+                resultado = self._procesar_documentos_pendientes(db_manager, buscador)
+                self.procesamiento_completado.emit(resultado)
+
+            elif self.funcion == "deteccion_manual":
+                db_manager = self.args[0]
+                object_detector = self.args[1]
+                total = self.args[2]
+
+                _, BackgroundObjectProcessor = _clases_deteccion()
+                processor = BackgroundObjectProcessor(db_manager, object_detector)
+
+                def progreso_lote(estadisticas):
+                    vistos = estadisticas['procesadas'] + estadisticas['errores'] + estadisticas['sin_archivo']
+                    self.progreso_actualizado.emit(vistos, f"⏳ Procesadas {vistos}/{total} imágenes...")
+
+                resultado = processor.procesar_imagenes_sin_objetos_por_lotes(
+                    tamano_lote=64, cancel_callback=self.cancel_callback, progress_callback=progreso_lote
+                )
+                self.procesamiento_completado.emit(resultado)
+
             elif self.funcion == "procesar_imagenes":
                 imagenes = self.args[0]
                 db_manager = self.args[1]
@@ -189,7 +342,7 @@ class WorkerThread(QThread):
         try:
             # Verificar cancelación antes de empezar
             if cancel_callback and cancel_callback():
-                print("🚫 CANCELACIÓN DETECTADA ANTES DE EMPEZAR - Buscar Imágenes")
+                logger.debug("Cancelación detectada antes de empezar: %s", self.funcion)
                 resultado['cancelado'] = True
                 self.progreso_actualizado.emit(0, "Búsqueda cancelada")
                 return resultado
@@ -215,11 +368,12 @@ class WorkerThread(QThread):
                         archivos_imagen.append(os.path.join(directorio, file))
 
             resultado['total_encontradas'] = len(archivos_imagen)
+            self.total_conocido.emit(len(archivos_imagen))
             self.progreso_actualizado.emit(30, f"Encontradas {len(archivos_imagen)} imágenes")
 
             # Verificar cancelación después de encontrar archivos
             if cancel_callback and cancel_callback():
-                print("🚫 CANCELACIÓN DETECTADA - Buscar Imágenes")
+                logger.debug("Cancelación detectada durante la búsqueda de imágenes")
                 resultado['cancelado'] = True
                 self.progreso_actualizado.emit(30, "Búsqueda cancelada")
                 return resultado
@@ -228,7 +382,7 @@ class WorkerThread(QThread):
             for i, ruta_imagen in enumerate(archivos_imagen):
                 # Verificar cancelación antes de procesar cada imagen
                 if cancel_callback and cancel_callback():
-                    print("🚫 CANCELACIÓN DETECTADA - Buscar Imágenes")
+                    logger.debug("Cancelación detectada durante la búsqueda de imágenes")
                     resultado['total_encontradas'] = i  # Actualizar con las procesadas hasta ahora
                     resultado['cancelado'] = True
                     self.progreso_actualizado.emit(progreso, "Búsqueda cancelada")
@@ -241,7 +395,7 @@ class WorkerThread(QThread):
                     # Verificar si ya existe en la base de datos (por hash o por ruta)
                     if solo_nuevas:
                         # Verificar primero por ruta exacta (más rápido)
-                        documento_por_ruta = db_manager.collection.find_one({"ruta": ruta_imagen})
+                        documento_por_ruta = db_manager.collection.find_one({"ruta": ruta_imagen}, {"_id": 1})
                         if documento_por_ruta:
                             resultado['ya_procesadas'] += 1
                             resultado['omitidas_por_ruta'] += 1
@@ -249,7 +403,7 @@ class WorkerThread(QThread):
                             continue
 
                         # Verificar también por hash SHA512 (por si la imagen se movió)
-                        documento_por_hash = db_manager.collection.find_one({"hash_sha512": hash_sha512})
+                        documento_por_hash = db_manager.collection.find_one({"hash_sha512": hash_sha512}, {"_id": 1})
                         if documento_por_hash:
                             resultado['ya_procesadas'] += 1
                             resultado['omitidas_por_hash'] += 1
@@ -352,40 +506,62 @@ class WorkerThread(QThread):
 
         return resultado
 
-    def _procesar_imagenes_batch(self, imagenes: list, db_manager):
-        """Procesar un lote de imágenes."""
-        import hashlib
-        from datetime import datetime
-
+    def _procesar_imagenes_batch(self, imagenes: list, db_manager, tamano_lote: int = 500):
+        """Procesar un lote de imágenes insertándolas en MongoDB por bloques."""
         resultado = {
             'procesadas': 0,
             'errores': 0,
+            'duplicadas': 0,
             'insertadas': 0
         }
 
+        # Código de MongoDB para clave duplicada (índice único)
+        codigo_duplicado = 11000
+
         try:
             total_imagenes = len(imagenes)
 
-            for i, imagen in enumerate(imagenes):
-                try:
-                    # Verificar si la ruta ya existe antes de insertar
-                    ruta_imagen = imagen.get('ruta')
-                    if db_manager.verificar_ruta_existente(ruta_imagen):
-                        self.progreso_actualizado.emit(progreso, f"Imagen ya existe (ruta): {imagen.get('nombre', 'unknown')}")
-                        continue
-
-                    # Insertar documento en MongoDB
-                    db_manager.collection.insert_one(imagen)
-                    resultado['insertadas'] += 1
-                    resultado['procesadas'] += 1
-
-                except Exception as e:
-                    resultado['errores'] += 1
-                    continue
+            for inicio in range(0, total_imagenes, tamano_lote):
+                bloque = imagenes[inicio:inicio + tamano_lote]
 
-                # Actualizar progreso
-                progreso = 10 + int((i + 1) / total_imagenes * 80)
-                self.progreso_actualizado.emit(progreso, f"Procesando imagen {i + 1}/{total_imagenes}")
+                rutas = [imagen.get('ruta') for imagen in bloque]
+                rutas_existentes = set()
+                insertadas = 0
+                try:
+                    # Descartar en una sola consulta las rutas que ya existen
+                    rutas_existentes = {
+                        doc['ruta'] for doc in db_manager.collection.find({"ruta": {"$in": rutas}}, {"ruta": 1, "_id": 0})
+                    }
+                    nuevas = [imagen for imagen in bloque if imagen.get('ruta') not in rutas_existentes]
+
+                    # Insertar el bloque; sin orden para que un duplicado no detenga el resto
+                    if nuevas:
+                        insertadas = len(db_manager.collection.insert_many(nuevas, ordered=False).inserted_ids)
+                except BulkWriteError as e:
+                    insertadas = e.details.get('nInserted', 0)
+                    for error in e.details.get('writeErrors', []):
+                        if error.get('code') == codigo_duplicado:
+                            resultado['duplicadas'] += 1
+                        else:
+                            resultado['errores'] += 1
+                except PyMongoError as e:
+                    # Fallo del bloque completo (red, timeout...): contarlo y seguir con el siguiente
+                    logger.warning("Error insertando el bloque %d-%d: %s", inicio, inicio + len(bloque), e)
+                    resultado['errores'] += len(bloque) - len(rutas_existentes)
+
+                if insertadas:
+                    db_manager.ajustar_pendientes_objetos(insertadas)
+                resultado['insertadas'] += insertadas
+                resultado['procesadas'] += insertadas
+
+                # Actualizar progreso una vez por bloque
+                procesadas = inicio + len(bloque)
+                progreso = 10 + int(procesadas / total_imagenes * 80)
+                self.progreso_actualizado.emit(
+                    progreso,
+                    f"Procesando imagen {procesadas}/{total_imagenes} "
+                    f"({len(rutas_existentes)} ya existentes en el bloque)"
+                )
 
             self.progreso_actualizado.emit(90, "Finalizando procesamiento...")
 
@@ -394,6 +570,42 @@ class WorkerThread(QThread):
 
         return resultado
 
+    def _procesar_documentos_pendientes(self, db_manager, buscador, limite: int = 10):
+        """Procesar documentos que no tienen embedding."""
+        resultado = {
+            'total': 0,
+            'procesados': 0,
+            'errores': 0
+        }
+
+        # Obtener documentos sin procesar completos en una sola consulta
+        documentos_pendientes = list(db_manager.collection.find(
+            {"$or": [
+                {"objeto_procesado": False},
+                {"embedding": {"$exists": False}}
+            ]}
+        ).batch_size(64).limit(limite))
+
+        total = len(documentos_pendientes)
+        resultado['total'] = total
+        if not total:
+            return resultado
+
+        self.progreso_actualizado.emit(0, f"Iniciando procesamiento de {total} documentos...")
+
+        for i, doc_data in enumerate(documentos_pendientes, start=1):
+            try:
+                documento = ImagenDocumento(**doc_data)
+                documento.ensure_id_hash()
+                buscador.procesar_documento(documento, None)  # Sin callback para procesamiento individual
+                resultado['procesados'] += 1
+                self.progreso_actualizado.emit(i, f"✓ Procesado: {documento.nombre}")
+            except Exception as e:
+                resultado['errores'] += 1
+                self.progreso_actualizado.emit(i, f"✗ Error procesando {doc_data.get('nombre', 'desconocido')}: {str(e)}")
+
+        return resultado
+
     def _calcular_hash_imagen(self, ruta_imagen: str) -> str:
         """Calcular hash SHA512 de una imagen."""
         import hashlib
@@ -426,17 +638,245 @@ class WorkerThread(QThread):
             return None
 
 
+class BatchSignals(QObject):
+    """Puente de señales entre los BatchRunnable del pool y la interfaz."""
+
+    plan_listo = Signal(int, int)  # (total de documentos, total de lotes)
+    progreso = Signal(int, int)  # (exitosos, errores) del documento recién procesado
+    lote_terminado = Signal()
+    error_ocurrido = Signal(str)
+
+
+class BatchRunnable(QRunnable):
+    """Tarea del pool que procesa un lote de documentos de la colección."""
+
+    def __init__(self, batch_processor, documentos, senales, cancel_event):
+        super().__init__()
+        self.batch_processor = batch_processor
+        self.documentos = documentos
+        self.senales = senales
+        self.cancel_event = cancel_event
+
+    def run(self):
+        """Procesar el lote comprobando la cancelación entre documentos."""
+        try:
+            for documento in self.documentos:
+                if self.cancel_event.is_set():
+                    break
+                if self.batch_processor.procesar_documento(documento, self.cancel_event.is_set):
+                    self.senales.progreso.emit(1, 0)
+                else:
+                    self.senales.progreso.emit(0, 1)
+        finally:
+            self.senales.lote_terminado.emit()
+
+
 class MainWindow(QMainWindow):
     """Ventana principal de la aplicación."""
 
+    # Nombre sugerido y título del diálogo de selección de archivo por tipo de backup;
+    # los backups se comprimen con zstandard cuando está instalado
+    _EXTENSION_BACKUP = ".json.zst" if ZSTD_AVAILABLE else ".json"
+    _PLANTILLAS_NOMBRE_BACKUP = {
+        "Qdrant": ("backup_qdrant_imagenes_semanticas_{ts}" + _EXTENSION_BACKUP, "Seleccionar archivo de backup Qdrant"),
+        "MongoDB": ("backup_mongodb_imagenes_2_{ts}" + _EXTENSION_BACKUP, "Seleccionar archivo de backup MongoDB"),
+    }
+
+    # Hojas de estilo de la pestaña de búsqueda de imágenes, construidas una sola vez
+    _ESTILO_DIRECTORIO_INPUT = """
+        QLineEdit {
+            background: #0F0F0F;
+            color: #FFFFFF;
+            font-size: 16px;
+            padding: 15px 18px;
+            border: 3px solid #5A6578;
+            border-radius: 15px;
+            selection-background-color: #5A6578;
+            selection-color: #FFFFFF;
+        }
+        QLineEdit:focus {
+            border: 3px solid #8190A6;
+            background: #0F0F0F;
+        }
+        QLineEdit:hover {
+            border: 3px solid #8190A6;
+        }
+    """
+
+    _ESTILO_BOTON_NARANJA = """
+        QPushButton {
+            background: #F57C00;
+            color: #FFFFFF;
+            font-weight: bold;
+            font-size: 14px;
+            padding: 12px 24px;
+            border-radius: 20px;
+            border: 3px solid #FF9800;
+        }
+        QPushButton:hover {
+            background: #E65100;
+            border: 3px solid #FFB74D;
+        }
+        QPushButton:pressed {
+            background: #BF360C;
+            border: 3px solid #F57C00;
+        }
+    """
+
+    _ESTILO_BOTON_GRIS = """
+        QPushButton {
+            background: #2D3748;
+            color: #FFFFFF;
+            font-weight: bold;
+            font-size: 14px;
+            padding: 12px 24px;
+            border-radius: 20px;
+            border: 3px solid #4A5568;
+        }
+        QPushButton:hover {
+            background: #4A5568;
+            border: 3px solid #718096;
+        }
+        QPushButton:pressed {
+            background: #1A202C;
+            border: 3px solid #2D3748;
+        }
+    """
+
+    _ESTILO_BOTON_GRIS_DESACTIVABLE = """
+        QPushButton {
+            background: #2D3748;
+            color: #FFFFFF;
+            font-weight: bold;
+            font-size: 14px;
+            padding: 12px 24px;
+            border-radius: 20px;
+            border: 3px solid #4A5568;
+        }
+        QPushButton:hover {
+            background: #4A5568;
+            border: 3px solid #718096;
+        }
+        QPushButton:pressed {
+            background: #1A202C;
+            border: 3px solid #2D3748;
+        }
+        QPushButton:disabled {
+            background: #1A1A1A;
+            color: #FFFFFF;
+            border: 3px solid #4A5568;
+        }
+    """
+
+    _ESTILO_BOTON_LIMPIAR = """
+        QPushButton {
+            background: #4A5568;
+            color: #FFFFFF;
+            font-weight: bold;
+            font-size: 14px;
+            padding: 12px 24px;
+            border-radius: 20px;
+            border: 3px solid #718096;
+        }
+        QPushButton:hover {
+            background: #2D3748;
+            border: 3px solid #4A5568;
+        }
+        QPushButton:pressed {
+            background: #1A202C;
+            border: 3px solid #2D3748;
+        }
+    """
+
+    _ESTILO_BOTON_CANCELAR = """
+        QPushButton {
+            background: #C53030;
+            color: #FFFFFF;
+            font-weight: bold;
+            font-size: 14px;
+            padding: 12px 24px;
+            border-radius: 20px;
+            border: 3px solid #E53E3E;
+        }
+        QPushButton:hover {
+            background: #9C1A1A;
+            border: 3px solid #C53030;
+        }
+        QPushButton:pressed {
+            background: #742A2A;
+            border: 3px solid #9C1A1A;
+        }
+        QPushButton:disabled {
+            background: #1A1A1A;
+            color: #FFFFFF;
+            border: 3px solid #4A5568;
+        }
+    """
+
+    _ESTILO_BARRA_PROGRESO = """
+        QProgressBar {
+            border: 2px solid #4A5568;
+            border-radius: 10px;
+            background: #1A1A1A;
+            color: #FFFFFF;
+            font-size: 12px;
+            font-weight: bold;
+            text-align: center;
+        }
+        QProgressBar::chunk {
+            background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
+                          stop: 0 #718096, stop: 1 #4A5568);
+            border-radius: 8px;
+        }
+    """
+
+    _ESTILO_LOG_BUSQUEDA = """
+        QPlainTextEdit {
+            background: #0F0F0F;
+            color: #FFFFFF;
+            font-size: 13px;
+            font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
+            border: 3px solid #5A6578;
+            border-radius: 15px;
+            padding: 12px;
+            selection-background-color: #5A6578;
+            selection-color: #FFFFFF;
+        }
+        QPlainTextEdit:focus {
+            border: 3px solid #8190A6;
+            background: #0F0F0F;
+        }
+        QPlainTextEdit:hover {
+            border: 3px solid #8190A6;
+        }
+    """
+
     def __init__(self):
         super().__init__()
         self.db_manager = None
+        self.qdrant_manager = None
+        self.batch_processor = None
         self.buscador = None
         self.worker_thread = None
         self.system_initializer = None
-        self.cancelar_procesamiento_flag = False
-        self.cancelar_busqueda_flag = False
+        self.object_detector = None
+        self.busqueda_thread = None
+        self.procesamiento_thread = None
+        self.imagenes_encontradas = None
+        self.cancelar_procesamiento_event = threading.Event()
+        self.cancelar_busqueda_event = threading.Event()
+        self.cancelar_deteccion_event = threading.Event()
+        self.deteccion_thread = None
+        self._senales_lote = None
+        self._stats_cache = {}
+        self._nivel_log_backup = logging.INFO
+        self._titulo_opciones_pendiente = None
+        # Cuadros de mensaje reutilizados en lugar de crear uno por aviso
+        self._caja_info = QMessageBox(QMessageBox.Information, "", "", QMessageBox.Ok, self)
+        self._caja_advertencia = QMessageBox(QMessageBox.Warning, "", "", QMessageBox.Ok, self)
+        self._caja_critico = QMessageBox(QMessageBox.Critical, "", "", QMessageBox.Ok, self)
+        # Miniaturas ya decodificadas, por instancia para acotar la memoria
+        self._cargar_miniatura = lru_cache(maxsize=128)(self._decodificar_miniatura)
 
         self.setWindowTitle("Búsqueda Semántica V2")
         self.setGeometry(100, 100, 1200, 800)
@@ -455,7 +895,49 @@ class MainWindow(QMainWindow):
             self.buscador = BuscadorSemantico(self.db_manager, self.qdrant_manager)
 
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error al inicializar el sistema: {str(e)}")
+            self._mensaje_critico("Error", f"Error al inicializar el sistema: {str(e)}")
+
+    def _mostrar_caja(self, caja: QMessageBox, titulo: str, mensaje: str, bloquear: bool = True):
+        """Mostrar un aviso reutilizando el cuadro de mensaje de su severidad.
+
+        Con bloquear=False el cuadro se abre sin esperar a que el usuario lo
+        cierre, de modo que el bucle de eventos sigue atendiendo señales.
+        """
+        if caja.isVisible():
+            # El cuadro ya está abierto: mostrar este aviso en uno nuevo
+            caja = QMessageBox(caja.icon(), titulo, mensaje, QMessageBox.Ok, self)
+            caja.setAttribute(Qt.WA_DeleteOnClose)
+        else:
+            caja.setWindowTitle(titulo)
+            caja.setText(mensaje)
+
+        if bloquear:
+            caja.exec()
+        else:
+            caja.open()
+
+    @staticmethod
+    @contextmanager
+    def _sin_repintado(widget: QWidget):
+        """Suspender el repintado del widget mientras se le añaden varias líneas."""
+        widget.setUpdatesEnabled(False)
+        try:
+            yield widget
+        finally:
+            widget.setUpdatesEnabled(True)
+            widget.update()
+
+    def _mensaje_info(self, titulo: str, mensaje: str, bloquear: bool = True):
+        """Mostrar un mensaje informativo."""
+        self._mostrar_caja(self._caja_info, titulo, mensaje, bloquear)
+
+    def _mensaje_advertencia(self, titulo: str, mensaje: str, bloquear: bool = True):
+        """Mostrar una advertencia."""
+        self._mostrar_caja(self._caja_advertencia, titulo, mensaje, bloquear)
+
+    def _mensaje_critico(self, titulo: str, mensaje: str, bloquear: bool = True):
+        """Mostrar un error crítico."""
+        self._mostrar_caja(self._caja_critico, titulo, mensaje, bloquear)
 
     def _crear_interfaz(self):
         """Crear la interfaz de usuario."""
@@ -510,26 +992,26 @@ class MainWindow(QMainWindow):
         self.tab_estadisticas = self._crear_pestana_estadisticas()
         self.tab_widget.addTab(self.tab_estadisticas, "Estadísticas")
 
+        # Las pestañas menos usadas se construyen al seleccionarlas por primera vez
+        self._constructores_pestanas = {}
+
         # Pestaña de configuración
-        self.tab_configuracion = self._crear_pestana_configuracion()
-        self.tab_widget.addTab(self.tab_configuracion, "Configuración")
+        self._agregar_pestana_diferida("tab_configuracion", "Configuración", self._crear_pestana_configuracion)
 
         # Pestaña de procesamiento por lotes
         self.tab_procesamiento = self._crear_pestana_procesamiento()
         self.tab_widget.addTab(self.tab_procesamiento, "Procesar Colección")
 
         # Pestaña de detección de objetos
-        self.tab_deteccion = self._crear_pestana_deteccion_objetos()
-        self.tab_widget.addTab(self.tab_deteccion, "Detección de Objetos")
+        self._agregar_pestana_diferida("tab_deteccion", "Detección de Objetos", self._crear_pestana_deteccion_objetos)
 
         # Pestaña de backup/restore
-        self.tab_backup = self._crear_pestana_backup_restore()
-        self.tab_widget.addTab(self.tab_backup, "Backup/Restore")
+        self._agregar_pestana_diferida("tab_backup", "Backup/Restore", self._crear_pestana_backup_restore)
 
         # Pestaña de búsqueda de imágenes
-        self.tab_buscar_imagenes = self._crear_pestana_buscar_imagenes()
-        self.tab_widget.addTab(self.tab_buscar_imagenes, "Buscar Imágenes")
+        self._agregar_pestana_diferida("tab_buscar_imagenes", "Buscar Imágenes", self._crear_pestana_buscar_imagenes)
 
+        self.tab_widget.currentChanged.connect(self._al_cambiar_pestana)
         layout.addWidget(self.tab_widget)
 
         # Barra de progreso
@@ -557,6 +1039,44 @@ class MainWindow(QMainWindow):
         # Actualizar estado inicial de backup después de crear todas las pestañas
         # Se actualizará automáticamente cuando se cambie el tipo de backup
 
+    def _agregar_pestana_diferida(self, atributo: str, titulo: str, constructor):
+        """Añadir una pestaña vacía cuyo contenido se crea al visitarla."""
+        setattr(self, atributo, None)
+        indice = self.tab_widget.addTab(QWidget(), titulo)
+        self._constructores_pestanas[indice] = (atributo, titulo, constructor)
+
+    def _al_cambiar_pestana(self, indice: int):
+        """Construir la pestaña seleccionada si hace falta y aplicar cambios diferidos."""
+        entrada = self._constructores_pestanas.pop(indice, None)
+        if entrada is not None:
+            self._construir_pestana(indice, *entrada)
+
+        pestana = self.tab_widget.widget(indice)
+        if self.tab_backup is not None and pestana is self.tab_backup:
+            self._aplicar_titulo_opciones_pendiente()
+
+        # Las estadísticas solo se consultan cuando su pestaña está a la vista
+        if pestana is self.tab_estadisticas:
+            self._actualizar_estadisticas()
+        elif pestana is self.tab_procesamiento:
+            self._volcar_log_procesamiento()
+            if self.batch_processor is not None:
+                self._actualizar_estadisticas_procesamiento()
+
+    def _construir_pestana(self, indice: int, atributo: str, titulo: str, constructor):
+        """Crear una pestaña diferida y sustituir su marcador."""
+        pestana = constructor()
+        setattr(self, atributo, pestana)
+
+        # Sustituir el marcador sin volver a disparar currentChanged
+        marcador = self.tab_widget.widget(indice)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(indice)
+        self.tab_widget.insertTab(indice, pestana, titulo)
+        self.tab_widget.setCurrentIndex(indice)
+        self.tab_widget.blockSignals(False)
+        marcador.deleteLater()
+
     def _crear_pestana_busqueda(self) -> QWidget:
         """Crear pestaña de búsqueda."""
         widget = QWidget()
@@ -755,8 +1275,7 @@ class MainWindow(QMainWindow):
         self.limpiar_btn.clicked.connect(self._limpiar_resultados)
         self.limpiar_btn.setStyleSheet("""
             QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #8190A6, stop: 1 #5A6578);
+                background: #5A6578;
                 color: #FFFFFF;
                 font-weight: bold;
                 font-size: 16px;
@@ -765,13 +1284,11 @@ class MainWindow(QMainWindow):
                 border: 4px solid #8190A6;
             }
             QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #5A6578, stop: 1 #3D4758);
+                background: #3D4758;
                 border: 4px solid #5A6578;
             }
             QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #3D4758, stop: 1 #2A303C);
+                background: #2A303C;
                 border: 4px solid #3D4758;
             }
         """)
@@ -810,16 +1327,23 @@ class MainWindow(QMainWindow):
         layout_resultados = QVBoxLayout(grupo_resultados)
 
         # Tabla de resultados
-        self.resultados_table = QTableWidget(0, 5)
-        self.resultados_table.setHorizontalHeaderLabels([
-            "Nombre", "Ubicación", "Objetos", "Similitud", "Tipo"
-        ])
-        self.resultados_table.horizontalHeader().setStretchLastSection(True)
+        self.resultados_model = ResultadosTableModel(self)
+        self.resultados_table = QTableView()
+        self.resultados_table.setModel(self.resultados_model)
+
+        # Tamaños de sección fijos para evitar medir el contenido de cada fila
+        cabecera = self.resultados_table.horizontalHeader()
+        cabecera.setSectionResizeMode(QHeaderView.Interactive)
+        cabecera.setDefaultSectionSize(150)
+        cabecera.setStretchLastSection(True)
+        cabecera_vertical = self.resultados_table.verticalHeader()
+        cabecera_vertical.setSectionResizeMode(QHeaderView.Fixed)
+        cabecera_vertical.setDefaultSectionSize(24)
         self.resultados_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.resultados_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.resultados_table.doubleClicked.connect(self._mostrar_detalle_imagen)
         self.resultados_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background: #0F0F0F;
                 color: #FFFFFF;
                 gridline-color: #5A6578;
@@ -829,11 +1353,11 @@ class MainWindow(QMainWindow):
                 selection-color: #FFFFFF;
                 font-size: 13px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 border: none;
                 padding: 10px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background: #5A6578;
                 color: #FFFFFF;
             }
@@ -847,7 +1371,7 @@ class MainWindow(QMainWindow):
                 border-radius: 10px;
                 margin: 3px;
             }
-            QTableWidget QTableCornerButton::section {
+            QTableView QTableCornerButton::section {
                 background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
                               stop: 0 #5A6578, stop: 1 #3D4758);
                 border: none;
@@ -926,12 +1450,11 @@ class MainWindow(QMainWindow):
 
         self.info_imagen = QLabel("Sin información")
         self.info_imagen.setWordWrap(True)
+        self.info_imagen.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.info_imagen.setFixedWidth(320)
         self.info_imagen.setMinimumHeight(100)
         self.info_imagen.setMaximumHeight(200)
-        size_policy = self.info_imagen.sizePolicy()
-        size_policy.setHorizontalPolicy(QSizePolicy.Expanding)
-        size_policy.setVerticalPolicy(QSizePolicy.Minimum)
-        self.info_imagen.setSizePolicy(size_policy)
+        self.info_imagen.setSizePolicy(_size_policy(QSizePolicy.Expanding, QSizePolicy.Minimum))
         self.info_imagen.setAlignment(Qt.AlignCenter)
         self.info_imagen.setStyleSheet("""
             QLabel {
@@ -947,64 +1470,7 @@ class MainWindow(QMainWindow):
             }
         """)
 
-        # Crear scroll area para la información
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setWidget(self.info_imagen)
-        scroll_area.setMinimumHeight(100)
-        scroll_area.setMaximumHeight(200)
-        scroll_area.setMinimumWidth(320)
-        scroll_area.setMaximumWidth(320)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: 3px solid #5A6578;
-                border-radius: 15px;
-                background: #0F0F0F;
-            }
-            QScrollBar:vertical {
-                border: 2px solid #5A6578;
-                background: #0F0F0F;
-                width: 20px;
-                margin: 4px;
-                border-radius: 10px;
-            }
-            QScrollBar::handle:vertical {
-                background: #5A6578;
-                border-radius: 10px;
-                min-height: 25px;
-                border: 2px solid #8190A6;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: #8190A6;
-                border: 2px solid #5A6578;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: transparent;
-                height: 0px;
-            }
-            QScrollBar:horizontal {
-                border: 2px solid #5A6578;
-                background: #0F0F0F;
-                height: 20px;
-                margin: 4px;
-                border-radius: 10px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #5A6578;
-                border-radius: 10px;
-                min-width: 25px;
-                border: 2px solid #8190A6;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background: #8190A6;
-                border: 2px solid #5A6578;
-            }
-        """)
-
-        layout_info.addWidget(scroll_area)
+        layout_info.addWidget(self.info_imagen)
         layout_centrado.addWidget(contenedor_info)
 
         layout_preview.addWidget(contenedor_centrado)
@@ -1027,13 +1493,13 @@ class MainWindow(QMainWindow):
         grupo_general = QGroupBox("Información General")
         layout_general = QFormLayout(grupo_general)
 
-        self.total_docs_label = QLabel("0")
+        self.total_docs_label = QLabel(_TEXTO_CERO)
         layout_general.addRow("Total de documentos:", self.total_docs_label)
 
-        self.docs_procesados_label = QLabel("0")
+        self.docs_procesados_label = QLabel(_TEXTO_CERO)
         layout_general.addRow("Documentos procesados:", self.docs_procesados_label)
 
-        self.docs_con_embedding_label = QLabel("0")
+        self.docs_con_embedding_label = QLabel(_TEXTO_CERO)
         layout_general.addRow("Documentos con embedding:", self.docs_con_embedding_label)
 
         self.tasa_procesamiento_label = QLabel("0%")
@@ -1048,8 +1514,7 @@ class MainWindow(QMainWindow):
         self.actualizar_stats_btn.clicked.connect(self._actualizar_estadisticas)
         self.actualizar_stats_btn.setStyleSheet("""
             QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
+                background: #2D3748;
                 color: #FFFFFF;
                 font-weight: bold;
                 font-size: 14px;
@@ -1058,13 +1523,11 @@ class MainWindow(QMainWindow):
                 border: 3px solid #4A5568;
             }
             QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
+                background: #4A5568;
                 border: 3px solid #718096;
             }
             QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
+                background: #1A202C;
                 border: 3px solid #2D3748;
             }
         """)
@@ -1074,8 +1537,7 @@ class MainWindow(QMainWindow):
         self.procesar_docs_btn.clicked.connect(self._procesar_documentos_pendientes)
         self.procesar_docs_btn.setStyleSheet("""
             QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
+                background: #2D3748;
                 color: #FFFFFF;
                 font-weight: bold;
                 font-size: 14px;
@@ -1084,13 +1546,11 @@ class MainWindow(QMainWindow):
                 border: 3px solid #4A5568;
             }
             QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
+                background: #4A5568;
                 border: 3px solid #718096;
             }
             QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
+                background: #1A202C;
                 border: 3px solid #2D3748;
             }
         """)
@@ -1102,10 +1562,12 @@ class MainWindow(QMainWindow):
         grupo_log = QGroupBox("Log de Procesamiento")
         layout_log = QVBoxLayout(grupo_log)
 
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
+        self.log_text.setMaximumBlockCount(5000)
+        self.log_text.setUndoRedoEnabled(False)
         self.log_text.setMaximumHeight(200)
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background: #0F0F0F;
                 color: #FFFFFF;
                 font-size: 13px;
@@ -1116,11 +1578,11 @@ class MainWindow(QMainWindow):
                 selection-background-color: #5A6578;
                 selection-color: #FFFFFF;
             }
-            QTextEdit:focus {
+            QPlainTextEdit:focus {
                 border: 3px solid #8190A6;
                 background: #0F0F0F;
             }
-            QTextEdit:hover {
+            QPlainTextEdit:hover {
                 border: 3px solid #8190A6;
             }
         """)
@@ -1264,8 +1726,7 @@ class MainWindow(QMainWindow):
         self.guardar_config_btn.clicked.connect(self._guardar_configuracion)
         self.guardar_config_btn.setStyleSheet("""
             QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
+                background: #2D3748;
                 color: #FFFFFF;
                 font-weight: bold;
                 font-size: 14px;
@@ -1274,13 +1735,11 @@ class MainWindow(QMainWindow):
                 border: 3px solid #4A5568;
             }
             QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
+                background: #4A5568;
                 border: 3px solid #718096;
             }
             QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
+                background: #1A202C;
                 border: 3px solid #2D3748;
             }
         """)
@@ -1290,8 +1749,7 @@ class MainWindow(QMainWindow):
         self.probar_conexion_btn.clicked.connect(self._probar_conexiones)
         self.probar_conexion_btn.setStyleSheet("""
             QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
+                background: #2D3748;
                 color: #FFFFFF;
                 font-weight: bold;
                 font-size: 14px;
@@ -1300,13 +1758,11 @@ class MainWindow(QMainWindow):
                 border: 3px solid #4A5568;
             }
             QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
+                background: #4A5568;
                 border: 3px solid #718096;
             }
             QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
+                background: #1A202C;
                 border: 3px solid #2D3748;
             }
         """)
@@ -1345,16 +1801,16 @@ class MainWindow(QMainWindow):
         grupo_stats = QGroupBox("Estadísticas de la Colección")
         layout_stats = QFormLayout(grupo_stats)
 
-        self.total_docs_label = QLabel("0")
+        self.total_docs_label = QLabel(_TEXTO_CERO)
         layout_stats.addRow("Total documentos:", self.total_docs_label)
 
-        self.docs_sin_procesar_label = QLabel("0")
+        self.docs_sin_procesar_label = QLabel(_TEXTO_CERO)
         layout_stats.addRow("Sin procesar:", self.docs_sin_procesar_label)
 
-        self.docs_procesados_label = QLabel("0")
+        self.docs_procesados_label = QLabel(_TEXTO_CERO)
         layout_stats.addRow("Procesados:", self.docs_procesados_label)
 
-        self.docs_en_qdrant_label = QLabel("0")
+        self.docs_en_qdrant_label = QLabel(_TEXTO_CERO)
         layout_stats.addRow("En Qdrant:", self.docs_en_qdrant_label)
 
         self.completitud_label = QLabel("0%")
@@ -1434,8 +1890,7 @@ class MainWindow(QMainWindow):
         self.actualizar_stats_btn.clicked.connect(self._actualizar_estadisticas_procesamiento)
         self.actualizar_stats_btn.setStyleSheet("""
             QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
+                background: #2D3748;
                 color: #FFFFFF;
                 font-weight: bold;
                 font-size: 14px;
@@ -1444,13 +1899,11 @@ class MainWindow(QMainWindow):
                 border: 3px solid #4A5568;
             }
             QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
+                background: #4A5568;
                 border: 3px solid #718096;
             }
             QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
+                background: #1A202C;
                 border: 3px solid #2D3748;
             }
         """)
@@ -1460,8 +1913,7 @@ class MainWindow(QMainWindow):
         self.procesar_btn.clicked.connect(self._procesar_coleccion_completa)
         self.procesar_btn.setStyleSheet("""
             QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
+                background: #2D3748;
                 color: #FFFFFF;
                 font-weight: bold;
                 font-size: 14px;
@@ -1470,13 +1922,11 @@ class MainWindow(QMainWindow):
                 border: 3px solid #4A5568;
             }
             QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
+                background: #4A5568;
                 border: 3px solid #718096;
             }
             QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
+                background: #1A202C;
                 border: 3px solid #2D3748;
             }
         """)
@@ -1486,8 +1936,7 @@ class MainWindow(QMainWindow):
         self.cancelar_btn.clicked.connect(self._cancelar_procesamiento)
         self.cancelar_btn.setStyleSheet("""
             QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
+                background: #2D3748;
                 color: #FFFFFF;
                 font-weight: bold;
                 font-size: 14px;
@@ -1496,13 +1945,11 @@ class MainWindow(QMainWindow):
                 border: 3px solid #4A5568;
             }
             QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
+                background: #4A5568;
                 border: 3px solid #718096;
             }
             QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
+                background: #1A202C;
                 border: 3px solid #2D3748;
             }
         """)
@@ -1545,11 +1992,13 @@ class MainWindow(QMainWindow):
         grupo_log = QGroupBox("Log de Procesamiento")
         layout_log = QVBoxLayout(grupo_log)
 
-        self.procesamiento_log = QTextEdit()
+        self.procesamiento_log = QPlainTextEdit()
+        self.procesamiento_log.setMaximumBlockCount(2000)
+        self.procesamiento_log.setUndoRedoEnabled(False)
         self.procesamiento_log.setMaximumHeight(200)
         self.procesamiento_log.setPlaceholderText("Los mensajes de procesamiento aparecerán aquí...")
         self.procesamiento_log.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background: #0F0F0F;
                 color: #FFFFFF;
                 font-size: 13px;
@@ -1560,20 +2009,49 @@ class MainWindow(QMainWindow):
                 selection-background-color: #5A6578;
                 selection-color: #FFFFFF;
             }
-            QTextEdit:focus {
+            QPlainTextEdit:focus {
                 border: 3px solid #8190A6;
                 background: #0F0F0F;
             }
-            QTextEdit:hover {
+            QPlainTextEdit:hover {
                 border: 3px solid #8190A6;
             }
         """)
+
+        # La barra y la etiqueta de progreso de los lotes se refrescan como mucho cada 100 ms
+        self._progreso_lotes_timer = QTimer(self)
+        self._progreso_lotes_timer.setSingleShot(True)
+        self._progreso_lotes_timer.setInterval(100)
+        self._progreso_lotes_timer.timeout.connect(self._aplicar_progreso_lotes)
+        # Líneas recibidas mientras la pestaña está oculta; se vuelcan al mostrarla
+        self._procesamiento_log_buffer = deque(maxlen=2000)
         layout_log.addWidget(self.procesamiento_log)
 
         layout.addWidget(grupo_log)
 
         return widget
 
+    def _log_procesamiento(self, mensaje: str):
+        """Añadir una línea al log de procesamiento, o guardarla si la pestaña está oculta."""
+        if not self.procesamiento_log.isVisible():
+            self._procesamiento_log_buffer.append(mensaje)
+            return
+        self._volcar_log_procesamiento()
+        self.procesamiento_log.appendPlainText(mensaje)
+
+    def _volcar_log_procesamiento(self):
+        """Escribir de una vez las líneas acumuladas mientras la pestaña estaba oculta."""
+        if self._procesamiento_log_buffer:
+            self.procesamiento_log.appendPlainText("\n".join(self._procesamiento_log_buffer))
+            self._procesamiento_log_buffer.clear()
+
+    def _crear_boton_oscuro(self, texto: str, slot, nombre_objeto: str) -> QPushButton:
+        """Crear un botón de acción con el estilo oscuro del tema."""
+        boton = QPushButton(texto)
+        boton.clicked.connect(slot)
+        boton.setObjectName(nombre_objeto)
+        return boton
+
     def _crear_pestana_deteccion_objetos(self) -> QWidget:
         """Crear pestaña de detección de objetos en segundo plano."""
         widget = QWidget()
@@ -1611,13 +2089,13 @@ class MainWindow(QMainWindow):
         self.deteccion_status_label = QLabel("No inicializado")
         layout_estado.addRow("Estado:", self.deteccion_status_label)
 
-        self.deteccion_documentos_pendientes_label = QLabel("0")
+        self.deteccion_documentos_pendientes_label = QLabel(_TEXTO_CERO)
         layout_estado.addRow("Imágenes pendientes:", self.deteccion_documentos_pendientes_label)
 
         self.deteccion_procesando_label = QLabel("No")
         layout_estado.addRow("Procesando:", self.deteccion_procesando_label)
 
-        self.deteccion_ultima_verificacion_label = QLabel("Nunca")
+        self.deteccion_ultima_verificacion_label = QLabel(_TEXTO_NUNCA)
         layout_estado.addRow("Última verificación:", self.deteccion_ultima_verificacion_label)
 
         layout.addWidget(grupo_estado)
@@ -1625,82 +2103,13 @@ class MainWindow(QMainWindow):
         # Botones de control
         botones_layout = QHBoxLayout()
 
-        self.actualizar_estado_btn = QPushButton("Actualizar Estado")
-        self.actualizar_estado_btn.clicked.connect(self._actualizar_estado_deteccion)
-        self.actualizar_estado_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #4A5568;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border: 3px solid #718096;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
-                border: 3px solid #2D3748;
-            }
-        """)
+        self.actualizar_estado_btn = self._crear_boton_oscuro("Actualizar Estado", self._actualizar_estado_deteccion, "actualizar_estado_btn")
         botones_layout.addWidget(self.actualizar_estado_btn)
 
-        self.procesar_manual_btn = QPushButton("Procesar Ahora")
-        self.procesar_manual_btn.clicked.connect(self._procesar_objetos_manual)
-        self.procesar_manual_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #4A5568;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border: 3px solid #718096;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
-                border: 3px solid #2D3748;
-            }
-        """)
+        self.procesar_manual_btn = self._crear_boton_oscuro("Procesar Ahora", self._procesar_objetos_manual, "procesar_manual_btn")
         botones_layout.addWidget(self.procesar_manual_btn)
 
-        self.detener_procesamiento_btn = QPushButton("Detener Procesamiento")
-        self.detener_procesamiento_btn.clicked.connect(self._detener_procesamiento)
-        self.detener_procesamiento_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #4A5568;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border: 3px solid #718096;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
-                border: 3px solid #2D3748;
-            }
-        """)
+        self.detener_procesamiento_btn = self._crear_boton_oscuro("Detener Procesamiento", self._detener_procesamiento, "detener_procesamiento_btn")
         botones_layout.addWidget(self.detener_procesamiento_btn)
 
         layout.addLayout(botones_layout)
@@ -1709,29 +2118,12 @@ class MainWindow(QMainWindow):
         grupo_log = QGroupBox("Log de Detección de Objetos")
         layout_log = QVBoxLayout(grupo_log)
 
-        self.deteccion_log = QTextEdit()
+        self.deteccion_log = QPlainTextEdit()
+        self.deteccion_log.setMaximumBlockCount(2000)
+        self.deteccion_log.setUndoRedoEnabled(False)
         self.deteccion_log.setMaximumHeight(200)
         self.deteccion_log.setPlaceholderText("Los mensajes de detección de objetos aparecerán aquí...")
-        self.deteccion_log.setStyleSheet("""
-            QTextEdit {
-                background: #1A1A1A;
-                color: #FFFFFF;
-                font-size: 12px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                border: 2px solid #4A5568;
-                border-radius: 12px;
-                padding: 10px;
-                selection-background-color: #4A5568;
-                selection-color: #FFFFFF;
-            }
-            QTextEdit:focus {
-                border: 2px solid #718096;
-                background: #1A1A1A;
-            }
-            QTextEdit:hover {
-                border: 2px solid #718096;
-            }
-        """)
+        self.deteccion_log.setObjectName("deteccion_log")
         layout_log.addWidget(self.deteccion_log)
 
         layout.addWidget(grupo_log)
@@ -1753,37 +2145,7 @@ class MainWindow(QMainWindow):
         self.backup_tipo_combo.addItems(["Qdrant", "MongoDB"])
         self.backup_tipo_combo.setCurrentText("Qdrant")  # Por defecto Qdrant
         self.backup_tipo_combo.currentTextChanged.connect(self._cambiar_tipo_backup)
-        self.backup_tipo_combo.setStyleSheet("""
-            QComboBox {
-                background: #0F0F0F;
-                color: #FFFFFF;
-                font-size: 16px;
-                padding: 12px 15px;
-                border: 3px solid #5A6578;
-                border-radius: 12px;
-                selection-background-color: #5A6578;
-                selection-color: #FFFFFF;
-            }
-            QComboBox:hover {
-                border: 3px solid #8190A6;
-            }
-            QComboBox::drop-down {
-                border: none;
-                background: #0F0F0F;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background: #0F0F0F;
-                color: #FFFFFF;
-                border: 3px solid #5A6578;
-                border-radius: 12px;
-                selection-background-color: #5A6578;
-                selection-color: #FFFFFF;
-            }
-        """)
+        self.backup_tipo_combo.setObjectName("backup_tipo_combo")
         selector_layout.addWidget(QLabel("Sistema:"))
         selector_layout.addWidget(self.backup_tipo_combo)
         selector_layout.addStretch()
@@ -1802,7 +2164,7 @@ class MainWindow(QMainWindow):
             "'imagenes_semanticas' de Qdrant y restaurarlas cuando sea necesario.\n\n"
             "Características:\n"
             "• Backup completo de todos los vectores y metadatos\n"
-            "• Formato JSON legible y portable\n"
+            "• Metadatos en JSON y vectores en un archivo .npy adjunto\n"
             "• Validación de integridad de archivos\n"
             "• Restauración con opción de recrear colección\n"
             "• Información detallada de operaciones realizadas"
@@ -1833,24 +2195,41 @@ class MainWindow(QMainWindow):
 
         # Información de la colección actual
         grupo_coleccion = QGroupBox("Estado de la Colección")
-        layout_coleccion = QFormLayout(grupo_coleccion)
+        self.grupo_coleccion_backup = grupo_coleccion
+        layout_coleccion = QVBoxLayout(grupo_coleccion)
 
-        # Labels para Qdrant
-        self.backup_total_vectores_label = QLabel("0")
-        layout_coleccion.addRow("Total de vectores:", self.backup_total_vectores_label)
+        # Filas para Qdrant
+        self.backup_filas_qdrant = QWidget()
+        layout_qdrant = QFormLayout(self.backup_filas_qdrant)
+        layout_qdrant.setContentsMargins(0, 0, 0, 0)
 
-        self.backup_tamano_vector_label = QLabel("0")
-        layout_coleccion.addRow("Tamaño del vector:", self.backup_tamano_vector_label)
+        self.backup_total_vectores_label = QLabel(_TEXTO_CERO)
+        layout_qdrant.addRow("Total de vectores:", self.backup_total_vectores_label)
 
-        # Labels para MongoDB
-        self.backup_total_documentos_label = QLabel("0")
-        layout_coleccion.addRow("Total de documentos:", self.backup_total_documentos_label)
+        self.backup_tamano_vector_label = QLabel(_TEXTO_CERO)
+        layout_qdrant.addRow("Tamaño del vector:", self.backup_tamano_vector_label)
 
-        self.backup_tamano_coleccion_label = QLabel("0")
-        layout_coleccion.addRow("Tamaño de la colección:", self.backup_tamano_coleccion_label)
+        layout_coleccion.addWidget(self.backup_filas_qdrant)
 
-        self.backup_ultimo_backup_label = QLabel("Nunca")
-        layout_coleccion.addRow("Último backup:", self.backup_ultimo_backup_label)
+        # Filas para MongoDB
+        self.backup_filas_mongodb = QWidget()
+        layout_mongodb = QFormLayout(self.backup_filas_mongodb)
+        layout_mongodb.setContentsMargins(0, 0, 0, 0)
+
+        self.backup_total_documentos_label = QLabel(_TEXTO_CERO)
+        layout_mongodb.addRow("Total de documentos:", self.backup_total_documentos_label)
+
+        self.backup_tamano_coleccion_label = QLabel(_TEXTO_CERO)
+        layout_mongodb.addRow("Tamaño de la colección:", self.backup_tamano_coleccion_label)
+
+        self.backup_filas_mongodb.setVisible(False)
+        layout_coleccion.addWidget(self.backup_filas_mongodb)
+
+        # Filas comunes
+        layout_comun = QFormLayout()
+        self.backup_ultimo_backup_label = QLabel(_TEXTO_NUNCA)
+        layout_comun.addRow("Último backup:", self.backup_ultimo_backup_label)
+        layout_coleccion.addLayout(layout_comun)
 
         layout.addWidget(grupo_coleccion)
 
@@ -1860,52 +2239,13 @@ class MainWindow(QMainWindow):
 
         self.backup_ruta_input = QLineEdit()
         self.backup_ruta_input.setPlaceholderText("Ej: /ruta/al/backup_imagenes_semanticas_2024.json")
-        self.backup_ruta_input.setStyleSheet("""
-            QLineEdit {
-                background: #1A1A1A;
-                color: #FFFFFF;
-                font-size: 14px;
-                padding: 12px 15px;
-                border: 2px solid #4A5568;
-                border-radius: 12px;
-                selection-background-color: #4A5568;
-                selection-color: #FFFFFF;
-            }
-            QLineEdit:focus {
-                border: 2px solid #718096;
-                background: #1A1A1A;
-            }
-            QLineEdit:hover {
-                border: 2px solid #718096;
-            }
-        """)
+        self.backup_ruta_input.setObjectName("backup_ruta_input")
         layout_config.addRow("Ruta del archivo:", self.backup_ruta_input)
 
         # Botón para seleccionar archivo
         self.backup_seleccionar_btn = QPushButton("Seleccionar Archivo")
         self.backup_seleccionar_btn.clicked.connect(self._seleccionar_archivo_backup)
-        self.backup_seleccionar_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #FF9800, stop: 1 #F57C00);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #FF9800;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #FF9800, stop: 1 #E65100);
-                border: 3px solid #FFB74D;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #F57C00, stop: 1 #BF360C);
-                border: 3px solid #F57C00;
-            }
-        """)
+        self.backup_seleccionar_btn.setObjectName("backup_seleccionar_btn")
         layout_config.addRow(self.backup_seleccionar_btn)
 
         layout.addWidget(grupo_config)
@@ -1913,88 +2253,20 @@ class MainWindow(QMainWindow):
         # Botones de acción
         botones_layout = QHBoxLayout()
 
-        self.backup_crear_btn = QPushButton("Crear Backup")
-        self.backup_crear_btn.clicked.connect(self._crear_backup)
-        self.backup_crear_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #4A5568;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border: 3px solid #718096;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
-                border: 3px solid #2D3748;
-            }
-        """)
+        self.backup_crear_btn = self._crear_boton_oscuro("Crear Backup", self._crear_backup, "backup_crear_btn")
         botones_layout.addWidget(self.backup_crear_btn)
 
-        self.backup_restaurar_btn = QPushButton("Restaurar Backup")
-        self.backup_restaurar_btn.clicked.connect(self._restaurar_backup)
-        self.backup_restaurar_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #4A5568;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border: 3px solid #718096;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
-                border: 3px solid #2D3748;
-            }
-        """)
+        self.backup_restaurar_btn = self._crear_boton_oscuro("Restaurar Backup", self._restaurar_backup, "backup_restaurar_btn")
         botones_layout.addWidget(self.backup_restaurar_btn)
 
-        self.backup_validar_btn = QPushButton("Validar Backup")
-        self.backup_validar_btn.clicked.connect(self._validar_backup)
-        self.backup_validar_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #4A5568;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border: 3px solid #718096;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
-                border: 3px solid #2D3748;
-            }
-        """)
+        self.backup_validar_btn = self._crear_boton_oscuro("Validar Backup", self._validar_backup, "backup_validar_btn")
         botones_layout.addWidget(self.backup_validar_btn)
 
         layout.addLayout(botones_layout)
 
         # Opciones adicionales
         grupo_opciones = QGroupBox("Opciones")
+        self.grupo_opciones_backup = grupo_opciones
         layout_opciones = QVBoxLayout(grupo_opciones)
 
         # Opción para Qdrant
@@ -2019,22 +2291,7 @@ class MainWindow(QMainWindow):
 
         self.backup_progress_bar = QProgressBar()
         self.backup_progress_bar.setVisible(False)
-        self.backup_progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #4A5568;
-                border-radius: 10px;
-                background: #1A1A1A;
-                color: #FFFFFF;
-                font-size: 12px;
-                font-weight: bold;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border-radius: 8px;
-            }
-        """)
+        self.backup_progress_bar.setObjectName("backup_progress_bar")
         layout_progreso.addWidget(self.backup_progress_bar)
 
         self.backup_progress_label = QLabel("Listo para operaciones de backup")
@@ -2047,92 +2304,110 @@ class MainWindow(QMainWindow):
         grupo_log = QGroupBox("Log de Backup/Restore")
         layout_log = QVBoxLayout(grupo_log)
 
-        self.backup_log = QTextEdit()
+        self.backup_log = QPlainTextEdit()
         self.backup_log.setMaximumHeight(200)
         self.backup_log.setPlaceholderText("Los mensajes de backup/restore aparecerán aquí...")
-        self.backup_log.setStyleSheet("""
-            QTextEdit {
-                background: #1A1A1A;
-                color: #FFFFFF;
-                font-size: 12px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                border: 2px solid #4A5568;
-                border-radius: 12px;
-                padding: 10px;
-                selection-background-color: #4A5568;
-                selection-color: #FFFFFF;
-            }
-            QTextEdit:focus {
-                border: 2px solid #718096;
-                background: #1A1A1A;
-            }
-            QTextEdit:hover {
-                border: 2px solid #718096;
-            }
-        """)
+        self.backup_log.setObjectName("backup_log")
+        self.backup_log.setMaximumBlockCount(5000)
+        self.backup_log.setUndoRedoEnabled(False)
+
+        # Las líneas del log se acumulan y se vuelcan juntas cada 50 ms
+        self._backup_log_buffer = []
+        self._backup_log_timer = QTimer(self)
+        self._backup_log_timer.setSingleShot(True)
+        self._backup_log_timer.setInterval(50)
+        self._backup_log_timer.timeout.connect(self._volcar_log_backup)
+
+        # La barra y la etiqueta de progreso se actualizan como mucho cada 100 ms
+        self._progreso_backup_pendiente = None
+        self._backup_progreso_timer = QTimer(self)
+        self._backup_progreso_timer.setSingleShot(True)
+        self._backup_progreso_timer.setInterval(100)
+        self._backup_progreso_timer.timeout.connect(self._aplicar_progreso_backup)
         layout_log.addWidget(self.backup_log)
 
         layout.addWidget(grupo_log)
 
         return widget
 
-    def _cambiar_tipo_backup(self, tipo: str):
-        """Cambiar entre tipos de backup (Qdrant/MongoDB)."""
-        if tipo == "Qdrant":
-            # Mostrar información de Qdrant
-            self.info_qdrant.setVisible(True)
-            self.info_mongodb.setVisible(False)
+    def _log_backup(self, mensaje: str, nivel: int = logging.INFO):
+        """Encolar una línea para el log de backup si su nivel supera el umbral."""
+        if nivel < self._nivel_log_backup or getattr(self, 'backup_log', None) is None:
+            return
+        self._backup_log_buffer.append(mensaje)
+        if not self._backup_log_timer.isActive():
+            self._backup_log_timer.start()
 
-            # Mostrar opciones de Qdrant
-            self.backup_recrear_checkbox.setVisible(True)
-            self.backup_eliminar_existente_checkbox.setVisible(False)
+    def _volcar_log_backup(self):
+        """Escribir de una vez las líneas pendientes en el log de backup."""
+        if not self._backup_log_buffer:
+            return
 
-            # Actualizar estado de Qdrant
-            self._actualizar_estado_backup_qdrant()
+        texto = "\n".join(self._backup_log_buffer)
+        self._backup_log_buffer.clear()
+        self.backup_log.appendPlainText(texto)
 
-        elif tipo == "MongoDB":
-            # Mostrar información de MongoDB
-            self.info_qdrant.setVisible(False)
-            self.info_mongodb.setVisible(True)
+        barra = self.backup_log.verticalScrollBar()
+        barra.setValue(barra.maximum())
 
-            # Mostrar opciones de MongoDB
-            self.backup_recrear_checkbox.setVisible(False)
-            self.backup_eliminar_existente_checkbox.setVisible(True)
+    def _limpiar_log_backup(self):
+        """Vaciar el log de backup y las líneas pendientes."""
+        self._backup_log_buffer.clear()
+        self.backup_log.clear()
 
-            # Actualizar estado de MongoDB
-            self._actualizar_estado_backup_mongodb()
+    def _cambiar_tipo_backup(self, tipo: str):
+        """Cambiar entre tipos de backup (Qdrant/MongoDB)."""
+        es_qdrant = tipo == "Qdrant"
 
-        # Actualizar el título del grupo de opciones
-        grupo_opciones = self.backup_recrear_checkbox.parent().parent()
-        if tipo == "Qdrant":
-            grupo_opciones.setTitle("Opciones de Qdrant")
+        # Alternar los widgets de cada sistema con un único repintado de la pestaña
+        pestana = self.tab_backup
+        pestana.setUpdatesEnabled(False)
+        try:
+            # Información, filas de estado y opciones del sistema elegido
+            self.info_qdrant.setVisible(es_qdrant)
+            self.info_mongodb.setVisible(not es_qdrant)
+            self.backup_filas_qdrant.setVisible(es_qdrant)
+            self.backup_filas_mongodb.setVisible(not es_qdrant)
+            self.backup_recrear_checkbox.setVisible(es_qdrant)
+            self.backup_eliminar_existente_checkbox.setVisible(not es_qdrant)
+
+            # El título del grupo de opciones solo se aplica con la pestaña visible
+            self._titulo_opciones_pendiente = "Opciones de Qdrant" if es_qdrant else "Opciones de MongoDB"
+            if self.tab_widget.currentWidget() is pestana:
+                self._aplicar_titulo_opciones_pendiente()
+        finally:
+            pestana.setUpdatesEnabled(True)
+
+        # Actualizar estado del sistema elegido
+        if es_qdrant:
+            self._actualizar_estado_backup_qdrant()
         else:
-            grupo_opciones.setTitle("Opciones de MongoDB")
+            self._actualizar_estado_backup_mongodb()
+
+    def _aplicar_titulo_opciones_pendiente(self):
+        """Aplicar el título del grupo de opciones que quedó pendiente."""
+        titulo = self._titulo_opciones_pendiente
+        if titulo is not None:
+            self.grupo_opciones_backup.setTitle(titulo)
+            self._titulo_opciones_pendiente = None
 
     def _seleccionar_archivo_backup(self):
         """Abrir diálogo para seleccionar archivo de backup."""
         from PySide6.QtWidgets import QFileDialog
 
-        tipo_backup = self.backup_tipo_combo.currentText()
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-        if tipo_backup == "Qdrant":
-            nombre_base = f"backup_qdrant_imagenes_semanticas_{timestamp}.json"
-            titulo = "Seleccionar archivo de backup Qdrant"
-        else:
-            nombre_base = f"backup_mongodb_imagenes_2_{timestamp}.json"
-            titulo = "Seleccionar archivo de backup MongoDB"
+        plantilla, titulo = self._PLANTILLAS_NOMBRE_BACKUP[self.backup_tipo_combo.currentText()]
+        nombre_base = plantilla.format(ts=datetime.now().strftime('%Y%m%d_%H%M%S'))
 
         archivo, _ = QFileDialog.getSaveFileName(
             self,
             titulo,
             nombre_base,
-            "Archivos JSON (*.json)"
+            "Archivos de backup (*.json *.json.zst)"
         )
 
         if archivo:
             self.backup_ruta_input.setText(archivo)
-            self.backup_log.append(f"✓ Archivo seleccionado: {archivo}")
+            self._log_backup(f"✓ Archivo seleccionado: {archivo}")
 
     def _actualizar_estado_backup_qdrant(self):
         """Actualizar información del estado de la colección Qdrant."""
@@ -2140,27 +2415,28 @@ class MainWindow(QMainWindow):
             if not self.qdrant_manager:
                 return
 
-            stats = self.qdrant_manager.obtener_estadisticas()
-
-            self.backup_total_vectores_label.setText(str(stats['total_vectors']))
-            self.backup_tamano_vector_label.setText(str(stats['vector_size']))
+            stats = self._obtener_estadisticas_cacheadas('qdrant', self.qdrant_manager.obtener_estadisticas)
+            total_vectores = stats['total_vectors']
+            tamano_vector = stats['vector_size']
 
-            # Ocultar labels de MongoDB
-            self.backup_total_documentos_label.setVisible(False)
-            self.backup_tamano_coleccion_label.setVisible(False)
+            # Agrupar los cambios de las etiquetas en un único repintado
+            grupo = self.grupo_coleccion_backup
+            grupo.setUpdatesEnabled(False)
+            try:
+                self.backup_total_vectores_label.setText(str(total_vectores))
+                self.backup_tamano_vector_label.setText(str(tamano_vector))
 
-            # Aquí podrías implementar lógica para mostrar el último backup
-            # Por ahora mostrar "No disponible"
-            self.backup_ultimo_backup_label.setText("No disponible")
+                # Aquí podrías implementar lógica para mostrar el último backup
+                # Por ahora mostrar "No disponible"
+                self.backup_ultimo_backup_label.setText(_TEXTO_NO_DISPONIBLE)
+            finally:
+                grupo.layout().activate()
+                grupo.setUpdatesEnabled(True)
 
-            # Verificar si backup_log existe antes de usarlo
-            if hasattr(self, 'backup_log'):
-                self.backup_log.append("✓ Estado de backup Qdrant actualizado correctamente")
+            self._log_backup("✓ Estado de backup Qdrant actualizado correctamente", logging.DEBUG)
 
         except Exception as e:
-            # Verificar si backup_log existe antes de usarlo
-            if hasattr(self, 'backup_log'):
-                self.backup_log.append(f"⚠ Error al actualizar estado Qdrant: {str(e)}")
+            self._log_backup(f"⚠ Error al actualizar estado Qdrant: {str(e)}", logging.WARNING)
 
     def _actualizar_estado_backup_mongodb(self):
         """Actualizar información del estado de la colección MongoDB."""
@@ -2168,31 +2444,38 @@ class MainWindow(QMainWindow):
             if not self.db_manager:
                 return
 
-            stats = self.db_manager.obtener_estadisticas()
+            stats = self._obtener_estadisticas_cacheadas('mongodb', self.db_manager.obtener_estadisticas)
+            total_documentos = stats['total_documentos']
+            tasa_procesamiento = stats['tasa_procesamiento']
 
-            # Mostrar labels de MongoDB
-            self.backup_total_documentos_label.setVisible(True)
-            self.backup_tamano_coleccion_label.setVisible(True)
-
-            self.backup_total_documentos_label.setText(str(stats['total_documentos']))
-            self.backup_tamano_coleccion_label.setText(f"{stats['tasa_procesamiento']:.1f}% procesados")
-
-            # Ocultar labels de Qdrant
-            self.backup_total_vectores_label.setVisible(False)
-            self.backup_tamano_vector_label.setVisible(False)
+            # Agrupar los cambios de las etiquetas en un único repintado
+            grupo = self.grupo_coleccion_backup
+            grupo.setUpdatesEnabled(False)
+            try:
+                self.backup_total_documentos_label.setText(str(total_documentos))
+                self.backup_tamano_coleccion_label.setText(f"{tasa_procesamiento:.1f}% procesados")
 
-            # Aquí podrías implementar lógica para mostrar el último backup
-            # Por ahora mostrar "No disponible"
-            self.backup_ultimo_backup_label.setText("No disponible")
+                # Aquí podrías implementar lógica para mostrar el último backup
+                # Por ahora mostrar "No disponible"
+                self.backup_ultimo_backup_label.setText(_TEXTO_NO_DISPONIBLE)
+            finally:
+                grupo.layout().activate()
+                grupo.setUpdatesEnabled(True)
 
-            # Verificar si backup_log existe antes de usarlo
-            if hasattr(self, 'backup_log'):
-                self.backup_log.append("✓ Estado de backup MongoDB actualizado correctamente")
+            self._log_backup("✓ Estado de backup MongoDB actualizado correctamente", logging.DEBUG)
 
         except Exception as e:
-            # Verificar si backup_log existe antes de usarlo
-            if hasattr(self, 'backup_log'):
-                self.backup_log.append(f"⚠ Error al actualizar estado MongoDB: {str(e)}")
+            self._log_backup(f"⚠ Error al actualizar estado MongoDB: {str(e)}", logging.WARNING)
+
+    def _obtener_estadisticas_cacheadas(self, clave: str, obtener, ttl: float = 2.0) -> dict:
+        """Obtener estadísticas reutilizando la última consulta si tiene menos de `ttl` segundos."""
+        ahora = time.monotonic()
+        cacheado = self._stats_cache.get(clave)
+        if cacheado and ahora - cacheado[0] < ttl:
+            return cacheado[1]
+        stats = obtener()
+        self._stats_cache[clave] = (ahora, stats)
+        return stats
 
     def _actualizar_estado_backup(self):
         """Actualizar información del estado de la colección (método legacy)."""
@@ -2208,7 +2491,7 @@ class MainWindow(QMainWindow):
             ruta_backup = self.backup_ruta_input.text().strip()
 
             if not ruta_backup:
-                QMessageBox.warning(self, "Error", "Seleccione una ruta para el archivo de backup")
+                self._mensaje_advertencia("Error", "Seleccione una ruta para el archivo de backup")
                 return
 
             tipo_backup = self.backup_tipo_combo.currentText()
@@ -2229,12 +2512,20 @@ class MainWindow(QMainWindow):
             if reply != QMessageBox.Yes:
                 return
 
+            # Rango determinado por el tamaño actual de la colección
+            if tipo_backup == "Qdrant":
+                total_items = self._obtener_estadisticas_cacheadas('qdrant', self.qdrant_manager.obtener_estadisticas)['total_vectors']
+            else:
+                total_items = self._obtener_estadisticas_cacheadas('mongodb', self.db_manager.obtener_estadisticas)['total_documentos']
+
             # Mostrar progreso
             self.backup_progress_bar.setVisible(True)
-            self.backup_progress_bar.setRange(0, 0)  # Indefinido
+            self.backup_progress_bar.setRange(0, max(total_items, 1))
+            self.backup_progress_bar.setValue(0)
+            self._last_progress_val = 0
             self.backup_progress_label.setText("Creando backup...")
-            self.backup_log.clear()
-            self.backup_log.append(f"🔄 Iniciando creación de backup de {tipo_backup}...")
+            self._limpiar_log_backup()
+            self._log_backup(f"🔄 Iniciando creación de backup de {tipo_backup}...")
 
             # Deshabilitar botones
             self.backup_crear_btn.setEnabled(False)
@@ -2252,8 +2543,16 @@ class MainWindow(QMainWindow):
             self.backup_thread.start()
 
         except Exception as e:
-            self.backup_log.append(f"❌ Error al iniciar backup: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Error al iniciar backup: {str(e)}")
+            self._log_backup(f"❌ Error al iniciar backup: {str(e)}")
+            self._mensaje_critico("Error", f"Error al iniciar backup: {str(e)}")
+
+    @staticmethod
+    def _stat_backup(ruta_backup: str) -> Optional[os.stat_result]:
+        """Obtener la información del archivo de backup, o None si no existe."""
+        try:
+            return os.stat(ruta_backup)
+        except OSError:
+            return None
 
     def _restaurar_backup(self):
         """Restaurar backup de la colección."""
@@ -2261,17 +2560,19 @@ class MainWindow(QMainWindow):
             ruta_backup = self.backup_ruta_input.text().strip()
 
             if not ruta_backup:
-                QMessageBox.warning(self, "Error", "Seleccione una ruta del archivo de backup")
+                self._mensaje_advertencia("Error", "Seleccione una ruta del archivo de backup")
                 return
 
-            if not os.path.exists(ruta_backup):
-                QMessageBox.warning(self, "Error", f"El archivo de backup no existe: {ruta_backup}")
+            info_archivo = self._stat_backup(ruta_backup)
+            if info_archivo is None:
+                self._mensaje_advertencia("Error", f"El archivo de backup no existe: {ruta_backup}")
                 return
 
             tipo_backup = self.backup_tipo_combo.currentText()
+            es_qdrant = tipo_backup == "Qdrant"
 
             # Confirmar restauración
-            if tipo_backup == "Qdrant":
+            if es_qdrant:
                 coleccion = self.qdrant_manager.collection_name
                 eliminar_existente = self.backup_recrear_checkbox.isChecked()
                 opcion_text = "La colección actual será eliminada y recreada. " if eliminar_existente else ""
@@ -2293,10 +2594,11 @@ class MainWindow(QMainWindow):
 
             # Mostrar progreso
             self.backup_progress_bar.setVisible(True)
-            self.backup_progress_bar.setRange(0, 0)  # Indefinido
+            self.backup_progress_bar.setRange(0, 100)
+            self.backup_progress_bar.setValue(0)
             self.backup_progress_label.setText("Restaurando backup...")
-            self.backup_log.clear()
-            self.backup_log.append(f"🔄 Iniciando restauración de backup de {tipo_backup}...")
+            self._limpiar_log_backup()
+            self._log_backup(f"🔄 Iniciando restauración de backup de {tipo_backup}...")
 
             # Deshabilitar botones
             self.backup_crear_btn.setEnabled(False)
@@ -2304,7 +2606,7 @@ class MainWindow(QMainWindow):
             self.backup_validar_btn.setEnabled(False)
 
             # Crear hilo de trabajo para la restauración
-            if tipo_backup == "Qdrant":
+            if es_qdrant:
                 self.restore_thread = WorkerThread("restore", self.qdrant_manager, ruta_backup, eliminar_existente)
             else:
                 self.restore_thread = WorkerThread("restore_mongodb", self.db_manager, ruta_backup, eliminar_existente)
@@ -2314,8 +2616,8 @@ class MainWindow(QMainWindow):
             self.restore_thread.start()
 
         except Exception as e:
-            self.backup_log.append(f"❌ Error al iniciar restauración: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Error al iniciar restauración: {str(e)}")
+            self._log_backup(f"❌ Error al iniciar restauración: {str(e)}")
+            self._mensaje_critico("Error", f"Error al iniciar restauración: {str(e)}")
 
     def _validar_backup(self):
         """Validar archivo de backup."""
@@ -2323,17 +2625,18 @@ class MainWindow(QMainWindow):
             ruta_backup = self.backup_ruta_input.text().strip()
 
             if not ruta_backup:
-                QMessageBox.warning(self, "Error", "Seleccione una ruta del archivo de backup")
+                self._mensaje_advertencia("Error", "Seleccione una ruta del archivo de backup")
                 return
 
-            if not os.path.exists(ruta_backup):
-                QMessageBox.warning(self, "Error", f"El archivo de backup no existe: {ruta_backup}")
+            info_archivo = self._stat_backup(ruta_backup)
+            if info_archivo is None:
+                self._mensaje_advertencia("Error", f"El archivo de backup no existe: {ruta_backup}")
                 return
 
             tipo_backup = self.backup_tipo_combo.currentText()
 
-            self.backup_log.clear()
-            self.backup_log.append(f"🔍 Validando archivo de backup de {tipo_backup}...")
+            self._limpiar_log_backup()
+            self._log_backup(f"🔍 Validando archivo de backup de {tipo_backup}...")
 
             # Validar backup
             if tipo_backup == "Qdrant":
@@ -2346,37 +2649,66 @@ class MainWindow(QMainWindow):
                 cantidad = resultado.get('total_documentos', 0)
 
             if resultado["valido"]:
-                self.backup_log.append("✅ Validación exitosa:")
-                self.backup_log.append(f"   • Archivo: {resultado['ruta']}")
-                self.backup_log.append(f"   • Tamaño: {resultado['tamano_archivo']} bytes")
-                self.backup_log.append(f"   • {tipo_dato.title()}: {cantidad}")
-                self.backup_log.append(f"   • Fecha backup: {resultado['fecha_backup']}")
-                self.backup_log.append(f"   • Hash SHA256: {resultado['hash_sha256'][:16]}...")
-
-                QMessageBox.information(
-                    self, "Validación Exitosa",
+                tamano = info_archivo.st_size
+                fecha_backup = resultado['fecha_backup']
+
+                self._log_backup("✅ Validación exitosa:")
+                self._log_backup(f"   • Archivo: {resultado['ruta']}")
+                self._log_backup(f"   • Tamaño: {tamano} bytes")
+                self._log_backup(f"   • {tipo_dato.title()}: {cantidad}")
+                self._log_backup(f"   • Fecha backup: {fecha_backup}")
+                self._log_backup(f"   • Hash SHA256: {resultado['hash_sha256'][:16]}...")
+
+                self._mensaje_info(
+                    "Validación Exitosa",
                     f"Backup válido:\n"
                     f"• {cantidad} {tipo_dato}\n"
-                    f"• Tamaño: {resultado['tamano_archivo']} bytes\n"
-                    f"• Fecha: {resultado['fecha_backup']}"
+                    f"• Tamaño: {tamano} bytes\n"
+                    f"• Fecha: {fecha_backup}"
                 )
             else:
-                self.backup_log.append(f"❌ Error de validación: {resultado['error']}")
+                error = resultado['error']
+                self._log_backup(f"❌ Error de validación: {error}")
 
-                QMessageBox.warning(
-                    self, "Error de Validación",
-                    f"Backup inválido:\n{resultado['error']}"
+                self._mensaje_advertencia(
+                    "Error de Validación",
+                    f"Backup inválido:\n{error}"
                 )
 
         except Exception as e:
-            self.backup_log.append(f"❌ Error al validar backup: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Error al validar backup: {str(e)}")
+            self._log_backup(f"❌ Error al validar backup: {str(e)}")
+            self._mensaje_critico("Error", f"Error al validar backup: {str(e)}")
 
     def _actualizar_progreso_backup(self, progreso: int, mensaje: str):
-        """Actualizar progreso del backup."""
-        self.backup_progress_bar.setValue(progreso)
+        """Actualizar progreso del backup (número de elementos guardados)."""
+        # Limitar los repintados a ~200 pasos en toda la operación
+        maximo = self.backup_progress_bar.maximum()
+        if progreso < maximo and progreso - self._last_progress_val < max(1, maximo // 200):
+            return
+        self._last_progress_val = progreso
+
+        self._encolar_progreso_backup(min(progreso, maximo), mensaje)
+        self._log_backup(f"Progreso: {mensaje}")
+
+    def _encolar_progreso_backup(self, valor: int, mensaje: str):
+        """Guardar el último progreso y programar su aplicación."""
+        self._progreso_backup_pendiente = (valor, mensaje)
+        if not self._backup_progreso_timer.isActive():
+            self._backup_progreso_timer.start()
+
+    def _aplicar_progreso_backup(self):
+        """Mostrar en la barra y la etiqueta el último progreso recibido."""
+        if self._progreso_backup_pendiente is None:
+            return
+        valor, mensaje = self._progreso_backup_pendiente
+        self._progreso_backup_pendiente = None
+        self.backup_progress_bar.setValue(valor)
         self.backup_progress_label.setText(mensaje)
-        self.backup_log.append(f"Progreso: {progreso}% - {mensaje}")
+
+    def _descartar_progreso_backup(self):
+        """Descartar el progreso pendiente al terminar la operación."""
+        self._backup_progreso_timer.stop()
+        self._progreso_backup_pendiente = None
 
     def _backup_completado(self, resultado: dict):
         """Manejador para cuando termina el backup."""
@@ -2386,45 +2718,51 @@ class MainWindow(QMainWindow):
         self.backup_validar_btn.setEnabled(True)
 
         # Ocultar progreso
+        self._descartar_progreso_backup()
         self.backup_progress_bar.setVisible(False)
 
         if resultado:
             tipo_backup = self.backup_tipo_combo.currentText()
+            ruta_archivo = resultado.get('ruta_archivo', 'Desconocido')
+            ruta_vectores = resultado.get('ruta_vectores')
+            tamano = resultado.get('tamano_archivo', 0)
 
             if tipo_backup == "Qdrant":
-                tipo_dato = "vectores"
+                tipo_dato = "Vectores"
                 cantidad = resultado.get('total_vectores', 0)
             else:
-                tipo_dato = "documentos"
+                tipo_dato = "Documentos"
                 cantidad = resultado.get('total_documentos', 0)
 
             self.backup_progress_label.setText("Backup completado")
-            self.backup_log.append(f"\n=== BACKUP {tipo_backup.upper()} COMPLETADO ===")
-            self.backup_log.append(f"✓ Archivo: {resultado.get('ruta_archivo', 'Desconocido')}")
-            self.backup_log.append(f"✓ {tipo_dato.title()}: {cantidad}")
-            self.backup_log.append(f"✓ Tamaño: {resultado.get('tamano_archivo', 0)} bytes")
-            self.backup_log.append(f"✓ Hash: {resultado.get('hash_sha256', 'N/A')[:16]}...")
-            self.backup_log.append(f"✓ Fecha: {resultado.get('fecha_backup', 'N/A')}")
-
-            QMessageBox.information(
-                self, "Backup Completado",
+            self._log_backup(f"\n=== BACKUP {tipo_backup.upper()} COMPLETADO ===")
+            self._log_backup(f"✓ Archivo: {ruta_archivo}")
+            if ruta_vectores:
+                self._log_backup(f"✓ Vectores: {ruta_vectores}")
+            self._log_backup(f"✓ {tipo_dato}: {cantidad}")
+            self._log_backup(f"✓ Tamaño: {tamano} bytes")
+            self._log_backup(f"✓ Hash: {resultado.get('hash_sha256', 'N/A')[:16]}...")
+            self._log_backup(f"✓ Fecha: {resultado.get('fecha_backup', 'N/A')}")
+
+            self._mensaje_info(
+                "Backup Completado",
                 f"Backup {tipo_backup} creado exitosamente:\n"
-                f"• Archivo: {resultado.get('ruta_archivo', 'Desconocido')}\n"
-                f"• {tipo_dato.title()}: {cantidad}\n"
-                f"• Tamaño: {resultado.get('tamano_archivo', 0)} bytes"
+                f"• Archivo: {ruta_archivo}\n"
+                f"• {tipo_dato}: {cantidad}\n"
+                f"• Tamaño: {tamano} bytes"
             )
 
-            # Actualizar estado
+            # Actualizar estado con datos frescos
+            self._stats_cache.clear()
             self._actualizar_estado_backup()
         else:
             self.backup_progress_label.setText("Backup completado")
-            self.backup_log.append("Backup completado sin resultado detallado")
+            self._log_backup("Backup completado sin resultado detallado")
 
     def _actualizar_progreso_restore(self, progreso: int, mensaje: str):
         """Actualizar progreso de la restauración."""
-        self.backup_progress_bar.setValue(progreso)
-        self.backup_progress_label.setText(mensaje)
-        self.backup_log.append(f"Progreso: {progreso}% - {mensaje}")
+        self._encolar_progreso_backup(progreso, mensaje)
+        self._log_backup(f"Progreso: {progreso}% - {mensaje}")
 
     def _restore_completado(self, resultado: dict):
         """Manejador para cuando termina la restauración."""
@@ -2434,66 +2772,70 @@ class MainWindow(QMainWindow):
         self.backup_validar_btn.setEnabled(True)
 
         # Ocultar progreso
+        self._descartar_progreso_backup()
         self.backup_progress_bar.setVisible(False)
 
         if resultado:
             tipo_backup = self.backup_tipo_combo.currentText()
 
             if tipo_backup == "Qdrant":
-                tipo_dato = "vectores"
+                tipo_dato = "Vectores"
                 cantidad_restaurada = resultado.get('total_vectores_restaurados', 0)
                 cantidad_total = resultado.get('total_vectores_en_coleccion', 0)
             else:
-                tipo_dato = "documentos"
+                tipo_dato = "Documentos"
                 cantidad_restaurada = resultado.get('total_documentos_restaurados', 0)
                 cantidad_total = resultado.get('total_documentos_en_coleccion', 0)
 
             self.backup_progress_label.setText("Restauración completada")
-            self.backup_log.append(f"\n=== RESTAURACIÓN {tipo_backup.upper()} COMPLETADA ===")
-            self.backup_log.append(f"✓ {tipo_dato.title()} restaurados: {cantidad_restaurada}")
-            self.backup_log.append(f"✓ {tipo_dato.title()} en colección: {cantidad_total}")
-            self.backup_log.append(f"✓ Fecha restauración: {resultado.get('fecha_restauracion', 'N/A')}")
+            self._log_backup(f"\n=== RESTAURACIÓN {tipo_backup.upper()} COMPLETADA ===")
+            self._log_backup(f"✓ {tipo_dato} restaurados: {cantidad_restaurada}")
+            self._log_backup(f"✓ {tipo_dato} en colección: {cantidad_total}")
+            self._log_backup(f"✓ Fecha restauración: {resultado.get('fecha_restauracion', 'N/A')}")
 
-            QMessageBox.information(
-                self, "Restauración Completada",
+            self._mensaje_info(
+                "Restauración Completada",
                 f"Restauración {tipo_backup} completada exitosamente:\n"
-                f"• {tipo_dato.title()} restaurados: {cantidad_restaurada}\n"
-                f"• {tipo_dato.title()} en colección: {cantidad_total}"
+                f"• {tipo_dato} restaurados: {cantidad_restaurada}\n"
+                f"• {tipo_dato} en colección: {cantidad_total}"
             )
 
-            # Actualizar estado
+            # Actualizar estado con datos frescos
+            self._stats_cache.clear()
             self._actualizar_estado_backup()
         else:
             self.backup_progress_label.setText("Restauración completada")
-            self.backup_log.append("Restauración completada sin resultado detallado")
+            self._log_backup("Restauración completada sin resultado detallado")
 
     def _error_backup(self, error_msg: str):
         """Mostrar mensaje de error de backup."""
-        QMessageBox.critical(self, "Error de Backup", f"Error durante el backup: {error_msg}")
+        self._mensaje_critico("Error de Backup", f"Error durante el backup: {error_msg}")
 
         # Rehabilitar botones y ocultar progreso
         self.backup_crear_btn.setEnabled(True)
         self.backup_restaurar_btn.setEnabled(True)
         self.backup_validar_btn.setEnabled(True)
+        self._descartar_progreso_backup()
         self.backup_progress_bar.setVisible(False)
         self.backup_progress_label.setText("Error en backup")
 
-        self.backup_log.append(f"❌ Error durante el backup: {error_msg}")
-        self.backup_log.append("=== BACKUP INTERRUMPIDO POR ERROR ===")
+        self._log_backup(f"❌ Error durante el backup: {error_msg}")
+        self._log_backup("=== BACKUP INTERRUMPIDO POR ERROR ===")
 
     def _error_restore(self, error_msg: str):
         """Mostrar mensaje de error de restauración."""
-        QMessageBox.critical(self, "Error de Restauración", f"Error durante la restauración: {error_msg}")
+        self._mensaje_critico("Error de Restauración", f"Error durante la restauración: {error_msg}")
 
         # Rehabilitar botones y ocultar progreso
         self.backup_crear_btn.setEnabled(True)
         self.backup_restaurar_btn.setEnabled(True)
         self.backup_validar_btn.setEnabled(True)
+        self._descartar_progreso_backup()
         self.backup_progress_bar.setVisible(False)
         self.backup_progress_label.setText("Error en restauración")
 
-        self.backup_log.append(f"❌ Error durante la restauración: {error_msg}")
-        self.backup_log.append("=== RESTAURACIÓN INTERRUMPIDA POR ERROR ===")
+        self._log_backup(f"❌ Error durante la restauración: {error_msg}")
+        self._log_backup("=== RESTAURACIÓN INTERRUMPIDA POR ERROR ===")
 
     def _conectar_senales(self):
         """Conectar señales de la interfaz."""
@@ -2503,12 +2845,12 @@ class MainWindow(QMainWindow):
     def _realizar_busqueda(self):
         """Realizar búsqueda con los parámetros actuales."""
         if not self.buscador:
-            QMessageBox.warning(self, "Error", "Sistema no inicializado")
+            self._mensaje_advertencia("Error", "Sistema no inicializado")
             return
 
         consulta_texto = self.consulta_input.text().strip()
         if not consulta_texto:
-            QMessageBox.warning(self, "Error", "Ingrese una consulta de búsqueda")
+            self._mensaje_advertencia("Error", "Ingrese una consulta de búsqueda")
             return
 
         # Crear consulta
@@ -2532,37 +2874,7 @@ class MainWindow(QMainWindow):
 
     def _mostrar_resultados(self, resultados: List[ResultadoBusqueda]):
         """Mostrar resultados de búsqueda en la tabla."""
-        self.resultados_table.setRowCount(0)
-
-        for resultado in resultados:
-            row = self.resultados_table.rowCount()
-            self.resultados_table.insertRow(row)
-
-            # Nombre
-            nombre_item = QTableWidgetItem(resultado.documento.nombre)
-            self.resultados_table.setItem(row, 0, nombre_item)
-
-            # Ubicación
-            ubicacion = ", ".join([
-                resultado.documento.ciudad,
-                resultado.documento.barrio,
-                resultado.documento.calle
-            ]).strip(", ")
-            ubicacion_item = QTableWidgetItem(ubicacion or "No especificada")
-            self.resultados_table.setItem(row, 1, ubicacion_item)
-
-            # Objetos
-            objetos = ", ".join(resultado.documento.objetos) if resultado.documento.objetos else "Ninguno"
-            objetos_item = QTableWidgetItem(objetos)
-            self.resultados_table.setItem(row, 2, objetos_item)
-
-            # Similitud
-            similitud_item = QTableWidgetItem(f"{resultado.similitud:.3f}")
-            self.resultados_table.setItem(row, 3, similitud_item)
-
-            # Tipo
-            tipo_item = QTableWidgetItem(resultado.tipo_busqueda)
-            self.resultados_table.setItem(row, 4, tipo_item)
+        self.resultados_model.establecer_resultados(resultados)
 
     def _mostrar_detalle_imagen(self, index):
         """Mostrar detalles de una imagen seleccionada."""
@@ -2571,7 +2883,7 @@ class MainWindow(QMainWindow):
             return
 
         # Obtener documento de la fila seleccionada
-        nombre = self.resultados_table.item(row, 0).text()
+        nombre = self.resultados_model.nombre(row)
 
         try:
             # Buscar el documento en la base de datos
@@ -2587,36 +2899,8 @@ class MainWindow(QMainWindow):
             # Limpiar área de previsualización
             self.imagen_preview.clear()
 
-            # Restaurar el QLabel original si fue reemplazado por un error
-            if not hasattr(self.info_imagen, 'parent') or self.info_imagen.parent() is None:
-                # Crear un nuevo QLabel si no existe
-                self.info_imagen = QLabel("Sin información")
-                self.info_imagen.setWordWrap(True)
-                self.info_imagen.setAlignment(Qt.AlignCenter)
-                self.info_imagen.setStyleSheet("""
-                    QLabel {
-                        border: 3px solid #5A6578;
-                        padding: 15px;
-                        background: #0F0F0F;
-                        border-radius: 12px;
-                        qproperty-alignment: AlignCenter;
-                        color: #FFFFFF;
-                        font-size: 14px;
-                        line-height: 1.6;
-                        font-weight: 500;
-                    }
-                """)
-
-                # Buscar el contenedor de información y establecer el widget
-                for child in self.findChildren(QWidget):
-                    if child.layout() and hasattr(child.layout(), 'setAlignment'):
-                        # Buscar el scroll area dentro del contenedor de información
-                        for scroll_child in child.findChildren(QScrollArea):
-                            if scroll_child.widget() is None or not hasattr(scroll_child.widget(), 'text'):
-                                scroll_child.setWidget(self.info_imagen)
-                                break
-
-            self.info_imagen.clear()
+            # Trazas de depuración; solo se unen si hay que mostrarlas
+            debug_parts: List[str] = []
 
             # Extraer ubicación del campo ruta
             ubicacion = "No especificada"
@@ -2629,96 +2913,108 @@ class MainWindow(QMainWindow):
                     else:
                         ubicacion = documento.ruta
                 except Exception as e:
-                    debug_info += f"⚠ Error al procesar ubicación: {str(e)}\n"
+                    debug_parts.append(f"⚠ Error al procesar ubicación: {str(e)}\n")
                     ubicacion = documento.ruta or "Error al procesar ruta"
 
             # Mostrar información básica con mejor formato
-            info_text = f"""
-            <div style='text-align: center;'>
-            <h4>📋 Información de la Imagen</h4>
-            <hr>
-            <p><b>🏷️ Nombre:</b> {documento.nombre}</p>
-            <p><b>📍 Ubicación:</b> {ubicacion}</p>
-            <p><b>📐 Dimensiones:</b> {documento.ancho}x{documento.alto}px</p>
-            <p><b>💾 Peso:</b> {documento.peso/1024:.1f} KB</p>
-            <p><b>🔍 Objetos detectados:</b></p>
-            <p style='margin-left: 20px; color: #333; text-align: center;'>
-            {('<br>').join(f'• {objeto}' for objeto in documento.objetos) if documento.objetos else 'Ninguno'}
-            </p>
-            <p><b>✅ Procesado:</b> {'Sí' if documento.objeto_procesado else 'No'}</p>
-            </div>
-            """
+            info_text = _INFO_TPL.format_map({
+                "nombre": documento.nombre,
+                "ubicacion": ubicacion,
+                "ancho": documento.ancho,
+                "alto": documento.alto,
+                "peso_kb": documento.peso / 1024,
+                "objetos": "<br>".join(f"• {objeto}" for objeto in documento.objetos) if documento.objetos else "Ninguno",
+                "procesado": "Sí" if documento.objeto_procesado else "No",
+            })
             self.info_imagen.setText(info_text)
 
             # Intentar cargar la imagen
             imagen_cargada = False
 
             # Debug: mostrar información de rutas
-            debug_info = f"Nombre: {documento.nombre}\n"
-            debug_info += f"Ruta principal: {documento.ruta}\n"
-            debug_info += f"Ruta alternativa: {documento.ruta_alternativa}\n"
+            debug_parts.append(f"Nombre: {documento.nombre}\n")
+            debug_parts.append(f"Ruta principal: {documento.ruta}\n")
+            debug_parts.append(f"Ruta alternativa: {documento.ruta_alternativa}\n")
 
             # Probar con la ruta principal
             if documento.ruta:
-                debug_info += f"Verificando ruta principal: {documento.ruta}\n"
+                debug_parts.append(f"Verificando ruta principal: {documento.ruta}\n")
                 if os.path.exists(documento.ruta):
-                    debug_info += "✓ Ruta principal existe\n"
+                    debug_parts.append("✓ Ruta principal existe\n")
                     try:
-                        pixmap = QPixmap(documento.ruta)
-                        if not pixmap.isNull():
-                            debug_info += "✓ Imagen cargada correctamente\n"
+                        pixmap = self._obtener_miniatura(documento.ruta)
+                        if pixmap is not None and not pixmap.isNull():
+                            debug_parts.append("✓ Imagen cargada correctamente\n")
                             self._mostrar_imagen(pixmap)
                             imagen_cargada = True
                         else:
-                            debug_info += "✗ QPixmap isNull() - formato no soportado\n"
+                            debug_parts.append("✗ QPixmap isNull() - formato no soportado\n")
                     except Exception as e:
-                        debug_info += f"✗ Error al cargar imagen: {str(e)}\n"
+                        debug_parts.append(f"✗ Error al cargar imagen: {str(e)}\n")
                 else:
-                    debug_info += "✗ Ruta principal no existe\n"
+                    debug_parts.append("✗ Ruta principal no existe\n")
             else:
-                debug_info += "✗ No hay ruta principal\n"
+                debug_parts.append("✗ No hay ruta principal\n")
 
             # Si no funcionó, probar con la ruta alternativa
             if not imagen_cargada and documento.ruta_alternativa:
-                debug_info += f"Verificando ruta alternativa: {documento.ruta_alternativa}\n"
+                debug_parts.append(f"Verificando ruta alternativa: {documento.ruta_alternativa}\n")
                 if os.path.exists(documento.ruta_alternativa):
-                    debug_info += "✓ Ruta alternativa existe\n"
+                    debug_parts.append("✓ Ruta alternativa existe\n")
                     try:
-                        pixmap = QPixmap(documento.ruta_alternativa)
-                        if not pixmap.isNull():
-                            debug_info += "✓ Imagen cargada desde ruta alternativa\n"
+                        pixmap = self._obtener_miniatura(documento.ruta_alternativa)
+                        if pixmap is not None and not pixmap.isNull():
+                            debug_parts.append("✓ Imagen cargada desde ruta alternativa\n")
                             self._mostrar_imagen(pixmap)
                             imagen_cargada = True
                         else:
-                            debug_info += "✗ QPixmap isNull() - formato no soportado en ruta alternativa\n"
+                            debug_parts.append("✗ QPixmap isNull() - formato no soportado en ruta alternativa\n")
                     except Exception as e:
-                        debug_info += f"✗ Error al cargar imagen alternativa: {str(e)}\n"
+                        debug_parts.append(f"✗ Error al cargar imagen alternativa: {str(e)}\n")
                 else:
-                    debug_info += "✗ Ruta alternativa no existe\n"
+                    debug_parts.append("✗ Ruta alternativa no existe\n")
 
             # Si no se pudo cargar la imagen
             if not imagen_cargada:
-                debug_info += "❌ No se pudo cargar la imagen desde ninguna ruta\n"
+                debug_parts.append("❌ No se pudo cargar la imagen desde ninguna ruta\n")
+                debug_info = "".join(debug_parts)
                 self._mostrar_error_imagen(f"No se pudo cargar la imagen desde las rutas disponibles\n\nDebug:\n{debug_info}")
-            else:
-                # Limpiar información de debug si la imagen se cargó correctamente
-                self.info_imagen.setText(info_text)
 
         except Exception as e:
             self._mostrar_error_imagen(f"Error al cargar la imagen: {str(e)}")
 
+    def _obtener_miniatura(self, ruta: str) -> Optional[QPixmap]:
+        """Miniatura de 320px de una imagen, cacheada por (ruta, fecha de modificación)."""
+        try:
+            mtime = os.stat(ruta).st_mtime
+        except OSError:
+            return None
+        return self._cargar_miniatura(ruta, mtime)
+
+    @staticmethod
+    def _decodificar_miniatura(ruta: str, mtime: float) -> QPixmap:
+        """Decodificar una imagen directamente a 320px de ancho.
+
+        mtime solo forma parte de la clave de caché para invalidarla si el
+        archivo cambia.
+        """
+        reader = QImageReader(ruta)
+        size = reader.size()
+        if size.isValid() and size.width() > 0:
+            alto = max(1, round(size.height() * 320 / size.width()))
+            reader.setScaledSize(QSize(320, alto))
+        return QPixmap.fromImage(reader.read())
+
     def _mostrar_imagen(self, pixmap: QPixmap):
         """Mostrar imagen en el área de previsualización con tamaño fijo."""
-        # Escalar la imagen manteniendo la proporción
+        # Las miniaturas ya llegan decodificadas a 320px; solo se escalan las demás
         # Ancho fijo de 320px, altura proporcional
-        scaled_pixmap = pixmap.scaledToWidth(
-            320,
-            Qt.SmoothTransformation
-        )
+        if pixmap.width() != 320:
+            pixmap = pixmap.scaledToWidth(320, Qt.SmoothTransformation)
 
-        self.imagen_preview.setPixmap(scaled_pixmap)
-        self.imagen_preview.setMinimumHeight(scaled_pixmap.height())
-        self.imagen_preview.setMaximumHeight(scaled_pixmap.height())
+        self.imagen_preview.setPixmap(pixmap)
+        self.imagen_preview.setMinimumHeight(pixmap.height())
+        self.imagen_preview.setMaximumHeight(pixmap.height())
 
     def _mostrar_error_imagen(self, mensaje: str):
         """Mostrar mensaje de error en el área de previsualización."""
@@ -2730,38 +3026,17 @@ class MainWindow(QMainWindow):
         <p>No se pudo cargar la información de la imagen</p>
         </div>
         """
-        # Crear un nuevo QLabel para el error para mantener la funcionalidad del scroll
-        error_label = QLabel(error_text)
-        error_label.setWordWrap(True)
-        error_label.setAlignment(Qt.AlignCenter)
-        error_label.setStyleSheet("""
-            QLabel {
-                border: 3px solid #d32f2f;
-                padding: 12px;
-                background: #0F0F0F;
-                border-radius: 8px;
-                color: #FFFFFF;
-            }
-        """)
-
-        # Buscar el contenedor de información y reemplazar el widget en el scroll area
-        for child in self.findChildren(QWidget):
-            if child.layout() and hasattr(child.layout(), 'setAlignment'):
-                # Buscar el scroll area dentro del contenedor de información
-                for scroll_child in child.findChildren(QScrollArea):
-                    scroll_child.setWidget(error_label)
-                    # Guardar referencia al label de error para poder restaurarlo después
-                    self.info_imagen = error_label
-                    break
+        # Mostrar el error en el mismo QLabel de información
+        self.info_imagen.setText(error_text)
 
     def _limpiar_resultados(self):
         """Limpiar resultados de búsqueda."""
-        self.resultados_table.setRowCount(0)
+        self.resultados_model.establecer_resultados([])
         self.consulta_input.clear()
 
     def _actualizar_estadisticas(self):
         """Actualizar estadísticas mostradas."""
-        if not self.db_manager:
+        if not self.db_manager or not self.tab_estadisticas.isVisible():
             return
 
         try:
@@ -2773,102 +3048,118 @@ class MainWindow(QMainWindow):
             self.tasa_procesamiento_label.setText(f"{stats['tasa_procesamiento']:.1f}%")
 
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Error al actualizar estadísticas: {str(e)}")
+            self._mensaje_advertencia("Error", f"Error al actualizar estadísticas: {str(e)}")
 
     def _procesar_documentos_pendientes(self):
         """Procesar documentos que no tienen embedding."""
         if not self.buscador:
-            QMessageBox.warning(self, "Error", "Sistema no inicializado")
+            self._mensaje_advertencia("Error", "Sistema no inicializado")
             return
 
-        # Obtener documentos sin procesar
-        documentos_pendientes = list(self.db_manager.collection.find(
-            {"$or": [
-                {"objeto_procesado": False},
-                {"embedding": {"$exists": False}}
-            ]}
-        ).limit(10))
+        self.procesar_docs_btn.setEnabled(False)
 
-        if not documentos_pendientes:
-            QMessageBox.information(self, "Información", "No hay documentos pendientes de procesar")
-            return
+        # Procesar en un hilo de trabajo para no bloquear la interfaz
+        self.pendientes_thread = WorkerThread("procesar_pendientes", self.db_manager, self.buscador)
+        self.pendientes_thread.progreso_actualizado.connect(self._progreso_documentos_pendientes)
+        self.pendientes_thread.procesamiento_completado.connect(self._documentos_pendientes_completados)
+        self.pendientes_thread.error_ocurrido.connect(self._error_documentos_pendientes)
+        self.pendientes_thread.finished.connect(lambda: self.procesar_docs_btn.setEnabled(True))
+        self.pendientes_thread.start()
 
-        # Procesar documentos
-        self.log_text.append(f"Iniciando procesamiento de {len(documentos_pendientes)} documentos...")
+    def _progreso_documentos_pendientes(self, valor: int, mensaje: str):
+        """Registrar el progreso del procesamiento de documentos pendientes."""
+        self.log_text.appendPlainText(mensaje)
 
-        for doc_data in documentos_pendientes:
-            try:
-                documento = self.db_manager.obtener_documento_por_id(doc_data["_id"])
-                if documento:
-                    self.buscador.procesar_documento(documento, None)  # Sin callback para procesamiento individual
-                    self.log_text.append(f"✓ Procesado: {documento.nombre}")
-            except Exception as e:
-                self.log_text.append(f"✗ Error procesando {doc_data.get('nombre', 'desconocido')}: {str(e)}")
+    def _documentos_pendientes_completados(self, resultado):
+        """Manejar el fin del procesamiento de documentos pendientes."""
+        if not resultado['total']:
+            self._mensaje_info("Información", "No hay documentos pendientes de procesar")
+            return
 
-        self.log_text.append("Procesamiento completado.")
+        self.log_text.appendPlainText("Procesamiento completado.")
         self._actualizar_estadisticas()
 
+    def _error_documentos_pendientes(self, error: str):
+        """Manejar errores del procesamiento de documentos pendientes."""
+        self.log_text.appendPlainText(f"✗ Error en procesamiento: {error}")
+        self._mensaje_critico("Error", f"Error al procesar documentos pendientes: {error}")
+
     def _guardar_configuracion(self):
         """Guardar configuración en archivo .env."""
         # Aquí podrías implementar guardar la configuración
-        QMessageBox.information(self, "Configuración", "Configuración guardada (funcionalidad pendiente)")
+        self._mensaje_info("Configuración", "Configuración guardada (funcionalidad pendiente)")
 
     def _probar_conexiones(self):
-        """Probar conexiones a MongoDB, Qdrant y Ollama."""
-        try:
-            # Probar MongoDB
-            self.db_manager.client.admin.command('ping')
-            QMessageBox.information(self, "Conexión", "✓ MongoDB conectado correctamente")
-
-            # Probar Qdrant
-            try:
-                self.qdrant_manager.client.get_collections()
-                QMessageBox.information(self, "Conexión", "✓ Qdrant conectado correctamente")
-            except Exception as qdrant_error:
-                QMessageBox.warning(self, "Error de Conexión", f"Error con Qdrant: {str(qdrant_error)}")
-
-            # Probar Ollama
-            # Aquí podrías implementar una prueba de conexión con Ollama
-
-        except Exception as e:
-            QMessageBox.warning(self, "Error de Conexión", f"Error: {str(e)}")
+        """Probar conexiones a MongoDB, Qdrant y Ollama en paralelo."""
+        ollama_url = self.ollama_url_input.text().strip().rstrip('/')
+        comprobaciones = {
+            "MongoDB": lambda: self.db_manager.client.admin.command('ping'),
+            "Qdrant": lambda: self.qdrant_manager.client.get_collections(),
+            "Ollama": lambda: urlopen(f"{ollama_url}/api/tags", timeout=5).close(),
+        }
 
+        # Lanzar las tres comprobaciones a la vez; el diálogo se muestra después en el hilo de la interfaz
+        errores = {}
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futuros = {executor.submit(comprobar): servicio for servicio, comprobar in comprobaciones.items()}
+            for futuro in as_completed(futuros):
+                try:
+                    futuro.result()
+                except Exception as e:
+                    errores[futuros[futuro]] = str(e)
+
+        lineas = [
+            f"✗ Error con {servicio}: {errores[servicio]}" if servicio in errores
+            else f"✓ {servicio} conectado correctamente"
+            for servicio in comprobaciones
+        ]
+        if errores:
+            self._mensaje_advertencia("Error de Conexión", "\n".join(lineas))
+        else:
+            self._mensaje_info("Conexión", "\n".join(lineas))
 
 
 
 
     def _actualizar_estadisticas_procesamiento(self):
         """Actualizar estadísticas de procesamiento."""
+        if not self.tab_procesamiento.isVisible():
+            return
+
         if not self.batch_processor:
-            QMessageBox.warning(self, "Error", "Sistema no inicializado")
+            self._mensaje_advertencia("Error", "Sistema no inicializado")
             return
 
         try:
-            stats = self.batch_processor.obtener_estadisticas_coleccion()
+            # Reutilizar las estadísticas si se pidieron hace menos de 5 segundos
+            stats = self._obtener_estadisticas_cacheadas(
+                'procesamiento', self.batch_processor.obtener_estadisticas_coleccion, ttl=5.0
+            )
+            docs_en_qdrant = self._obtener_estadisticas_cacheadas(
+                'docs_en_qdrant', self.db_manager.contar_documentos_en_qdrant, ttl=5.0
+            )
 
             # Actualizar etiquetas
             self.total_docs_label.setText(str(stats['mongodb']['total_documentos']))
             self.docs_sin_procesar_label.setText(str(stats['resumen']['documentos_pendientes']))
             self.docs_procesados_label.setText(str(stats['mongodb']['documentos_con_embedding']))
 
-            # Obtener documentos en Qdrant
-            docs_en_qdrant = self.db_manager.collection.count_documents({"qdrant": True})
             self.docs_en_qdrant_label.setText(str(docs_en_qdrant))
 
             self.completitud_label.setText(f"{stats['resumen']['completitud']:.1f}%")
 
-            self.procesamiento_log.append(
+            self._log_procesamiento(
                 f"Estadísticas actualizadas: {stats['mongodb']['documentos_con_embedding']}/{stats['mongodb']['total_documentos']} procesados"
             )
 
         except Exception as e:
-            QMessageBox.warning(self, "Error", f"Error al actualizar estadísticas: {str(e)}")
+            self._mensaje_advertencia("Error", f"Error al actualizar estadísticas: {str(e)}")
 
 
     def _procesar_coleccion_completa(self):
         """Procesar toda la colección para generar embeddings."""
         if not self.batch_processor:
-            QMessageBox.warning(self, "Error", "Sistema no inicializado")
+            self._mensaje_advertencia("Error", "Sistema no inicializado")
             return
 
         # Confirmar procesamiento
@@ -2890,86 +3181,147 @@ class MainWindow(QMainWindow):
 
         # Limpiar log y mostrar progreso
         self.procesamiento_log.clear()
-        self.procesamiento_log.append("Iniciando procesamiento de la colección completa...")
+        self._procesamiento_log_buffer.clear()
+        self._log_procesamiento("Iniciando procesamiento de la colección completa...")
 
         self.progreso_bar.setVisible(True)
-        self.progreso_bar.setRange(0, 0)  # Indefinido
-        self.progreso_label.setText("Procesando documentos...")
+        self.progreso_bar.setRange(0, 0)  # Indefinido hasta conocer el total
+        self.progreso_label.setText("Obteniendo documentos pendientes...")
 
-        # Resetear flag de cancelación
-        self.cancelar_procesamiento_flag = False
+        # Resetear evento de cancelación
+        self.cancelar_procesamiento_event.clear()
 
-        # Crear y ejecutar hilo de procesamiento
+        # Repartir los lotes entre los hilos del pool global (uno por núcleo)
         max_docs = self.max_docs_spin.value() if self.max_docs_spin.value() != 0 else None
-        self.procesamiento_thread = WorkerThread("procesar_coleccion", self.batch_processor, self.batch_size_spin.value(), max_docs, cancel_callback=self._verificar_cancelacion)
-        self.procesamiento_thread.progreso_actualizado.connect(self._actualizar_progreso_procesamiento)
-        self.procesamiento_thread.procesamiento_completado.connect(self._procesamiento_completado)
-        self.procesamiento_thread.error_ocurrido.connect(self._mostrar_error_procesamiento)
-        self.procesamiento_thread.start()
+        batch_size = self.batch_size_spin.value()
+        self._resultado_lotes = {"total_procesados": 0, "total_exitosos": 0, "total_errores": 0}
+        self._lotes_pendientes = 0
+        self._total_documentos_lote = 0
+
+        senales = BatchSignals()
+        senales.plan_listo.connect(self._plan_lotes_listo)
+        senales.progreso.connect(self._progreso_lote)
+        senales.lote_terminado.connect(self._lote_terminado)
+        senales.error_ocurrido.connect(self._error_lotes)
+        self._senales_lote = senales
+
+        batch_processor = self.batch_processor
+        cancel_event = self.cancelar_procesamiento_event
+        pool = QThreadPool.globalInstance()
+
+        def planificar_lotes():
+            # La consulta de pendientes también se hace fuera del hilo de la interfaz
+            try:
+                documentos = batch_processor.obtener_documentos_sin_embedding(max_docs)
+                lotes = [documentos[i:i + batch_size] for i in range(0, len(documentos), batch_size)]
+                senales.plan_listo.emit(len(documentos), len(lotes))
+                for lote in lotes:
+                    if cancel_event.is_set():
+                        break
+                    pool.start(BatchRunnable(batch_processor, lote, senales, cancel_event))
+            except Exception as e:
+                senales.error_ocurrido.emit(str(e))
+
+        pool.start(planificar_lotes)
+
+    def _plan_lotes_listo(self, total_documentos: int, total_lotes: int):
+        """Preparar el progreso una vez repartidos los documentos en lotes."""
+        if total_lotes == 0:
+            self._finalizar_lotes("No hay documentos pendientes de procesar")
+            return
+
+        self._lotes_pendientes = total_lotes
+        self._total_documentos_lote = total_documentos
+        self.progreso_bar.setRange(0, total_documentos)
+        self.progreso_bar.setValue(0)
+        self.progreso_label.setText(f"Procesando 0/{total_documentos} documentos...")
+        self._log_procesamiento(
+            f"{total_documentos} documentos repartidos en {total_lotes} lotes "
+            f"({QThreadPool.globalInstance().maxThreadCount()} hilos)"
+        )
+
+    def _progreso_lote(self, exitosos: int, errores: int):
+        """Acumular el progreso notificado por los lotes."""
+        resultado = self._resultado_lotes
+        resultado["total_exitosos"] += exitosos
+        resultado["total_errores"] += errores
+        resultado["total_procesados"] += exitosos + errores
+        if not self._progreso_lotes_timer.isActive():
+            self._progreso_lotes_timer.start()
+
+    def _aplicar_progreso_lotes(self):
+        """Mostrar el progreso acumulado de los lotes."""
+        procesados = self._resultado_lotes["total_procesados"]
+        self.progreso_bar.setValue(procesados)
+        self.progreso_label.setText(f"Procesando {procesados}/{self._total_documentos_lote} documentos...")
+
+    def _lote_terminado(self):
+        """Cerrar el procesamiento cuando terminan todos los lotes."""
+        self._lotes_pendientes -= 1
+        if self._lotes_pendientes == 0:
+            self._finalizar_lotes(f"Procesados {self._resultado_lotes['total_procesados']} documentos")
+
+    def _finalizar_lotes(self, mensaje: str):
+        """Componer el resultado agregado de los lotes."""
+        self._senales_lote = None
+        resultado = dict(self._resultado_lotes, mensaje=mensaje)
+        resultado["cancelado"] = self.cancelar_procesamiento_event.is_set()
+        self._procesamiento_completado(resultado)
+
+    def _error_lotes(self, error_msg: str):
+        """Manejar un error al preparar los lotes."""
+        self._senales_lote = None
+        self._mostrar_error_procesamiento(error_msg)
 
     def _cancelar_procesamiento(self):
         """Cancelar el procesamiento actual."""
-        if not hasattr(self, 'procesamiento_thread') or not self.procesamiento_thread:
-            QMessageBox.information(self, "Información", "No hay procesamiento en curso")
+        if self._senales_lote is None:
+            self._mensaje_info("Información", "No hay procesamiento en curso")
             return
 
-        # Establecer flag de cancelación
-        self.cancelar_procesamiento_flag = True
+        # Señalar la cancelación a los lotes en curso
+        self.cancelar_procesamiento_event.set()
 
         # Actualizar interfaz
         self.progreso_label.setText("Cancelando procesamiento...")
-        self.procesamiento_log.append("⚠️ Solicitud de cancelación enviada...")
+        self._log_procesamiento("⚠️ Solicitud de cancelación enviada...")
 
         # El hilo se detendrá en el próximo punto de verificación
-        QMessageBox.information(
-            self, "Cancelación Solicitada",
+        self._mensaje_info(
+            "Cancelación Solicitada",
             "Se ha solicitado la cancelación del procesamiento.\n"
             "El proceso se detendrá en el próximo punto de control."
         )
 
     def _cancelar_busqueda_imagenes(self):
         """Cancelar la búsqueda de imágenes actual."""
-        if not hasattr(self, 'busqueda_thread') or not self.busqueda_thread:
-            QMessageBox.information(self, "Información", "No hay búsqueda en curso")
+        if self.busqueda_thread is None:
+            self._mensaje_info("Información", "No hay búsqueda en curso")
             return
 
-        # Establecer flag de cancelación
-        self.cancelar_busqueda_flag = True
+        # Señalar la cancelación al hilo de búsqueda
+        self.cancelar_busqueda_event.set()
 
         # Actualizar interfaz
         self.busqueda_progress_label.setText("Cancelando búsqueda...")
-        self.busqueda_log.append("⚠️ Solicitud de cancelación enviada...")
+        self.busqueda_log.appendPlainText("⚠️ Solicitud de cancelación enviada...")
 
         # El hilo se detendrá en el próximo punto de verificación
-        QMessageBox.information(
-            self, "Cancelación Solicitada",
+        self._mensaje_info(
+            "Cancelación Solicitada",
             "Se ha solicitado la cancelación de la búsqueda.\n"
             "El proceso se detendrá en el próximo punto de control."
         )
 
     def _verificar_cancelacion(self):
         """Verificar si se ha solicitado la cancelación del procesamiento."""
-        resultado = self.cancelar_procesamiento_flag
-        if resultado:
-            print(f"🚫 CANCELACIÓN SOLICITADA - Flag de cancelación: {resultado}")
-        return resultado
-
-    def _verificar_cancelacion_busqueda(self):
-        """Verificar si se ha solicitado la cancelación de la búsqueda de imágenes."""
-        resultado = self.cancelar_busqueda_flag
-        if resultado:
-            print(f"🚫 CANCELACIÓN SOLICITADA - Flag de cancelación de búsqueda: {resultado}")
-        return resultado
+        return self.cancelar_procesamiento_event.is_set()
 
 
-    def _actualizar_progreso_procesamiento(self, progreso: int, mensaje: str):
-        """Actualizar progreso del procesamiento."""
-        self.progreso_bar.setValue(progreso)
-        self.progreso_label.setText(mensaje)
-        self.procesamiento_log.append(f"Progreso: {progreso}% - {mensaje}")
-
     def _procesamiento_completado(self, resultado: dict):
         """Manejador para cuando termina el procesamiento."""
+        self._progreso_lotes_timer.stop()
+
         # Rehabilitar botones
         self.procesar_btn.setEnabled(True)
         self.actualizar_stats_btn.setEnabled(True)
@@ -2980,14 +3332,14 @@ class MainWindow(QMainWindow):
 
         # Mostrar resultado
         if resultado:
-            print(f"📊 RESULTADO RECIBIDO: {resultado}")
+            logger.debug("Resultado del procesamiento recibido: %r", resultado)
             # Verificar si fue cancelado
             if resultado.get('cancelado', False):
-                print("✅ CANCELACIÓN DETECTADA EN RESULTADO")
+                logger.debug("Procesamiento cancelado según el resultado")
                 self.progreso_label.setText("Procesamiento cancelado")
-                self.procesamiento_log.append("\n=== PROCESAMIENTO CANCELADO ===")
-                QMessageBox.information(
-                    self, "Procesamiento Cancelado",
+                self._log_procesamiento("\n=== PROCESAMIENTO CANCELADO ===")
+                self._mensaje_info(
+                    "Procesamiento Cancelado",
                     f"Procesamiento cancelado por el usuario:\n"
                     f"• {resultado.get('total_exitosos', 0)} documentos procesados exitosamente\n"
                     f"• {resultado.get('total_errores', 0)} errores\n"
@@ -2995,29 +3347,33 @@ class MainWindow(QMainWindow):
                 )
             else:
                 self.progreso_label.setText("Procesamiento completado")
-                self.procesamiento_log.append("\n=== RESULTADO DEL PROCESAMIENTO ===")
-                QMessageBox.information(
-                    self, "Procesamiento Completado",
+                self._log_procesamiento("\n=== RESULTADO DEL PROCESAMIENTO ===")
+                self._mensaje_info(
+                    "Procesamiento Completado",
                     f"Procesamiento finalizado:\n"
                     f"• {resultado.get('total_exitosos', 0)} documentos procesados exitosamente\n"
                     f"• {resultado.get('total_errores', 0)} errores\n"
                     f"• {resultado.get('total_procesados', 0)} total procesados"
                 )
 
-            self.procesamiento_log.append(f"Total procesados: {resultado.get('total_procesados', 0)}")
-            self.procesamiento_log.append(f"Total exitosos: {resultado.get('total_exitosos', 0)}")
-            self.procesamiento_log.append(f"Total errores: {resultado.get('total_errores', 0)}")
-            self.procesamiento_log.append(f"Mensaje: {resultado.get('mensaje', 'Sin mensaje')}")
+            with self._sin_repintado(self.procesamiento_log):
+                self._log_procesamiento(f"Total procesados: {resultado.get('total_procesados', 0)}")
+                self._log_procesamiento(f"Total exitosos: {resultado.get('total_exitosos', 0)}")
+                self._log_procesamiento(f"Total errores: {resultado.get('total_errores', 0)}")
+                self._log_procesamiento(f"Mensaje: {resultado.get('mensaje', 'Sin mensaje')}")
 
-            # Actualizar estadísticas
+            # Actualizar estadísticas con datos frescos
+            self._stats_cache.pop('procesamiento', None)
+            self._stats_cache.pop('docs_en_qdrant', None)
             self._actualizar_estadisticas_procesamiento()
         else:
             self.progreso_label.setText("Procesamiento completado")
-            self.procesamiento_log.append("Procesamiento completado sin resultado detallado")
+            self._log_procesamiento("Procesamiento completado sin resultado detallado")
 
     def _mostrar_error_procesamiento(self, error_msg: str):
         """Mostrar mensaje de error de procesamiento."""
-        QMessageBox.critical(self, "Error de Procesamiento", f"Error durante el procesamiento: {error_msg}")
+        self._progreso_lotes_timer.stop()
+        self._mensaje_critico("Error de Procesamiento", f"Error durante el procesamiento: {error_msg}")
 
         # Rehabilitar botones y ocultar progreso
         self.procesar_btn.setEnabled(True)
@@ -3027,8 +3383,8 @@ class MainWindow(QMainWindow):
         self.progreso_label.setText("Error en procesamiento")
 
         # Registrar el error en el log
-        self.procesamiento_log.append(f"❌ Error durante el procesamiento: {error_msg}")
-        self.procesamiento_log.append("=== PROCESAMIENTO INTERRUMPIDO POR ERROR ===")
+        self._log_procesamiento(f"❌ Error durante el procesamiento: {error_msg}")
+        self._log_procesamiento("=== PROCESAMIENTO INTERRUMPIDO POR ERROR ===")
 
 
     def _actualizar_sugerencias(self, texto: str):
@@ -3049,135 +3405,156 @@ class MainWindow(QMainWindow):
 
     def _mostrar_error(self, error_msg: str):
         """Mostrar mensaje de error."""
-        QMessageBox.critical(self, "Error", f"Error durante la búsqueda: {error_msg}")
+        self._mensaje_critico("Error", f"Error durante la búsqueda: {error_msg}")
         self._busqueda_finalizada()
 
     def _actualizar_estado_deteccion(self):
         """Actualizar el estado del sistema de detección de objetos."""
         try:
             # Verificar si el detector está inicializado
-            detector_inicializado = hasattr(self, 'object_detector') and self.object_detector is not None
+            detector_inicializado = self.object_detector is not None
 
             if detector_inicializado:
                 self.deteccion_status_label.setText("Inicializado")
                 self.deteccion_status_label.setStyleSheet("color: green;")
 
                 # Obtener número de documentos pendientes
-                documentos_pendientes = self.db_manager.collection.count_documents({
-                    "$or": [
-                        {"objetos": {"$exists": False}},
-                        {"objetos": {"$size": 0}},
-                        {"objeto_procesado": False}
-                    ]
-                })
+                documentos_pendientes = self.db_manager.contar_pendientes_objetos()
 
                 self.deteccion_documentos_pendientes_label.setText(str(documentos_pendientes))
                 self.deteccion_procesando_label.setText("No")
                 self.deteccion_ultima_verificacion_label.setText(datetime.now().strftime("%H:%M:%S"))
 
-                self.deteccion_log.append(f"✓ Estado actualizado: {documentos_pendientes} imágenes pendientes")
+                self.deteccion_log.appendPlainText(f"✓ Estado actualizado: {documentos_pendientes} imágenes pendientes")
 
                 # Mostrar estadísticas de la base de datos
                 try:
                     stats = self.db_manager.obtener_estadisticas()
-                    self.deteccion_log.append(
+                    self.deteccion_log.appendPlainText(
                         f"📊 Base de datos: {stats.get('documentos_procesados', 0)}/{stats.get('total_documentos', 0)} procesados"
                     )
                 except Exception as e:
-                    self.deteccion_log.append(f"⚠ Error al obtener estadísticas: {str(e)}")
+                    self.deteccion_log.appendPlainText(f"⚠ Error al obtener estadísticas: {str(e)}")
             else:
                 self.deteccion_status_label.setText("No inicializado")
                 self.deteccion_status_label.setStyleSheet("color: red;")
-                self.deteccion_documentos_pendientes_label.setText("0")
+                self.deteccion_documentos_pendientes_label.setText(_TEXTO_CERO)
                 self.deteccion_procesando_label.setText("No")
-                self.deteccion_ultima_verificacion_label.setText("Nunca")
-                self.deteccion_log.append("❌ Sistema de detección no inicializado")
+                self.deteccion_ultima_verificacion_label.setText(_TEXTO_NUNCA)
+                self.deteccion_log.appendPlainText("❌ Sistema de detección no inicializado")
 
         except Exception as e:
-            self.deteccion_log.append(f"❌ Error al actualizar estado: {str(e)}")
-            QMessageBox.warning(self, "Error", f"Error al actualizar estado: {str(e)}")
+            self.deteccion_log.appendPlainText(f"❌ Error al actualizar estado: {str(e)}")
+            self._mensaje_advertencia("Error", f"Error al actualizar estado: {str(e)}")
 
     def _inicializar_sistema_deteccion_manual(self):
         """Inicializar el sistema de detección para uso manual."""
         try:
-            from src.object_detector import ObjectDetector
+            ObjectDetector, _ = _clases_deteccion()
             self.object_detector = ObjectDetector()
-            self.deteccion_log.append("✓ Detector de objetos inicializado correctamente")
+            self.deteccion_log.appendPlainText("✓ Detector de objetos inicializado correctamente")
             return True
         except Exception as e:
-            self.deteccion_log.append(f"❌ Error al inicializar detector de objetos: {str(e)}")
+            self.deteccion_log.appendPlainText(f"❌ Error al inicializar detector de objetos: {str(e)}")
             return False
 
     def _procesar_objetos_manual(self):
-        """Procesar objetos manualmente."""
+        """Procesar objetos manualmente en un hilo de trabajo."""
+        if self.deteccion_thread is not None and self.deteccion_thread.isRunning():
+            return
+
         try:
-            self.deteccion_log.append("🔄 Iniciando procesamiento manual de objetos...")
+            self.deteccion_log.appendPlainText("🔄 Iniciando procesamiento manual de objetos...")
 
             # Inicializar detector si no existe
-            if not hasattr(self, 'object_detector') or not self.object_detector:
+            if self.object_detector is None:
                 if not self._inicializar_sistema_deteccion_manual():
-                    QMessageBox.warning(self, "Error", "No se pudo inicializar el sistema de detección")
+                    self._mensaje_advertencia("Error", "No se pudo inicializar el sistema de detección")
                     return
 
-            # Obtener el procesador de objetos
-            from src.object_detector import BackgroundObjectProcessor
-            processor = BackgroundObjectProcessor(self.db_manager, self.object_detector)
-
             # Obtener número total de documentos pendientes
-            documentos_pendientes = self.db_manager.collection.count_documents({
-                "$or": [
-                    {"objetos": {"$exists": False}},
-                    {"objetos": {"$size": 0}},
-                    {"objeto_procesado": False}
-                ]
-            })
+            documentos_pendientes = self.db_manager.contar_pendientes_objetos()
 
             if documentos_pendientes == 0:
-                QMessageBox.information(self, "Sin Procesamiento", "No hay imágenes pendientes de procesar")
+                self._mensaje_info("Sin Procesamiento", "No hay imágenes pendientes de procesar")
                 return
 
-            # Procesar TODA la colección
-            self.deteccion_log.append(f"📊 Procesando {documentos_pendientes} imágenes pendientes...")
-            resultado = processor.procesar_imagenes_sin_objetos(batch_size=documentos_pendientes)
-
-            # Mostrar resultados
-            self.deteccion_log.append("=== RESULTADO DEL PROCESAMIENTO ===")
-            self.deteccion_log.append(f"✓ Procesadas: {resultado.get('procesadas', 0)}")
-            self.deteccion_log.append(f"⚠ Errores: {resultado.get('errores', 0)}")
-            self.deteccion_log.append(f"📁 Sin archivo: {resultado.get('sin_archivo', 0)}")
-
-            if resultado.get('procesadas', 0) > 0:
-                QMessageBox.information(
-                    self, "Procesamiento Completado",
-                    f"Procesamiento manual completado:\n"
-                    f"• {resultado.get('procesadas', 0)} imágenes procesadas\n"
-                    f"• {resultado.get('errores', 0)} errores\n"
-                    f"• {resultado.get('sin_archivo', 0)} archivos no encontrados"
-                )
-            else:
-                QMessageBox.information(self, "Sin Procesamiento", "No hay imágenes pendientes de procesar")
+            # Procesar TODA la colección en lotes sin bloquear la interfaz
+            self.deteccion_log.appendPlainText(f"📊 Procesando {documentos_pendientes} imágenes pendientes...")
+            self.procesar_manual_btn.setEnabled(False)
+            self.deteccion_procesando_label.setText("Sí")
+            self.cancelar_deteccion_event.clear()
 
-            # Actualizar estado
-            self._actualizar_estado_deteccion()
+            self.deteccion_thread = WorkerThread(
+                "deteccion_manual", self.db_manager, self.object_detector, documentos_pendientes,
+                cancel_callback=self.cancelar_deteccion_event.is_set
+            )
+            self.deteccion_thread.progreso_actualizado.connect(self._progreso_deteccion_manual)
+            self.deteccion_thread.procesamiento_completado.connect(self._deteccion_manual_completada)
+            self.deteccion_thread.error_ocurrido.connect(self._error_deteccion_manual)
+            self.deteccion_thread.finished.connect(self._deteccion_manual_finalizada)
+            self.deteccion_thread.start()
 
         except Exception as e:
-            self.deteccion_log.append(f"❌ Error en procesamiento manual: {str(e)}")
-            QMessageBox.warning(self, "Error", f"Error en procesamiento manual: {str(e)}")
+            self.deteccion_log.appendPlainText(f"❌ Error en procesamiento manual: {str(e)}")
+            self._mensaje_advertencia("Error", f"Error en procesamiento manual: {str(e)}")
+
+    def _progreso_deteccion_manual(self, valor: int, mensaje: str):
+        """Registrar el progreso de la detección manual de objetos."""
+        self.deteccion_log.appendPlainText(mensaje)
+
+    def _deteccion_manual_completada(self, resultado):
+        """Mostrar el resultado de la detección manual de objetos."""
+        self.deteccion_log.appendPlainText("=== RESULTADO DEL PROCESAMIENTO ===")
+        self.deteccion_log.appendPlainText(f"✓ Procesadas: {resultado.get('procesadas', 0)}")
+        self.deteccion_log.appendPlainText(f"⚠ Errores: {resultado.get('errores', 0)}")
+        self.deteccion_log.appendPlainText(f"📁 Sin archivo: {resultado.get('sin_archivo', 0)}")
+
+        if resultado.get('cancelado'):
+            self.deteccion_log.appendPlainText("⏹️ Procesamiento manual cancelado")
+        elif resultado.get('procesadas', 0) > 0:
+            self._mensaje_info(
+                "Procesamiento Completado",
+                f"Procesamiento manual completado:\n"
+                f"• {resultado.get('procesadas', 0)} imágenes procesadas\n"
+                f"• {resultado.get('errores', 0)} errores\n"
+                f"• {resultado.get('sin_archivo', 0)} archivos no encontrados"
+            )
+        else:
+            self._mensaje_info("Sin Procesamiento", "No hay imágenes pendientes de procesar")
+
+        # Actualizar estado
+        self._actualizar_estado_deteccion()
+
+    def _error_deteccion_manual(self, error: str):
+        """Manejar errores de la detección manual de objetos."""
+        self.deteccion_log.appendPlainText(f"❌ Error en procesamiento manual: {error}")
+        self._mensaje_advertencia("Error", f"Error en procesamiento manual: {error}")
+
+    def _deteccion_manual_finalizada(self):
+        """Restaurar los controles cuando termina el hilo de detección."""
+        self.procesar_manual_btn.setEnabled(True)
+        self.deteccion_procesando_label.setText("No")
 
     def _detener_procesamiento(self):
         """Detener el procesamiento en segundo plano."""
-        if not hasattr(self, 'system_initializer') or not self.system_initializer:
-            QMessageBox.warning(self, "Error", "Sistema de detección no inicializado")
+        if self.deteccion_thread is not None and self.deteccion_thread.isRunning():
+            self.cancelar_deteccion_event.set()
+            self.deteccion_log.appendPlainText("⏹️ Cancelando procesamiento manual tras el lote actual...")
+            return
+
+        if self.system_initializer is None:
+            self._mensaje_advertencia("Error", "Sistema de detección no inicializado")
             return
 
         try:
             self.system_initializer.stop_background_processing()
-            self.deteccion_log.append("⏹️ Procesamiento en segundo plano detenido")
+            self.deteccion_log.appendPlainText("⏹️ Procesamiento en segundo plano detenido")
             self._actualizar_estado_deteccion()
-            QMessageBox.information(self, "Procesamiento Detenido", "Procesamiento en segundo plano detenido correctamente")
+            self._mensaje_info("Procesamiento Detenido", "Procesamiento en segundo plano detenido correctamente")
         except Exception as e:
-            self.deteccion_log.append(f"❌ Error al detener procesamiento: {str(e)}")
-            QMessageBox.warning(self, "Error", f"Error al detener procesamiento: {str(e)}")
+            self.deteccion_log.appendPlainText(f"❌ Error al detener procesamiento: {str(e)}")
+            self._mensaje_advertencia("Error", f"Error al detener procesamiento: {str(e)}")
 
     def _crear_pestana_buscar_imagenes(self) -> QWidget:
         """Crear pestaña de búsqueda de imágenes no procesadas."""
@@ -3213,52 +3590,13 @@ class MainWindow(QMainWindow):
         # Campo de directorio
         self.directorio_input = QLineEdit()
         self.directorio_input.setPlaceholderText("Selecciona un directorio para buscar imágenes...")
-        self.directorio_input.setStyleSheet("""
-            QLineEdit {
-                background: #0F0F0F;
-                color: #FFFFFF;
-                font-size: 16px;
-                padding: 15px 18px;
-                border: 3px solid #5A6578;
-                border-radius: 15px;
-                selection-background-color: #5A6578;
-                selection-color: #FFFFFF;
-            }
-            QLineEdit:focus {
-                border: 3px solid #8190A6;
-                background: #0F0F0F;
-            }
-            QLineEdit:hover {
-                border: 3px solid #8190A6;
-            }
-        """)
+        self.directorio_input.setStyleSheet(self._ESTILO_DIRECTORIO_INPUT)
         layout_config.addRow("Directorio:", self.directorio_input)
 
         # Botón para seleccionar directorio
         self.seleccionar_directorio_btn = QPushButton("📁 Seleccionar Directorio")
         self.seleccionar_directorio_btn.clicked.connect(self._seleccionar_directorio)
-        self.seleccionar_directorio_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #FF9800, stop: 1 #F57C00);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #FF9800;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #FF9800, stop: 1 #E65100);
-                border: 3px solid #FFB74D;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #F57C00, stop: 1 #BF360C);
-                border: 3px solid #F57C00;
-            }
-        """)
+        self.seleccionar_directorio_btn.setStyleSheet(self._ESTILO_BOTON_NARANJA)
         layout_config.addRow(self.seleccionar_directorio_btn)
 
         # Opciones de búsqueda
@@ -3282,16 +3620,16 @@ class MainWindow(QMainWindow):
         grupo_stats = QGroupBox("Estadísticas de Búsqueda")
         layout_stats = QFormLayout(grupo_stats)
 
-        self.imagenes_encontradas_label = QLabel("0")
+        self.imagenes_encontradas_label = QLabel(_TEXTO_CERO)
         layout_stats.addRow("Imágenes encontradas:", self.imagenes_encontradas_label)
 
-        self.imagenes_procesadas_label = QLabel("0")
+        self.imagenes_procesadas_label = QLabel(_TEXTO_CERO)
         layout_stats.addRow("Imágenes procesadas:", self.imagenes_procesadas_label)
 
-        self.imagenes_omitidas_label = QLabel("0")
+        self.imagenes_omitidas_label = QLabel(_TEXTO_CERO)
         layout_stats.addRow("Imágenes omitidas:", self.imagenes_omitidas_label)
 
-        self.imagenes_errores_label = QLabel("0")
+        self.imagenes_errores_label = QLabel(_TEXTO_CERO)
         layout_stats.addRow("Errores:", self.imagenes_errores_label)
 
         layout.addWidget(grupo_stats)
@@ -3301,118 +3639,24 @@ class MainWindow(QMainWindow):
 
         self.buscar_imagenes_btn = QPushButton("🔍 Buscar Imágenes")
         self.buscar_imagenes_btn.clicked.connect(self._buscar_imagenes)
-        self.buscar_imagenes_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #4A5568;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border: 3px solid #718096;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
-                border: 3px solid #2D3748;
-            }
-        """)
+        self.buscar_imagenes_btn.setStyleSheet(self._ESTILO_BOTON_GRIS)
         botones_layout.addWidget(self.buscar_imagenes_btn)
 
         self.procesar_imagenes_btn = QPushButton("⚡ Procesar Imágenes")
         self.procesar_imagenes_btn.clicked.connect(self._procesar_imagenes_encontradas)
         self.procesar_imagenes_btn.setEnabled(False)
-        self.procesar_imagenes_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #4A5568;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border: 3px solid #718096;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
-                border: 3px solid #2D3748;
-            }
-            QPushButton:disabled {
-                background: #1A1A1A;
-                color: #FFFFFF;
-                border: 3px solid #4A5568;
-            }
-        """)
+        self.procesar_imagenes_btn.setStyleSheet(self._ESTILO_BOTON_GRIS_DESACTIVABLE)
         botones_layout.addWidget(self.procesar_imagenes_btn)
 
         self.limpiar_resultados_btn = QPushButton("🗑️ Limpiar Resultados")
         self.limpiar_resultados_btn.clicked.connect(self._limpiar_resultados_busqueda)
-        self.limpiar_resultados_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #718096;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #4A5568, stop: 1 #2D3748);
-                border: 3px solid #4A5568;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #2D3748, stop: 1 #1A202C);
-                border: 3px solid #2D3748;
-            }
-        """)
+        self.limpiar_resultados_btn.setStyleSheet(self._ESTILO_BOTON_LIMPIAR)
         botones_layout.addWidget(self.limpiar_resultados_btn)
 
         self.cancelar_busqueda_btn = QPushButton("⏹️ Cancelar Búsqueda")
         self.cancelar_busqueda_btn.clicked.connect(self._cancelar_busqueda_imagenes)
         self.cancelar_busqueda_btn.setEnabled(False)  # Inicialmente deshabilitado
-        self.cancelar_busqueda_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #E53E3E, stop: 1 #C53030);
-                color: #FFFFFF;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 12px 24px;
-                border-radius: 20px;
-                border: 3px solid #E53E3E;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #C53030, stop: 1 #9C1A1A);
-                border: 3px solid #C53030;
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #9C1A1A, stop: 1 #742A2A);
-                border: 3px solid #9C1A1A;
-            }
-            QPushButton:disabled {
-                background: #1A1A1A;
-                color: #FFFFFF;
-                border: 3px solid #4A5568;
-            }
-        """)
+        self.cancelar_busqueda_btn.setStyleSheet(self._ESTILO_BOTON_CANCELAR)
         botones_layout.addWidget(self.cancelar_busqueda_btn)
 
         layout.addLayout(botones_layout)
@@ -3423,22 +3667,7 @@ class MainWindow(QMainWindow):
 
         self.busqueda_progress_bar = QProgressBar()
         self.busqueda_progress_bar.setVisible(False)
-        self.busqueda_progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 2px solid #4A5568;
-                border-radius: 10px;
-                background: #1A1A1A;
-                color: #FFFFFF;
-                font-size: 12px;
-                font-weight: bold;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1,
-                              stop: 0 #718096, stop: 1 #4A5568);
-                border-radius: 8px;
-            }
-        """)
+        self.busqueda_progress_bar.setStyleSheet(self._ESTILO_BARRA_PROGRESO)
         layout_progreso.addWidget(self.busqueda_progress_bar)
 
         self.busqueda_progress_label = QLabel("Listo para buscar imágenes")
@@ -3451,29 +3680,21 @@ class MainWindow(QMainWindow):
         grupo_log = QGroupBox("Log de Búsqueda y Procesamiento")
         layout_log = QVBoxLayout(grupo_log)
 
-        self.busqueda_log = QTextEdit()
+        self.busqueda_log = QPlainTextEdit()
+        self.busqueda_log.setMaximumBlockCount(2000)
+        self.busqueda_log.setUndoRedoEnabled(False)
         self.busqueda_log.setMaximumHeight(200)
         self.busqueda_log.setPlaceholderText("Los mensajes de búsqueda y procesamiento aparecerán aquí...")
-        self.busqueda_log.setStyleSheet("""
-            QTextEdit {
-                background: #0F0F0F;
-                color: #FFFFFF;
-                font-size: 13px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                border: 3px solid #5A6578;
-                border-radius: 15px;
-                padding: 12px;
-                selection-background-color: #5A6578;
-                selection-color: #FFFFFF;
-            }
-            QTextEdit:focus {
-                border: 3px solid #8190A6;
-                background: #0F0F0F;
-            }
-            QTextEdit:hover {
-                border: 3px solid #8190A6;
-            }
-        """)
+        self.busqueda_log.setStyleSheet(self._ESTILO_LOG_BUSQUEDA)
+
+        # El progreso y sus líneas de log se aplican juntos como mucho cada 100 ms
+        self._progreso_busqueda_pendiente = None
+        self._busqueda_log_buffer = []
+        self._ultimo_progreso_registrado = None
+        self._busqueda_progreso_timer = QTimer(self)
+        self._busqueda_progreso_timer.setSingleShot(True)
+        self._busqueda_progreso_timer.setInterval(100)
+        self._busqueda_progreso_timer.timeout.connect(self._aplicar_progreso_busqueda)
         layout_log.addWidget(self.busqueda_log)
 
         layout.addWidget(grupo_log)
@@ -3492,7 +3713,7 @@ class MainWindow(QMainWindow):
 
         if directorio:
             self.directorio_input.setText(directorio)
-            self.busqueda_log.append(f"✓ Directorio seleccionado: {directorio}")
+            self.busqueda_log.appendPlainText(f"✓ Directorio seleccionado: {directorio}")
 
     def _buscar_imagenes(self):
         """Buscar imágenes en el directorio seleccionado."""
@@ -3500,51 +3721,55 @@ class MainWindow(QMainWindow):
             directorio = self.directorio_input.text().strip()
 
             if not directorio:
-                QMessageBox.warning(self, "Error", "Seleccione un directorio para buscar imágenes")
+                self._mensaje_advertencia("Error", "Seleccione un directorio para buscar imágenes")
                 return
 
             if not os.path.exists(directorio):
-                QMessageBox.warning(self, "Error", f"El directorio no existe: {directorio}")
+                self._mensaje_advertencia("Error", f"El directorio no existe: {directorio}")
                 return
 
             # Mostrar progreso
             self.busqueda_progress_bar.setVisible(True)
-            self.busqueda_progress_bar.setRange(0, 0)  # Indefinido
+            self.busqueda_progress_bar.setRange(0, 0)  # Indefinido hasta conocer el número de imágenes
             self.busqueda_progress_label.setText("Buscando imágenes...")
             self.busqueda_log.clear()
-            self.busqueda_log.append("🔍 Iniciando búsqueda de imágenes...")
+            self.busqueda_log.appendPlainText("🔍 Iniciando búsqueda de imágenes...")
 
             # Deshabilitar botones
             self.buscar_imagenes_btn.setEnabled(False)
             self.procesar_imagenes_btn.setEnabled(False)
             self.cancelar_busqueda_btn.setEnabled(True)
 
-            # Resetear flag de cancelación
-            self.cancelar_busqueda_flag = False
+            # Resetear señal de cancelación
+            self.cancelar_busqueda_event.clear()
 
             # Crear hilo de trabajo para la búsqueda
-            self.busqueda_thread = WorkerThread("buscar_imagenes", directorio, self.busqueda_recursiva_checkbox.isChecked(), self.solo_nuevas_checkbox.isChecked(), self.db_manager, cancel_callback=self._verificar_cancelacion_busqueda)
+            self.busqueda_thread = WorkerThread("buscar_imagenes", directorio, self.busqueda_recursiva_checkbox.isChecked(), self.solo_nuevas_checkbox.isChecked(), self.db_manager, cancel_callback=self.cancelar_busqueda_event.is_set)
+            self.busqueda_thread.total_conocido.connect(self._total_busqueda_conocido)
             self.busqueda_thread.progreso_actualizado.connect(self._actualizar_progreso_busqueda)
             self.busqueda_thread.procesamiento_completado.connect(self._busqueda_completada)
             self.busqueda_thread.error_ocurrido.connect(self._error_busqueda)
             self.busqueda_thread.start()
 
         except Exception as e:
-            self.busqueda_log.append(f"❌ Error al iniciar búsqueda: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Error al iniciar búsqueda: {str(e)}")
+            self.busqueda_log.appendPlainText(f"❌ Error al iniciar búsqueda: {str(e)}")
+            self._mensaje_critico("Error", f"Error al iniciar búsqueda: {str(e)}")
 
     def _procesar_imagenes_encontradas(self):
         """Procesar las imágenes encontradas."""
         try:
-            if not hasattr(self, 'imagenes_encontradas') or not self.imagenes_encontradas:
-                QMessageBox.warning(self, "Error", "No hay imágenes para procesar")
+            if not self.imagenes_encontradas:
+                self._mensaje_advertencia("Error", "No hay imágenes para procesar")
                 return
 
             # Mostrar progreso
             self.busqueda_progress_bar.setVisible(True)
-            self.busqueda_progress_bar.setRange(0, 0)  # Indefinido
+            # El número de imágenes ya se conoce: progreso determinado desde el inicio
+            self.busqueda_progress_bar.setRange(0, 100)
+            self.busqueda_progress_bar.setValue(0)
             self.busqueda_progress_label.setText("Procesando imágenes...")
-            self.busqueda_log.append("⚡ Iniciando procesamiento de imágenes...")
+            self._ultimo_progreso_registrado = None
+            self.busqueda_log.appendPlainText("⚡ Iniciando procesamiento de imágenes...")
 
             # Deshabilitar botones
             self.buscar_imagenes_btn.setEnabled(False)
@@ -3558,16 +3783,16 @@ class MainWindow(QMainWindow):
             self.procesamiento_thread.start()
 
         except Exception as e:
-            self.busqueda_log.append(f"❌ Error al iniciar procesamiento: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Error al iniciar procesamiento: {str(e)}")
+            self.busqueda_log.appendPlainText(f"❌ Error al iniciar procesamiento: {str(e)}")
+            self._mensaje_critico("Error", f"Error al iniciar procesamiento: {str(e)}")
 
     def _limpiar_resultados_busqueda(self):
         """Limpiar resultados de búsqueda."""
         self.directorio_input.clear()
-        self.imagenes_encontradas_label.setText("0")
-        self.imagenes_procesadas_label.setText("0")
-        self.imagenes_omitidas_label.setText("0")
-        self.imagenes_errores_label.setText("0")
+        self.imagenes_encontradas_label.setText(_TEXTO_CERO)
+        self.imagenes_procesadas_label.setText(_TEXTO_CERO)
+        self.imagenes_omitidas_label.setText(_TEXTO_CERO)
+        self.imagenes_errores_label.setText(_TEXTO_CERO)
         self.busqueda_log.clear()
 
         # Deshabilitar botones
@@ -3575,158 +3800,233 @@ class MainWindow(QMainWindow):
         self.cancelar_busqueda_btn.setEnabled(False)
 
         # Limpiar variables de instancia
-        if hasattr(self, 'imagenes_encontradas'):
-            delattr(self, 'imagenes_encontradas')
+        self.imagenes_encontradas = None
+
+    def _total_busqueda_conocido(self, total: int):
+        """Pasar la barra a progreso determinado en cuanto se conoce el número de imágenes."""
+        self.busqueda_progress_bar.setRange(0, 100)
+        # Pasar por la cola para que un progreso anterior pendiente no haga retroceder la barra
+        self._encolar_progreso_busqueda(30, f"Analizando {total} imágenes...", registrar=False)
 
     def _actualizar_progreso_busqueda(self, progreso: int, mensaje: str):
         """Actualizar progreso de la búsqueda."""
-        self.busqueda_progress_bar.setValue(progreso)
-        self.busqueda_progress_label.setText(mensaje)
-        self.busqueda_log.append(f"Progreso: {progreso}% - {mensaje}")
+        self._encolar_progreso_busqueda(progreso, mensaje)
 
         # Si la búsqueda está completada o cancelada, deshabilitar botón de cancelación
         if progreso >= 100 or "cancel" in mensaje.lower():
             self.cancelar_busqueda_btn.setEnabled(False)
 
+    def _restablecer_controles_busqueda(self, procesar_habilitado: bool, texto: Optional[str] = None):
+        """Rehabilitar los botones y ocultar el progreso al terminar una búsqueda o un procesamiento."""
+        with self._sin_repintado(self):
+            self.buscar_imagenes_btn.setEnabled(True)
+            self.cancelar_busqueda_btn.setEnabled(False)
+            self.procesar_imagenes_btn.setEnabled(procesar_habilitado)
+            self.busqueda_progress_bar.setVisible(False)
+            if texto is not None:
+                self.busqueda_progress_label.setText(texto)
+
     def _busqueda_completada(self, resultado: dict):
         """Manejador para cuando termina la búsqueda."""
-        # Rehabilitar botones
-        self.buscar_imagenes_btn.setEnabled(True)
-        self.cancelar_busqueda_btn.setEnabled(False)
-
-        # Ocultar progreso
-        self.busqueda_progress_bar.setVisible(False)
+        self._terminar_progreso_busqueda()
+        self._restablecer_controles_busqueda(procesar_habilitado=False)
 
         if resultado:
+            total = resultado.get('total_encontradas', 0)
+            procesadas = resultado.get('ya_procesadas', 0)
+            por_ruta = resultado.get('omitidas_por_ruta', 0)
+            por_hash = resultado.get('omitidas_por_hash', 0)
+            errores = resultado.get('errores', 0)
+
             # Verificar si fue cancelado
             if resultado.get('cancelado', False):
-                print("✅ CANCELACIÓN DETECTADA EN RESULTADO - Búsqueda de Imágenes")
+                logger.debug("Búsqueda de imágenes cancelada según el resultado")
                 self.busqueda_progress_label.setText("Búsqueda cancelada")
-                self.busqueda_log.append("\n=== BÚSQUEDA CANCELADA ===")
-                QMessageBox.information(
-                    self, "Búsqueda Cancelada",
+                self.busqueda_log.appendPlainText("\n=== BÚSQUEDA CANCELADA ===")
+                self._mensaje_info(
+                    "Búsqueda Cancelada",
                     f"Búsqueda cancelada por el usuario:\n"
-                    f"• {resultado.get('total_encontradas', 0)} imágenes encontradas hasta el momento\n"
-                    f"• {resultado.get('ya_procesadas', 0)} imágenes ya procesadas\n"
-                    f"• {resultado.get('errores', 0)} errores"
+                    f"• {total} imágenes encontradas hasta el momento\n"
+                    f"• {procesadas} imágenes ya procesadas\n"
+                    f"• {errores} errores",
+                    bloquear=False
                 )
             else:
                 self.busqueda_progress_label.setText("Búsqueda completada")
-                self.busqueda_log.append("\n=== BÚSQUEDA COMPLETADA ===")
+                lineas = ["\n=== BÚSQUEDA COMPLETADA ==="]
 
                 # Actualizar estadísticas
-                self.imagenes_encontradas_label.setText(str(resultado.get('total_encontradas', 0)))
-                self.imagenes_procesadas_label.setText(str(resultado.get('ya_procesadas', 0)))
-                self.imagenes_omitidas_label.setText(str(resultado.get('omitidas_por_ruta', 0) + resultado.get('omitidas_por_hash', 0)))
-                self.imagenes_errores_label.setText(str(resultado.get('errores', 0)))
+                self.imagenes_encontradas_label.setNum(total)
+                self.imagenes_procesadas_label.setNum(procesadas)
+                self.imagenes_omitidas_label.setNum(por_ruta + por_hash)
+                self.imagenes_errores_label.setNum(errores)
 
                 # Guardar lista de imágenes encontradas
-                self.imagenes_encontradas = resultado.get('imagenes', [])
+                self.imagenes_encontradas = tuple(resultado.get('imagenes', ()))
 
                 # Habilitar botón de procesamiento si hay imágenes nuevas
                 if self.imagenes_encontradas:
                     self.procesar_imagenes_btn.setEnabled(True)
-                    self.busqueda_log.append(f"✓ {len(self.imagenes_encontradas)} imágenes listas para procesar")
+                    lineas.append(f"✓ {len(self.imagenes_encontradas)} imágenes listas para procesar")
                 else:
-                    if resultado.get('ya_procesadas', 0) > 0:
-                        self.busqueda_log.append(f"ℹ️ Todas las {resultado.get('total_encontradas', 0)} imágenes encontradas ya están procesadas")
-                        self.busqueda_log.append(f"   • {resultado.get('omitidas_por_ruta', 0)} imágenes con la misma ruta")
-                        self.busqueda_log.append(f"   • {resultado.get('omitidas_por_hash', 0)} imágenes con el mismo hash")
+                    if procesadas > 0:
+                        lineas.append(f"ℹ️ Todas las {total} imágenes encontradas ya están procesadas")
+                        lineas.append(f"   • {por_ruta} imágenes con la misma ruta")
+                        lineas.append(f"   • {por_hash} imágenes con el mismo hash")
                     else:
-                        self.busqueda_log.append("ℹ️ No se encontraron imágenes para procesar")
+                        lineas.append("ℹ️ No se encontraron imágenes para procesar")
 
                 # Mostrar resumen detallado
-                self.busqueda_log.append(f"📊 Resumen detallado:")
-                self.busqueda_log.append(f"   • Total encontradas: {resultado.get('total_encontradas', 0)}")
-                self.busqueda_log.append(f"   • Ya procesadas: {resultado.get('ya_procesadas', 0)}")
-                self.busqueda_log.append(f"     └─ Por ruta exacta: {resultado.get('omitidas_por_ruta', 0)}")
-                self.busqueda_log.append(f"     └─ Por hash coincidente: {resultado.get('omitidas_por_hash', 0)}")
-                self.busqueda_log.append(f"   • Errores: {resultado.get('errores', 0)}")
-                self.busqueda_log.append(f"   • Imágenes nuevas para procesar: {len(self.imagenes_encontradas)}")
+                lineas.append(_RESUMEN_BUSQUEDA_TPL.format(
+                    total=total, procesadas=procesadas, por_ruta=por_ruta, por_hash=por_hash,
+                    errores=errores, nuevas=len(self.imagenes_encontradas)
+                ))
+
+                # Escribir todo el resumen en el log de una sola vez
+                self.busqueda_log.appendPlainText("\n".join(lineas))
 
         else:
             self.busqueda_progress_label.setText("Búsqueda completada")
-            self.busqueda_log.append("Búsqueda completada sin resultado detallado")
+            self.busqueda_log.appendPlainText("Búsqueda completada sin resultado detallado")
 
     def _actualizar_progreso_procesamiento_imagenes(self, progreso: int, mensaje: str):
         """Actualizar progreso del procesamiento de imágenes."""
-        self.busqueda_progress_bar.setValue(progreso)
-        self.busqueda_progress_label.setText(mensaje)
-        self.busqueda_log.append(f"Progreso: {progreso}% - {mensaje}")
+        # La barra refleja cada aviso; el log solo cada 10 puntos de avance
+        ultimo = self._ultimo_progreso_registrado
+        registrar = ultimo is None or progreso - ultimo >= 10
+        if registrar:
+            self._ultimo_progreso_registrado = progreso
+        self._encolar_progreso_busqueda(progreso, mensaje, registrar)
+
+    def _encolar_progreso_busqueda(self, progreso: int, mensaje: str, registrar: bool = True):
+        """Guardar el último progreso y su línea de log y programar su aplicación."""
+        self._progreso_busqueda_pendiente = (progreso, mensaje)
+        if registrar:
+            self._busqueda_log_buffer.append(f"Progreso: {progreso}% - {mensaje}")
+        if not self._busqueda_progreso_timer.isActive():
+            self._busqueda_progreso_timer.start()
+
+    def _aplicar_progreso_busqueda(self):
+        """Aplicar el último progreso y volcar de una vez las líneas de log pendientes."""
+        if self._progreso_busqueda_pendiente is not None:
+            progreso, mensaje = self._progreso_busqueda_pendiente
+            self._progreso_busqueda_pendiente = None
+            self.busqueda_progress_bar.setValue(progreso)
+            self.busqueda_progress_label.setText(mensaje)
+
+        if self._busqueda_log_buffer:
+            self.busqueda_log.appendPlainText("\n".join(self._busqueda_log_buffer))
+            self._busqueda_log_buffer.clear()
+
+    def _terminar_progreso_busqueda(self):
+        """Detener el refresco periódico aplicando lo que quede pendiente."""
+        self._busqueda_progreso_timer.stop()
+        self._aplicar_progreso_busqueda()
 
     def _procesamiento_imagenes_completado(self, resultado: dict):
         """Manejador para cuando termina el procesamiento de imágenes."""
-        # Rehabilitar botones
-        self.buscar_imagenes_btn.setEnabled(True)
-        self.procesar_imagenes_btn.setEnabled(True)
-
-        # Ocultar progreso
-        self.busqueda_progress_bar.setVisible(False)
+        self._terminar_progreso_busqueda()
+        self._restablecer_controles_busqueda(procesar_habilitado=True)
 
         if resultado:
+            procesadas = resultado.get('procesadas', 0)
+            errores = resultado.get('errores', 0)
+            duplicadas = resultado.get('duplicadas', 0)
+            insertadas = resultado.get('insertadas', 0)
+
             self.busqueda_progress_label.setText("Procesamiento completado")
-            self.busqueda_log.append("\n=== PROCESAMIENTO COMPLETADO ===")
 
             # Actualizar estadísticas
-            self.imagenes_procesadas_label.setText(str(resultado.get('procesadas', 0)))
-            self.imagenes_errores_label.setText(str(resultado.get('errores', 0)))
-
-            # Mostrar resultados
-            self.busqueda_log.append(f"✓ Procesadas: {resultado.get('procesadas', 0)}")
-            self.busqueda_log.append(f"⚠ Errores: {resultado.get('errores', 0)}")
-            self.busqueda_log.append(f"📝 Insertadas en BD: {resultado.get('insertadas', 0)}")
+            self.imagenes_procesadas_label.setNum(procesadas)
+            self.imagenes_errores_label.setNum(errores)
+
+            # Mostrar resultados en una sola escritura del log
+            self.busqueda_log.appendPlainText(
+                "\n=== PROCESAMIENTO COMPLETADO ===\n"
+                f"✓ Procesadas: {procesadas}\n"
+                f"⚠ Errores: {errores}\n"
+                f"↺ Duplicadas: {duplicadas}\n"
+                f"📝 Insertadas en BD: {insertadas}"
+            )
 
-            if resultado.get('procesadas', 0) > 0:
-                QMessageBox.information(
-                    self, "Procesamiento Completado",
+            if procesadas > 0:
+                self._mensaje_info(
+                    "Procesamiento Completado",
                     f"Procesamiento completado exitosamente:\n"
-                    f"• {resultado.get('procesadas', 0)} imágenes procesadas\n"
-                    f"• {resultado.get('errores', 0)} errores\n"
-                    f"• {resultado.get('insertadas', 0)} imágenes insertadas en la base de datos"
+                    f"• {procesadas} imágenes procesadas\n"
+                    f"• {errores} errores\n"
+                    f"• {duplicadas} duplicadas\n"
+                    f"• {insertadas} imágenes insertadas en la base de datos",
+                    bloquear=False
                 )
             else:
-                QMessageBox.information(self, "Sin Procesamiento", "No se procesaron imágenes nuevas")
+                self._mensaje_info("Sin Procesamiento", "No se procesaron imágenes nuevas", bloquear=False)
 
         else:
             self.busqueda_progress_label.setText("Procesamiento completado")
-            self.busqueda_log.append("Procesamiento completado sin resultado detallado")
+            self.busqueda_log.appendPlainText("Procesamiento completado sin resultado detallado")
 
     def _error_busqueda(self, error_msg: str):
         """Mostrar mensaje de error de búsqueda."""
-        QMessageBox.critical(self, "Error de Búsqueda", f"Error durante la búsqueda: {error_msg}")
+        self._terminar_progreso_busqueda()
+        self._mensaje_critico("Error de Búsqueda", f"Error durante la búsqueda: {error_msg}", bloquear=False)
 
-        # Rehabilitar botones y ocultar progreso
-        self.buscar_imagenes_btn.setEnabled(True)
-        self.procesar_imagenes_btn.setEnabled(False)
-        self.cancelar_busqueda_btn.setEnabled(False)
-        self.busqueda_progress_bar.setVisible(False)
-        self.busqueda_progress_label.setText("Error en búsqueda")
+        self._restablecer_controles_busqueda(procesar_habilitado=False, texto="Error en búsqueda")
 
-        self.busqueda_log.append(f"❌ Error durante la búsqueda: {error_msg}")
-        self.busqueda_log.append("=== BÚSQUEDA INTERRUMPIDA POR ERROR ===")
+        self.busqueda_log.appendPlainText(
+            f"❌ Error durante la búsqueda: {error_msg}\n"
+            "=== BÚSQUEDA INTERRUMPIDA POR ERROR ==="
+        )
 
     def _error_procesamiento_imagenes(self, error_msg: str):
         """Mostrar mensaje de error de procesamiento."""
-        QMessageBox.critical(self, "Error de Procesamiento", f"Error durante el procesamiento: {error_msg}")
+        self._terminar_progreso_busqueda()
+        self._mensaje_critico("Error de Procesamiento", f"Error durante el procesamiento: {error_msg}", bloquear=False)
 
-        # Rehabilitar botones y ocultar progreso
-        self.buscar_imagenes_btn.setEnabled(True)
-        self.procesar_imagenes_btn.setEnabled(True)
-        self.busqueda_progress_bar.setVisible(False)
-        self.busqueda_progress_label.setText("Error en procesamiento")
+        self._restablecer_controles_busqueda(procesar_habilitado=True, texto="Error en procesamiento")
 
-        self.busqueda_log.append(f"❌ Error durante el procesamiento: {error_msg}")
-        self.busqueda_log.append("=== PROCESAMIENTO INTERRUMPIDO POR ERROR ===")
+        self.busqueda_log.appendPlainText(
+            f"❌ Error durante el procesamiento: {error_msg}\n"
+            "=== PROCESAMIENTO INTERRUMPIDO POR ERROR ==="
+        )
 
     def closeEvent(self, event):
         """Manejador para cuando se cierra la ventana."""
         # Detener procesamiento en segundo plano
-        if hasattr(self, 'system_initializer') and self.system_initializer:
+        self.cancelar_deteccion_event.set()
+        if self.system_initializer is not None:
             self.system_initializer.stop_background_processing()
 
-        # Cerrar conexiones
-        if hasattr(self, 'db_manager') and self.db_manager:
-            self.db_manager.cerrar_conexion()
-        if hasattr(self, 'qdrant_manager') and self.qdrant_manager:
-            self.qdrant_manager.cerrar_conexion()
+        # Esperar a que la detección termine la imagen en curso antes de cerrar sus conexiones
+        if self.deteccion_thread is not None and self.deteccion_thread.isRunning():
+            if not self.deteccion_thread.wait(5000):
+                logger.warning("La detección de objetos no terminó a tiempo al salir")
+
+        # Cancelar el procesamiento por lotes: descartar los lotes en cola y esperar a los activos
+        self.cancelar_procesamiento_event.set()
+        pool = QThreadPool.globalInstance()
+        pool.clear()
+        if not pool.waitForDone(5000):
+            logger.warning("El procesamiento por lotes no terminó a tiempo al salir")
+
+        # Cerrar conexiones en paralelo con un único plazo de 5 s en total; los hilos
+        # son daemon para que un cierre bloqueado no impida que el proceso termine
+        def cerrar(cierre):
+            try:
+                cierre()
+            except Exception as e:
+                logger.warning("No se pudo cerrar una conexión al salir: %s", e)
+
+        hilos = [
+            threading.Thread(target=cerrar, args=(gestor.cerrar_conexion,), daemon=True)
+            for gestor in (self.db_manager, self.qdrant_manager)
+            if gestor is not None
+        ]
+        for hilo in hilos:
+            hilo.start()
+        limite = time.monotonic() + 5.0
+        for hilo in hilos:
+            hilo.join(max(0.0, limite - time.monotonic()))
+        if any(hilo.is_alive() for hilo in hilos):
+            logger.warning("Algunas conexiones no se cerraron en 5 s; se abandonan al salir")
         event.accept()
\ No newline at end of file